@@ -99,3 +99,15 @@ def temp_output_dir(tmp_path: Path) -> Path:
     output_dir = tmp_path / "output"
     output_dir.mkdir()
     return output_dir
+
+
+@pytest.fixture(scope="session")
+def existing_video(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    세션 전체에서 공유하는 빈 비디오 파일.
+
+    경로 존재 여부만 검사하는 테스트용이며, 내용을 쓰거나 지우면 안 됩니다.
+    """
+    video_file = tmp_path_factory.mktemp("videos") / "video.mp4"
+    video_file.touch()
+    return video_file
@@ -1,13 +1,20 @@
 """CLI 인터페이스 테스트."""
 
 import argparse
+import contextlib
+import copy
+import functools
+import io
 import os
 import signal
 import threading
 import time
-from dataclasses import replace
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,12 +24,19 @@ from tubearchive.app.cli.main import (
     ClipInfo,
     TranscodeOptions,
     _make_watermark_text,
+    _resolve_upload_thumbnail,
     _run_watch_mode,
+    _upload_after_pipeline,
+    _upload_split_files,
+    cmd_init_config,
+    cmd_upload_only,
     create_parser,
     database_session,
     main,
+    save_merge_job_to_db,
     validate_args,
 )
+from tubearchive.app.cli.upload import format_youtube_title, resolve_playlist_ids
 from tubearchive.config import (
     ENV_TEMPLATE_INTRO,
     ENV_TEMPLATE_OUTRO,
@@ -33,24 +47,345 @@ from tubearchive.config import (
     AppConfig,
     HooksConfig,
 )
-from tubearchive.domain.models.video import VideoFile, VideoMetadata
+from tubearchive.domain.models.video import FadeConfig, VideoFile, VideoMetadata
 from tubearchive.shared import truncate_path
 from tubearchive.shared.validators import ValidationError
 
+# pytest-xdist(--dist loadgroup) 실행 시 모듈 전체를 한 워커에 배정해
+# 모듈 스코프 parser/cached_stat_fn 픽스처를 워커당 한 번만 만든다.
+pytestmark = pytest.mark.xdist_group("cli_parser")
+
+# validate_args 테스트 공통 기본 인자. 테스트마다 Namespace를 새로 조립하는 대신
+# 프로토타입을 얕은 복사(__dict__ 복사)한 뒤 달라지는 필드만 덮어쓴다.
+_VALIDATE_DEFAULTS: dict[str, object] = {
+    "targets": [],
+    "output": None,
+    "no_resume": False,
+    "keep_temp": False,
+    "dry_run": False,
+    "output_dir": None,
+    "parallel": None,
+    "denoise": False,
+    "denoise_level": None,
+}
+_PROTO_NAMESPACE = argparse.Namespace(**_VALIDATE_DEFAULTS)
+
+# LUT 관련 validate_args 테스트가 공유하는 기본 인자.
+# 각 테스트는 달라지는 필드(targets, lut, auto_lut 등)만 덮어쓴다.
+_LUT_BASE_ARGS: dict[str, object] = {
+    "targets": [],
+    "output": None,
+    "no_resume": False,
+    "keep_temp": False,
+    "dry_run": False,
+    "output_dir": None,
+    "parallel": None,
+    "denoise": False,
+    "denoise_level": None,
+    "normalize_audio": False,
+    "group": False,
+    "no_group": False,
+    "fade_duration": None,
+    "upload": False,
+    "thumbnail": False,
+    "thumbnail_at": None,
+    "thumbnail_quality": 2,
+    "detect_silence": False,
+    "trim_silence": False,
+    "silence_threshold": "-30dB",
+    "silence_duration": 2.0,
+    "bgm": None,
+    "bgm_volume": None,
+    "bgm_loop": False,
+    "exclude": None,
+    "include_only": None,
+    "sort": None,
+    "reorder": False,
+    "split_duration": None,
+    "split_size": None,
+    "archive_originals": None,
+    "archive_force": False,
+    "timelapse": None,
+    "timelapse_audio": False,
+    "timelapse_resolution": None,
+    "lut": None,
+    "auto_lut": None,
+    "no_auto_lut": False,
+    "lut_before_hdr": False,
+}
+_LUT_PROTO_NAMESPACE = argparse.Namespace(**_LUT_BASE_ARGS)
+
+
+def _copy_namespace(proto: argparse.Namespace, **overrides: object) -> argparse.Namespace:
+    """프로토타입 Namespace를 복사하고 ``overrides``를 덮어쓴다."""
+    ns = copy.copy(proto)
+    ns.__dict__.update(overrides)
+    return ns
+
+
+def _ns(**overrides: object) -> argparse.Namespace:
+    """validate_args 테스트용 ``argparse.Namespace`` 생성."""
+    return _copy_namespace(_PROTO_NAMESPACE, **overrides)
+
+
+def _make_lut_args(**overrides: object) -> argparse.Namespace:
+    """LUT 테스트용 ``argparse.Namespace`` 생성."""
+    return _copy_namespace(_LUT_PROTO_NAMESPACE, **overrides)
+
+
+@dataclass(frozen=True, slots=True)
+class _StabilizeArgs:
+    """안정화 validate_args 테스트용 인자.
+
+    ``validate_args``는 인자를 읽기만 하므로 ``argparse.Namespace`` 대신
+    고정 필드를 가진 slots dataclass를 넘긴다.
+    """
+
+    targets: list[str]
+    output: str | None = None
+    no_resume: bool = False
+    keep_temp: bool = False
+    dry_run: bool = False
+    output_dir: str | None = None
+    parallel: int | None = None
+    stabilize: bool = False
+    stabilize_strength: str | None = None
+    stabilize_crop: str | None = None
+
+
+def _stabilize_args(
+    video_file: Path,
+    *,
+    stabilize: bool = False,
+    stabilize_strength: str | None = None,
+    stabilize_crop: str | None = None,
+) -> argparse.Namespace:
+    """안정화 옵션이 모두 꺼진 상태에서 지정한 옵션만 바꾼 validate_args 인자 생성."""
+    args = _StabilizeArgs(
+        targets=[str(video_file)],
+        stabilize=stabilize,
+        stabilize_strength=stabilize_strength,
+        stabilize_crop=stabilize_crop,
+    )
+    return cast("argparse.Namespace", args)
+
+
+@pytest.fixture(scope="module")
+def cached_stat_fn() -> Callable[[Path], bool]:
+    """``validate_args`` 에 주입할 메모이즈된 존재 확인 함수.
+
+    세션 공용 ``existing_video`` 처럼 테스트 중 바뀌지 않는 경로만 반복 확인한다.
+    """
+    return functools.lru_cache(maxsize=None)(Path.exists)
+
+
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    """모듈 단위로 한 번만 생성하는 CLI 파서.
+
+    ``parse_args``는 파서 상태를 바꾸지 않으므로 테스트 간에 공유해도 안전하다.
+    """
+    return create_parser()
+
+
+def _assert_parsed_value(actual: object, expected: object) -> None:
+    """파싱 결과 비교. None/bool은 동일성, 그 외는 동등성으로 비교한다."""
+    if expected is None or isinstance(expected, bool):
+        assert actual is expected
+    else:
+        assert actual == expected
+
 
 class TestCreateParser:
     """argparse 파서 테스트."""
 
-    def test_creates_parser(self) -> None:
+    @pytest.mark.parametrize(
+        ("argv", "attr", "expected"),
+        [
+            pytest.param(
+                ["video1.mp4", "video2.mov"],
+                "targets",
+                ["video1.mp4", "video2.mov"],
+                id="parses_file_arguments",
+            ),
+            pytest.param(
+                ["/path/to/videos/"],
+                "targets",
+                ["/path/to/videos/"],
+                id="parses_directory_argument",
+            ),
+            pytest.param(
+                ["--output", "merged.mp4"], "output", "merged.mp4", id="parses_output_option"
+            ),
+            pytest.param(
+                ["-o", "merged.mp4"], "output", "merged.mp4", id="parses_short_output_option"
+            ),
+            pytest.param(["--no-resume"], "no_resume", True, id="parses_no_resume_flag"),
+            pytest.param(
+                ["--watch", "/tmp/inbox", "--watch", "/tmp/archive"],
+                "watch",
+                ["/tmp/inbox", "/tmp/archive"],
+                id="parses_watch_paths",
+            ),
+            pytest.param(
+                ["--watch-log", "/tmp/watch.log"],
+                "watch_log",
+                "/tmp/watch.log",
+                id="parses_watch_log",
+            ),
+            pytest.param(["--keep-temp"], "keep_temp", True, id="parses_keep_temp_flag"),
+            pytest.param(["--dry-run"], "dry_run", True, id="parses_dry_run_flag"),
+            pytest.param(["--denoise"], "denoise", True, id="parses_denoise_flag"),
+            pytest.param(
+                ["--denoise-level", "heavy"], "denoise_level", "heavy", id="parses_denoise_level"
+            ),
+            pytest.param(
+                ["--fade-duration", "0.75"], "fade_duration", 0.75, id="parses_fade_duration"
+            ),
+            pytest.param(["--no-fade"], "no_fade", True, id="parses_no_fade_flag"),
+            pytest.param(["--thumbnail"], "thumbnail", True, id="parses_thumbnail_flag"),
+            pytest.param(
+                ["--thumbnail-at", "00:01:30"],
+                "thumbnail_at",
+                ["00:01:30"],
+                id="parses_thumbnail_at_single",
+            ),
+            pytest.param(
+                [
+                    "--thumbnail-at",
+                    "00:01:30",
+                    "--thumbnail-at",
+                    "00:05:00",
+                ],
+                "thumbnail_at",
+                ["00:01:30", "00:05:00"],
+                id="parses_thumbnail_at_multiple",
+            ),
+            pytest.param(
+                ["--thumbnail-quality", "5"], "thumbnail_quality", 5, id="parses_thumbnail_quality"
+            ),
+            pytest.param(
+                ["--set-thumbnail", "/path/to/cover.jpg"],
+                "set_thumbnail",
+                "/path/to/cover.jpg",
+                id="parses_set_thumbnail",
+            ),
+            pytest.param(["--subtitle"], "subtitle", True, id="parses_subtitle_flag"),
+            pytest.param(
+                ["--subtitle-model", "base"], "subtitle_model", "base", id="parses_subtitle_model"
+            ),
+            pytest.param(
+                ["--subtitle-format", "vtt"], "subtitle_format", "vtt", id="parses_subtitle_format"
+            ),
+            pytest.param(
+                ["--quality-report"], "quality_report", True, id="parses_quality_report_flag"
+            ),
+            pytest.param(
+                ["--config", "/tmp/custom.toml"],
+                "config",
+                "/tmp/custom.toml",
+                id="parses_config_option",
+            ),
+            pytest.param(["--init-config"], "init_config", True, id="parses_init_config_flag"),
+            pytest.param(
+                ["--run-hook", "on_merge"], "run_hook", "on_merge", id="parses_run_hook_option"
+            ),
+            pytest.param(
+                ["--template-intro", "/path/to/intro.mp4"],
+                "template_intro",
+                "/path/to/intro.mp4",
+                id="parses_template_intro",
+            ),
+            pytest.param(
+                ["--template-outro", "/path/to/outro.mp4"],
+                "template_outro",
+                "/path/to/outro.mp4",
+                id="parses_template_outro",
+            ),
+            pytest.param(["--exclude", "GH*"], "exclude", ["GH*"], id="parses_exclude_single"),
+            pytest.param(
+                ["--exclude", "GH*", "--exclude", "*.mts"],
+                "exclude",
+                ["GH*", "*.mts"],
+                id="parses_exclude_multiple",
+            ),
+            pytest.param(
+                ["--include-only", "*.mp4"],
+                "include_only",
+                ["*.mp4"],
+                id="parses_include_only_single",
+            ),
+            pytest.param(
+                ["--include-only", "*.mp4", "--include-only", "*.mov"],
+                "include_only",
+                ["*.mp4", "*.mov"],
+                id="parses_include_only_multiple",
+            ),
+            pytest.param(["--sort", "name"], "sort", "name", id="parses_sort_option"),
+            pytest.param(["--reorder"], "reorder", True, id="parses_reorder_flag"),
+            pytest.param(["--catalog"], "catalog", True, id="parses_catalog_flag"),
+            pytest.param(["--search", "2026-01"], "search", "2026-01", id="parses_search_pattern"),
+            pytest.param(["--search"], "search", "", id="parses_search_empty"),
+            pytest.param(["--device", "GoPro"], "device", "GoPro", id="parses_device_filter"),
+            pytest.param(
+                ["--status", "completed"], "status", "completed", id="parses_status_filter"
+            ),
+            pytest.param(["--status"], "status", CATALOG_STATUS_SENTINEL, id="parses_status_view"),
+            pytest.param(["--json"], "json", True, id="parses_json_flag"),
+            pytest.param(["--csv"], "csv", True, id="parses_csv_flag"),
+            pytest.param(
+                ["--lut", "/path/to/lut.cube"], "lut", "/path/to/lut.cube", id="parses_lut_option"
+            ),
+            pytest.param(["--auto-lut"], "auto_lut", True, id="parses_auto_lut_flag"),
+            pytest.param(["--no-auto-lut"], "no_auto_lut", True, id="parses_no_auto_lut_flag"),
+            pytest.param(
+                ["--lut-before-hdr"], "lut_before_hdr", True, id="parses_lut_before_hdr_flag"
+            ),
+            pytest.param(["--watermark"], "watermark", True, id="parses_watermark_flag"),
+        ],
+    )
+    def test_parses_option(
+        self, parser: argparse.ArgumentParser, argv: list[str], attr: str, expected: object
+    ) -> None:
+        """단일 옵션 파싱 결과 확인."""
+        _assert_parsed_value(getattr(parser.parse_args(argv), attr), expected)
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            pytest.param("no_fade", False, id="no_fade_default_false"),
+            pytest.param("thumbnail", False, id="thumbnail_flag_default_false"),
+            pytest.param("thumbnail_at", None, id="thumbnail_at_default_none"),
+            pytest.param("thumbnail_quality", 2, id="thumbnail_quality_default"),
+            pytest.param("set_thumbnail", None, id="set_thumbnail_default_is_none"),
+            pytest.param("quality_report", False, id="quality_report_default_is_false"),
+            pytest.param("config", None, id="config_default_is_none"),
+            pytest.param("init_config", False, id="init_config_default_is_false"),
+            pytest.param("upload_privacy", None, id="upload_privacy_default_is_none"),
+            pytest.param("template_intro", None, id="template_intro_default_is_none"),
+            pytest.param("template_outro", None, id="template_outro_default_is_none"),
+            pytest.param("exclude", None, id="exclude_default_is_none"),
+            pytest.param("include_only", None, id="include_only_default_is_none"),
+            pytest.param("sort", None, id="sort_default_is_none"),
+            pytest.param("reorder", False, id="reorder_default_is_false"),
+            pytest.param("lut", None, id="lut_default_is_none"),
+            pytest.param("lut_before_hdr", False, id="lut_before_hdr_default_false"),
+        ],
+    )
+    def test_option_default(
+        self, parser: argparse.ArgumentParser, attr: str, expected: object
+    ) -> None:
+        """옵션 미지정 시 기본값 확인."""
+        _assert_parsed_value(getattr(parser.parse_args([]), attr), expected)
+
+    def test_creates_parser(self, parser: argparse.ArgumentParser) -> None:
         """파서 생성."""
-        parser = create_parser()
 
         assert isinstance(parser, argparse.ArgumentParser)
         assert parser.prog == "tubearchive"
 
-    def test_parses_no_arguments(self) -> None:
+    def test_parses_no_arguments(self, parser: argparse.ArgumentParser) -> None:
         """인자 없이 파싱 (Case 1: cwd)."""
-        parser = create_parser()
         args = parser.parse_args([])
 
         assert args.targets == []
@@ -59,86 +394,8 @@ class TestCreateParser:
         assert args.keep_temp is False
         assert args.dry_run is False
 
-    def test_parses_file_arguments(self) -> None:
-        """파일 인자 파싱 (Case 2: 특정 파일)."""
-        parser = create_parser()
-        args = parser.parse_args(["video1.mp4", "video2.mov"])
-
-        assert args.targets == ["video1.mp4", "video2.mov"]
-
-    def test_parses_directory_argument(self) -> None:
-        """디렉토리 인자 파싱 (Case 3: 디렉토리)."""
-        parser = create_parser()
-        args = parser.parse_args(["/path/to/videos/"])
-
-        assert args.targets == ["/path/to/videos/"]
-
-    def test_parses_output_option(self) -> None:
-        """--output 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--output", "merged.mp4"])
-
-        assert args.output == "merged.mp4"
-
-    def test_parses_short_output_option(self) -> None:
-        """-o 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["-o", "merged.mp4"])
-
-        assert args.output == "merged.mp4"
-
-    def test_parses_no_resume_flag(self) -> None:
-        """--no-resume 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--no-resume"])
-
-        assert args.no_resume is True
-
-    def test_parses_watch_paths(self) -> None:
-        """--watch는 반복 지정 가능."""
-        parser = create_parser()
-        args = parser.parse_args(["--watch", "/tmp/inbox", "--watch", "/tmp/archive"])
-
-        assert args.watch == ["/tmp/inbox", "/tmp/archive"]
-
-    def test_parses_watch_log(self) -> None:
-        """--watch-log 경로."""
-        parser = create_parser()
-        args = parser.parse_args(["--watch-log", "/tmp/watch.log"])
-
-        assert args.watch_log == "/tmp/watch.log"
-
-    def test_parses_keep_temp_flag(self) -> None:
-        """--keep-temp 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--keep-temp"])
-
-        assert args.keep_temp is True
-
-    def test_parses_dry_run_flag(self) -> None:
-        """--dry-run 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--dry-run"])
-
-        assert args.dry_run is True
-
-    def test_parses_denoise_flag(self) -> None:
-        """--denoise 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--denoise"])
-
-        assert args.denoise is True
-
-    def test_parses_denoise_level(self) -> None:
-        """--denoise-level 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--denoise-level", "heavy"])
-
-        assert args.denoise_level == "heavy"
-
-    def test_parses_external_audio_options(self) -> None:
+    def test_parses_external_audio_options(self, parser: argparse.ArgumentParser) -> None:
         """외부 마이크 오디오 및 clap sync 옵션."""
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--external-audio",
@@ -173,9 +430,8 @@ class TestCreateParser:
         assert args.external_audio_mode == "mix"
         assert args.camera_audio_volume == 0.12
 
-    def test_parses_group_flags(self) -> None:
+    def test_parses_group_flags(self, parser: argparse.ArgumentParser) -> None:
         """--group/--no-group 플래그."""
-        parser = create_parser()
 
         args = parser.parse_args(["--group"])
         assert args.group is True
@@ -185,429 +441,50 @@ class TestCreateParser:
         assert args.no_group is True
         assert args.group is False
 
-    def test_parses_fade_duration(self) -> None:
-        """--fade-duration 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--fade-duration", "0.75"])
-
-        assert args.fade_duration == 0.75
-
-    def test_parses_no_fade_flag(self) -> None:
-        """--no-fade 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--no-fade"])
-
-        assert args.no_fade is True
-
-    def test_no_fade_default_false(self) -> None:
-        """--no-fade 기본값은 False."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.no_fade is False
-
-    def test_parses_thumbnail_flag(self) -> None:
-        """--thumbnail 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--thumbnail"])
-
-        assert args.thumbnail is True
-
-    def test_thumbnail_flag_default_false(self) -> None:
-        """--thumbnail 기본값은 False."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.thumbnail is False
-
-    def test_parses_thumbnail_at_single(self) -> None:
-        """--thumbnail-at 단일 값."""
-        parser = create_parser()
-        args = parser.parse_args(["--thumbnail-at", "00:01:30"])
-
-        assert args.thumbnail_at == ["00:01:30"]
-
-    def test_parses_thumbnail_at_multiple(self) -> None:
-        """--thumbnail-at 반복 지정."""
-        parser = create_parser()
-        args = parser.parse_args(
-            [
-                "--thumbnail-at",
-                "00:01:30",
-                "--thumbnail-at",
-                "00:05:00",
-            ]
-        )
-
-        assert args.thumbnail_at == ["00:01:30", "00:05:00"]
-
-    def test_thumbnail_at_default_none(self) -> None:
-        """--thumbnail-at 기본값은 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.thumbnail_at is None
-
-    def test_parses_thumbnail_quality(self) -> None:
-        """--thumbnail-quality 값."""
-        parser = create_parser()
-        args = parser.parse_args(["--thumbnail-quality", "5"])
-
-        assert args.thumbnail_quality == 5
-
-    def test_thumbnail_quality_default(self) -> None:
-        """--thumbnail-quality 기본값 2."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.thumbnail_quality == 2
-
-    def test_parses_set_thumbnail(self) -> None:
-        """--set-thumbnail 경로 파싱."""
-        parser = create_parser()
-        args = parser.parse_args(["--set-thumbnail", "/path/to/cover.jpg"])
-
-        assert args.set_thumbnail == "/path/to/cover.jpg"
-
-    def test_set_thumbnail_default_is_none(self) -> None:
-        """--set-thumbnail 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.set_thumbnail is None
-
-    def test_parses_subtitle_flag(self) -> None:
-        """--subtitle 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--subtitle"])
-
-        assert args.subtitle is True
-
-    def test_parses_subtitle_model(self) -> None:
-        """--subtitle-model 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--subtitle-model", "base"])
-
-        assert args.subtitle_model == "base"
-
-    def test_parses_subtitle_format(self) -> None:
-        """--subtitle-format 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--subtitle-format", "vtt"])
-
-        assert args.subtitle_format == "vtt"
-
-    def test_parses_subtitle_lang_and_burn(self) -> None:
+    def test_parses_subtitle_lang_and_burn(self, parser: argparse.ArgumentParser) -> None:
         """자막 언어/하드코딩 옵션 파싱."""
-        parser = create_parser()
         args = parser.parse_args(["--subtitle-lang", "EN", "--subtitle-burn"])
 
         assert args.subtitle_lang == "EN"
         assert args.subtitle_burn is True
 
-    def test_parses_quality_report_flag(self) -> None:
-        """--quality-report 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--quality-report"])
-
-        assert args.quality_report is True
-
-    def test_quality_report_default_is_false(self) -> None:
-        """--quality-report 미지정 시 False."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.quality_report is False
-
-    def test_parses_config_option(self) -> None:
-        """--config 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--config", "/tmp/custom.toml"])
-
-        assert args.config == "/tmp/custom.toml"
-
-    def test_config_default_is_none(self) -> None:
-        """--config 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.config is None
-
-    def test_parses_template_intro_legacy(self) -> None:
-        """--template-intro 파싱."""
-        parser = create_parser()
-        args = parser.parse_args(["--template-intro", "/tmp/intro.mov"])
-
-        assert args.template_intro == "/tmp/intro.mov"
-
-    def test_template_intro_default_is_none_legacy(self) -> None:
-        """--template-intro 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.template_intro is None
-
-    def test_parses_template_outro_legacy(self) -> None:
-        """--template-outro 파싱."""
-        parser = create_parser()
-        args = parser.parse_args(["--template-outro", "/tmp/outro.mov"])
-
-        assert args.template_outro == "/tmp/outro.mov"
-
-    def test_template_outro_default_is_none_legacy(self) -> None:
-        """--template-outro 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.template_outro is None
-
-    def test_parses_init_config_flag(self) -> None:
-        """--init-config 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--init-config"])
-
-        assert args.init_config is True
-
-    def test_init_config_default_is_false(self) -> None:
-        """--init-config 미지정 시 False."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.init_config is False
-
-    def test_upload_privacy_default_is_none(self) -> None:
-        """upload_privacy 기본값은 None (config 통합 위해)."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.upload_privacy is None
-
-    def test_parses_run_hook_option(self) -> None:
-        """--run-hook 옵션이 이벤트명으로 파싱된다."""
-        parser = create_parser()
-        args = parser.parse_args(["--run-hook", "on_merge"])
-
-        assert args.run_hook == "on_merge"
-
-    def test_run_hook_invalid_value_raises(self) -> None:
+    def test_run_hook_invalid_value_raises(self, parser: argparse.ArgumentParser) -> None:
         """알 수 없는 --run-hook 값은 argparse에서 거부한다."""
-        parser = create_parser()
 
         with pytest.raises(SystemExit):
             parser.parse_args(["--run-hook", "invalid"])
 
-    def test_parses_template_intro(self) -> None:
-        """--template-intro 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--template-intro", "/path/to/intro.mp4"])
+    def test_help_formatter_restored_after_creation(self, parser: argparse.ArgumentParser) -> None:
+        """옵션 등록용 포매터 재사용이 끝나면 --help는 원래 포매터 생성을 쓴다."""
+        assert "_get_formatter" not in vars(parser)
+        assert parser.format_help() == parser.format_help()
+        assert "--exclude" in parser.format_help()
 
-        assert args.template_intro == "/path/to/intro.mp4"
-
-    def test_template_intro_default_is_none(self) -> None:
-        """--template-intro 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.template_intro is None
-
-    def test_parses_template_outro(self) -> None:
-        """--template-outro 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--template-outro", "/path/to/outro.mp4"])
-
-        assert args.template_outro == "/path/to/outro.mp4"
-
-    def test_template_outro_default_is_none(self) -> None:
-        """--template-outro 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.template_outro is None
-
-    def test_parses_exclude_single(self) -> None:
-        """--exclude 단일 패턴."""
-        parser = create_parser()
-        args = parser.parse_args(["--exclude", "GH*"])
-
-        assert args.exclude == ["GH*"]
-
-    def test_parses_exclude_multiple(self) -> None:
-        """--exclude 반복 지정."""
-        parser = create_parser()
-        args = parser.parse_args(["--exclude", "GH*", "--exclude", "*.mts"])
-
-        assert args.exclude == ["GH*", "*.mts"]
-
-    def test_exclude_default_is_none(self) -> None:
-        """--exclude 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.exclude is None
-
-    def test_parses_include_only_single(self) -> None:
-        """--include-only 단일 패턴."""
-        parser = create_parser()
-        args = parser.parse_args(["--include-only", "*.mp4"])
-
-        assert args.include_only == ["*.mp4"]
-
-    def test_parses_include_only_multiple(self) -> None:
-        """--include-only 반복 지정."""
-        parser = create_parser()
-        args = parser.parse_args(["--include-only", "*.mp4", "--include-only", "*.mov"])
-
-        assert args.include_only == ["*.mp4", "*.mov"]
-
-    def test_include_only_default_is_none(self) -> None:
-        """--include-only 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
+    def test_parses_exclude_many_repeats_in_order(self, parser: argparse.ArgumentParser) -> None:
+        """--exclude 다수 반복 시 순서대로 누적."""
+        patterns = [f"clip_{i}*" for i in range(500)]
+        argv = [token for pattern in patterns for token in ("--exclude", pattern)]
+        args = parser.parse_args(argv)
 
-        assert args.include_only is None
+        assert args.exclude == patterns
 
-    def test_parses_sort_option(self) -> None:
-        """--sort 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--sort", "name"])
-
-        assert args.sort == "name"
-
-    def test_sort_default_is_none(self) -> None:
-        """--sort 미지정 시 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
+    def test_append_results_are_independent_between_parses(
+        self, parser: argparse.ArgumentParser
+    ) -> None:
+        """반복 파싱 간 append 리스트가 공유되지 않음."""
+        first = parser.parse_args(["--exclude", "GH*"])
+        second = parser.parse_args(["--exclude", "*.mts"])
 
-        assert args.sort is None
+        assert first.exclude == ["GH*"]
+        assert second.exclude == ["*.mts"]
 
-    def test_sort_invalid_choice_raises(self) -> None:
+    def test_sort_invalid_choice_raises(self, parser: argparse.ArgumentParser) -> None:
         """--sort에 잘못된 값 지정 시 에러."""
-        parser = create_parser()
         with pytest.raises(SystemExit):
             parser.parse_args(["--sort", "invalid"])
 
-    def test_parses_reorder_flag(self) -> None:
-        """--reorder 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--reorder"])
-
-        assert args.reorder is True
-
-    def test_reorder_default_is_false(self) -> None:
-        """--reorder 미지정 시 False."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.reorder is False
-
-    def test_parses_catalog_flag(self) -> None:
-        """--catalog 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--catalog"])
-
-        assert args.catalog is True
-
-    def test_parses_search_pattern(self) -> None:
-        """--search 패턴 값."""
-        parser = create_parser()
-        args = parser.parse_args(["--search", "2026-01"])
-
-        assert args.search == "2026-01"
-
-    def test_parses_search_empty(self) -> None:
-        """--search 값 없이 사용."""
-        parser = create_parser()
-        args = parser.parse_args(["--search"])
-
-        assert args.search == ""
-
-    def test_parses_device_filter(self) -> None:
-        """--device 필터."""
-        parser = create_parser()
-        args = parser.parse_args(["--device", "GoPro"])
-
-        assert args.device == "GoPro"
-
-    def test_parses_status_filter(self) -> None:
-        """--status 값 지정."""
-        parser = create_parser()
-        args = parser.parse_args(["--status", "completed"])
-
-        assert args.status == "completed"
-
-    def test_parses_status_view(self) -> None:
-        """--status 단독 사용."""
-        parser = create_parser()
-        args = parser.parse_args(["--status"])
-
-        assert args.status == CATALOG_STATUS_SENTINEL
-
-    def test_parses_json_flag(self) -> None:
-        """--json 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--json"])
-
-        assert args.json is True
-
-    def test_parses_csv_flag(self) -> None:
-        """--csv 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--csv"])
-
-        assert args.csv is True
-
-    def test_parses_lut_option(self) -> None:
-        """--lut 옵션."""
-        parser = create_parser()
-        args = parser.parse_args(["--lut", "/path/to/lut.cube"])
-
-        assert args.lut == "/path/to/lut.cube"
-
-    def test_lut_default_is_none(self) -> None:
-        """--lut 기본값 None."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.lut is None
-
-    def test_parses_auto_lut_flag(self) -> None:
-        """--auto-lut 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--auto-lut"])
-
-        assert args.auto_lut is True
-
-    def test_parses_no_auto_lut_flag(self) -> None:
-        """--no-auto-lut 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--no-auto-lut"])
-
-        assert args.no_auto_lut is True
-
-    def test_parses_lut_before_hdr_flag(self) -> None:
-        """--lut-before-hdr 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--lut-before-hdr"])
-
-        assert args.lut_before_hdr is True
-
-    def test_lut_before_hdr_default_false(self) -> None:
-        """--lut-before-hdr 기본값 False."""
-        parser = create_parser()
-        args = parser.parse_args([])
-
-        assert args.lut_before_hdr is False
-
-    def test_parses_watermark_flag(self) -> None:
-        """--watermark 플래그."""
-        parser = create_parser()
-        args = parser.parse_args(["--watermark"])
-
-        assert args.watermark is True
-
-    def test_parses_watermark_options(self) -> None:
+    def test_parses_watermark_options(self, parser: argparse.ArgumentParser) -> None:
         """워터마크 옵션 값."""
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--watermark",
@@ -628,9 +505,8 @@ class TestCreateParser:
         assert args.watermark_color == "yellow"
         assert args.watermark_alpha == 0.6
 
-    def test_watermark_defaults(self) -> None:
+    def test_watermark_defaults(self, parser: argparse.ArgumentParser) -> None:
         """--watermark 기본값."""
-        parser = create_parser()
         args = parser.parse_args([])
 
         assert args.watermark is False
@@ -643,53 +519,38 @@ class TestCreateParser:
 class TestValidateArgs:
     """인자 검증 테스트."""
 
-    def test_validates_existing_files(self, tmp_path: Path) -> None:
+    def test_validates_existing_files(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """존재하는 파일 검증."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _ns(targets=[str(existing_video)])
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
-        result = validate_args(args)
+        assert result.targets == [existing_video]
 
-        assert result.targets == [video_file]
-
-    def test_defaults_for_group_and_fade(self, tmp_path: Path) -> None:
+    def test_defaults_for_group_and_fade(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """group/fade 기본값 확인."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[str(existing_video)])
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.group_sequences is True
         assert result.fade_duration == 0.5
 
-    def test_validates_external_audio_options(self, tmp_path: Path) -> None:
+    def test_validates_external_audio_options(
+        self,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """외부 오디오 파일과 clap sync 옵션 검증."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         external_audio = tmp_path / "mic.wav"
         external_audio.touch()
 
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--external-audio",
@@ -703,11 +564,11 @@ class TestValidateArgs:
                 "mix",
                 "--camera-audio-volume",
                 "0.12",
-                str(video_file),
+                str(existing_video),
             ]
         )
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.external_audio_path == external_audio
         assert result.sync_audio_clap is True
@@ -716,14 +577,17 @@ class TestValidateArgs:
         assert result.external_audio_mode == "mix"
         assert result.camera_audio_volume == 0.12
 
-    def test_validates_external_audio_dir_options(self, tmp_path: Path) -> None:
+    def test_validates_external_audio_dir_options(
+        self,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """외부 오디오 디렉토리 자동 선택 옵션 검증."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         audio_dir = tmp_path / "audio"
         audio_dir.mkdir()
 
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--external-audio-dir",
@@ -732,79 +596,89 @@ class TestValidateArgs:
                 "--external-audio-drift-correction",
                 "--external-audio-match-window",
                 "600",
-                str(video_file),
+                str(existing_video),
             ]
         )
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.external_audio_dir == audio_dir
         assert result.sync_audio_clap is True
         assert result.external_audio_drift_correction is True
         assert result.external_audio_match_window == 600
 
-    def test_validates_external_audio_long_scope(self, tmp_path: Path) -> None:
+    def test_validates_external_audio_long_scope(
+        self,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """긴 외부 오디오 scope는 단일 파일 외부 녹음을 요구한다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         external_audio = tmp_path / "recorder.wav"
         external_audio.touch()
 
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--external-audio",
                 str(external_audio),
                 "--external-audio-scope",
                 "long",
-                str(video_file),
+                str(existing_video),
             ]
         )
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.external_audio_path == external_audio
         assert result.external_audio_scope == "long"
 
-    def test_sync_audio_clap_requires_external_audio(self, tmp_path: Path) -> None:
+    def test_sync_audio_clap_requires_external_audio(
+        self,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """clap sync는 외부 오디오 파일 없이 사용할 수 없다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        parser = create_parser()
-        args = parser.parse_args(["--sync-audio-clap", str(video_file)])
+        args = parser.parse_args(["--sync-audio-clap", str(existing_video)])
 
         with pytest.raises(ValueError, match="--external-audio"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
-    def test_external_audio_drift_correction_requires_clap_sync(self, tmp_path: Path) -> None:
+    def test_external_audio_drift_correction_requires_clap_sync(
+        self,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """drift 보정은 두 clap 기준점을 쓰므로 clap sync 활성화가 필요하다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         external_audio = tmp_path / "mic.wav"
         external_audio.touch()
 
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--external-audio",
                 str(external_audio),
                 "--external-audio-drift-correction",
-                str(video_file),
+                str(existing_video),
             ]
         )
 
         with pytest.raises(ValueError, match="--sync-audio-clap"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
-    def test_camera_audio_volume_requires_valid_range(self, tmp_path: Path) -> None:
+    def test_camera_audio_volume_requires_valid_range(
+        self,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """카메라 오디오 믹스 볼륨은 0.0~1.0 범위여야 한다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         external_audio = tmp_path / "mic.wav"
         external_audio.touch()
 
-        parser = create_parser()
         args = parser.parse_args(
             [
                 "--external-audio",
@@ -813,262 +687,162 @@ class TestValidateArgs:
                 "mix",
                 "--camera-audio-volume",
                 "1.2",
-                str(video_file),
+                str(existing_video),
             ]
         )
 
         with pytest.raises(ValueError, match="--camera-audio-volume"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
-    def test_no_fade_sets_duration_to_zero(self, tmp_path: Path) -> None:
+    def test_no_fade_sets_duration_to_zero(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """--no-fade 지정 시 fade_duration이 0.0으로 설정."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _ns(targets=[str(existing_video)], no_fade=True, fade_duration=None)
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            no_fade=True,
-            fade_duration=None,
-        )
-
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.fade_duration == 0.0
 
-    def test_no_fade_overrides_fade_duration(self, tmp_path: Path) -> None:
+    def test_no_fade_overrides_fade_duration(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """--no-fade는 --fade-duration보다 우선."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            no_fade=True,
-            fade_duration=1.0,
-        )
+        args = _ns(targets=[str(existing_video)], no_fade=True, fade_duration=1.0)
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.fade_duration == 0.0
 
     def test_validates_existing_directory(self, tmp_path: Path) -> None:
         """존재하는 디렉토리 검증."""
-        args = argparse.Namespace(
-            targets=[str(tmp_path)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[str(tmp_path)])
 
         result = validate_args(args)
 
         assert result.targets == [tmp_path]
 
-    def test_validates_with_custom_hooks(self, tmp_path: Path) -> None:
+    def test_validates_with_custom_hooks(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """validate_args에서 HooksConfig가 전달되면 유지된다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
         hooks = HooksConfig(on_merge=("echo merged",), on_error=("echo err",), timeout_sec=90)
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[str(existing_video)])
 
-        result = validate_args(args, hooks=hooks)
+        result = validate_args(args, hooks=hooks, stat_fn=cached_stat_fn)
 
         assert result.hooks == hooks
 
-    def test_validates_set_thumbnail_jpeg(self, tmp_path: Path) -> None:
+    def test_validates_set_thumbnail_jpeg(
+        self, tmp_path: Path, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """유효한 썸네일 파일 경로."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         thumbnail = tmp_path / "cover.jpg"
         thumbnail.write_bytes(b"\xff\xd8")
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            set_thumbnail=str(thumbnail),
-        )
+        args = _ns(targets=[str(existing_video)], set_thumbnail=str(thumbnail))
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.set_thumbnail == thumbnail.resolve()
 
-    def test_set_thumbnail_missing_file_raises(self, tmp_path: Path) -> None:
+    def test_set_thumbnail_missing_file_raises(
+        self, tmp_path: Path, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """존재하지 않는 썸네일은 에러."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            set_thumbnail=str(tmp_path / "missing.jpg"),
-        )
+        args = _ns(targets=[str(existing_video)], set_thumbnail=str(tmp_path / "missing.jpg"))
 
         with pytest.raises(FileNotFoundError, match="Thumbnail file not found"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
-    def test_set_thumbnail_unsupported_format(self, tmp_path: Path) -> None:
+    def test_set_thumbnail_unsupported_format(
+        self, tmp_path: Path, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """지원하지 않는 썸네일 확장자."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         thumbnail = tmp_path / "cover.gif"
         thumbnail.write_text("gif")
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            set_thumbnail=str(thumbnail),
-        )
+        args = _ns(targets=[str(existing_video)], set_thumbnail=str(thumbnail))
 
         with pytest.raises(ValueError, match="Unsupported thumbnail format"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
-    def test_template_intro_path_legacy(self, tmp_path: Path) -> None:
+    def test_template_intro_path_legacy(
+        self, tmp_path: Path, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """템플릿 intro 경로를 Path로 변환한다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         intro = tmp_path / "intro.mp4"
         intro.write_text("intro")
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_intro=str(intro),
-        )
+        args = _ns(targets=[str(existing_video)], template_intro=str(intro))
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
         assert result.template_intro == intro.resolve()
 
-    def test_template_outro_path_legacy(self, tmp_path: Path) -> None:
+    def test_template_outro_path_legacy(
+        self, tmp_path: Path, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """템플릿 outro 경로를 Path로 변환한다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         outro = tmp_path / "outro.mp4"
         outro.write_text("outro")
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_outro=str(outro),
-        )
+        args = _ns(targets=[str(existing_video)], template_outro=str(outro))
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
         assert result.template_outro == outro.resolve()
 
-    def test_template_intro_cli_precedence_legacy(self, tmp_path: Path) -> None:
+    def test_template_intro_cli_precedence_legacy(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+    ) -> None:
         """CLI로 지정한 템플릿이 환경변수보다 우선한다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
         cli_intro = tmp_path / "cli_intro.mp4"
         cli_intro.write_text("cli")
         env_intro = tmp_path / "env_intro.mp4"
         env_intro.write_text("env")
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_intro=str(cli_intro),
-        )
+        args = _ns(targets=[str(existing_video)], template_intro=str(cli_intro))
 
-        with patch.dict("os.environ", {"TUBEARCHIVE_TEMPLATE_INTRO": str(env_intro)}):
-            result = validate_args(args)
+        monkeypatch.setenv("TUBEARCHIVE_TEMPLATE_INTRO", str(env_intro))
+
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.template_intro == cli_intro.resolve()
 
-    def test_template_outro_from_env(self, tmp_path: Path) -> None:
+    def test_template_outro_from_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+    ) -> None:
         """템플릿 outro는 환경변수 기본값을 적용한다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         env_outro = tmp_path / "env_outro.mp4"
         env_outro.write_text("env")
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[str(existing_video)])
 
-        with patch.dict("os.environ", {"TUBEARCHIVE_TEMPLATE_OUTRO": str(env_outro)}):
-            result = validate_args(args)
+        monkeypatch.setenv("TUBEARCHIVE_TEMPLATE_OUTRO", str(env_outro))
+
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.template_outro == env_outro.resolve()
 
-    def test_template_path_not_found_raises(self, tmp_path: Path) -> None:
+    def test_template_path_not_found_raises(
+        self, tmp_path: Path, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """존재하지 않는 템플릿 경로는 FileNotFoundError."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
+        args = _ns(
+            targets=[str(existing_video)],
             template_intro=str(tmp_path / "missing_intro.mp4"),
             template_outro=str(tmp_path / "missing_outro.mp4"),
         )
 
-        with pytest.raises(FileNotFoundError):
-            validate_args(args)
+        with pytest.raises(FileNotFoundError, match="Template file not found"):
+            validate_args(args, stat_fn=cached_stat_fn)
 
     def test_default_subtitle_options(self) -> None:
         """자막 기본값이 ValidatedArgs에 반영된다."""
@@ -1084,15 +858,7 @@ class TestValidateArgs:
         for key in env_snapshot:
             os.environ.pop(key, None)
         try:
-            args = argparse.Namespace(
-                targets=[],
-                output=None,
-                no_resume=False,
-                keep_temp=False,
-                dry_run=False,
-                output_dir=None,
-                parallel=None,
-            )
+            args = _ns(targets=[])
 
             result = validate_args(args)
 
@@ -1110,14 +876,8 @@ class TestValidateArgs:
 
     def test_custom_subtitle_options_are_normalized(self) -> None:
         """자막 사용자 옵션이 전달되며 언어는 소문자 정규화."""
-        args = argparse.Namespace(
+        args = _ns(
             targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
             subtitle=True,
             subtitle_model="base",
             subtitle_format="vtt",
@@ -1135,49 +895,21 @@ class TestValidateArgs:
 
     def test_rejects_invalid_subtitle_model(self) -> None:
         """지원하지 않는 자막 모델은 에러."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            subtitle=True,
-            subtitle_model="invalid",
-        )
+        args = _ns(targets=[], subtitle=True, subtitle_model="invalid")
 
         with pytest.raises(ValidationError, match="Invalid subtitle model"):
             validate_args(args)
 
     def test_rejects_invalid_subtitle_format(self) -> None:
         """지원하지 않는 자막 포맷은 에러."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            subtitle=True,
-            subtitle_format="invalid",
-        )
+        args = _ns(targets=[], subtitle=True, subtitle_format="invalid")
 
         with pytest.raises(ValidationError, match="Invalid subtitle format"):
             validate_args(args)
 
     def test_validates_empty_targets_uses_cwd(self) -> None:
         """빈 targets는 cwd 사용."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[])
 
         result = validate_args(args)
 
@@ -1185,19 +917,26 @@ class TestValidateArgs:
 
     def test_raises_for_nonexistent_file(self) -> None:
         """존재하지 않는 파일은 에러."""
-        args = argparse.Namespace(
-            targets=["/nonexistent/video.mp4"],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=["/nonexistent/video.mp4"])
 
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="Target not found"):
             validate_args(args)
 
+    def test_stat_fn_replaces_target_existence_check(self) -> None:
+        """주입한 stat_fn 결과로 targets/output 존재 여부를 판단."""
+        checked: list[Path] = []
+
+        def _stat(path: Path) -> bool:
+            checked.append(path)
+            return True
+
+        args = _ns(targets=["/nonexistent/video.mp4"], output="/nonexistent/out/merged.mp4")
+
+        result = validate_args(args, stat_fn=_stat)
+
+        assert result.targets == [Path("/nonexistent/video.mp4")]
+        assert checked == [Path("/nonexistent/video.mp4"), Path("/nonexistent/out")]
+
     def test_watch_paths_from_cli(self, tmp_path: Path) -> None:
         """--watch 경로는 watch 모드로 해석."""
         watch_dir_1 = tmp_path / "watch1"
@@ -1205,16 +944,7 @@ class TestValidateArgs:
         watch_dir_2 = tmp_path / "watch2"
         watch_dir_2.mkdir()
 
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            watch=[str(watch_dir_1), str(watch_dir_2)],
-        )
+        args = _ns(targets=[], watch=[str(watch_dir_1), str(watch_dir_2)])
 
         result = validate_args(args)
 
@@ -1224,7 +954,7 @@ class TestValidateArgs:
         assert result.watch_stability_checks == 2
         assert result.watch_log is None
 
-    def test_watch_paths_from_env(self, tmp_path: Path) -> None:
+    def test_watch_paths_from_env(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         """watch 경로 미설정 시 env 기본값 사용."""
         watch_dir_1 = tmp_path / "env_watch1"
         watch_dir_1.mkdir()
@@ -1232,26 +962,14 @@ class TestValidateArgs:
         watch_dir_2.mkdir()
         watch_log = tmp_path / "watch.log"
 
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[])
 
-        with patch.dict(
-            "os.environ",
-            {
-                ENV_WATCH_PATHS: f"{watch_dir_1},{watch_dir_2}",
-                ENV_WATCH_POLL_INTERVAL: "1.5",
-                ENV_WATCH_STABILITY_CHECKS: "4",
-                ENV_WATCH_LOG: str(watch_log),
-            },
-        ):
-            result = validate_args(args)
+        monkeypatch.setenv(ENV_WATCH_PATHS, f"{watch_dir_1},{watch_dir_2}")
+        monkeypatch.setenv(ENV_WATCH_POLL_INTERVAL, "1.5")
+        monkeypatch.setenv(ENV_WATCH_STABILITY_CHECKS, "4")
+        monkeypatch.setenv(ENV_WATCH_LOG, str(watch_log))
+
+        result = validate_args(args)
 
         assert result.watch is True
         assert result.watch_paths == [watch_dir_1, watch_dir_2]
@@ -1261,31 +979,14 @@ class TestValidateArgs:
 
     def test_watch_path_missing_raises(self, tmp_path: Path) -> None:
         """watch 경로가 존재하지 않으면 FileNotFoundError."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            watch=[str(tmp_path / "missing_watch_dir")],
-        )
+        args = _ns(targets=[], watch=[str(tmp_path / "missing_watch_dir")])
 
         with pytest.raises(FileNotFoundError, match="Watch path not found"):
             validate_args(args)
 
     def test_watch_defaults_when_not_configured(self) -> None:
         """watch 설정 없음 시 비활성화 및 기본 값 반환."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[])
 
         with patch.dict(os.environ, {}, clear=True):
             result = validate_args(args)
@@ -1296,7 +997,9 @@ class TestValidateArgs:
         assert result.watch_stability_checks == 2
         assert result.watch_log is None
 
-    def test_watch_mode_reload_uses_updated_hook_config(self, tmp_path: Path) -> None:
+    def test_watch_mode_reload_uses_updated_hook_config(
+        self, tmp_path: Path, parser: argparse.ArgumentParser
+    ) -> None:
         """SIGHUP 시 재로딩된 config의 hook 설정을 사용."""
         if not hasattr(signal, "SIGHUP"):
             pytest.skip("SIGHUP is not supported on this platform.")
@@ -1304,7 +1007,7 @@ class TestValidateArgs:
         watch_dir = tmp_path / "watch"
         watch_dir.mkdir()
 
-        args = create_parser().parse_args(["--watch", str(watch_dir)])
+        args = parser.parse_args(["--watch", str(watch_dir)])
         baseline_args = replace(validate_args(args), watch_poll_interval=0.01)
         initial_hooks = HooksConfig(on_merge=("echo-initial",))
         reloaded_hooks = HooksConfig(on_merge=("echo-reloaded",))
@@ -1388,15 +1091,7 @@ class TestValidateArgs:
 
     def test_validates_output_parent_exists(self, tmp_path: Path) -> None:
         """출력 파일 부모 디렉토리 존재 확인."""
-        args = argparse.Namespace(
-            targets=[],
-            output=str(tmp_path / "output.mp4"),
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(output=str(tmp_path / "output.mp4"))
 
         result = validate_args(args)
 
@@ -1404,15 +1099,7 @@ class TestValidateArgs:
 
     def test_quality_report_default_is_false(self) -> None:
         """--quality-report 미지정 시 False."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(targets=[])
 
         result = validate_args(args)
 
@@ -1420,105 +1107,62 @@ class TestValidateArgs:
 
     def test_quality_report_true_enables_reporting(self) -> None:
         """--quality-report True가 전달되면 ValidatedArgs에 반영."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            quality_report=True,
-        )
+        args = _ns(targets=[], quality_report=True)
 
         result = validate_args(args)
 
         assert result.quality_report is True
 
-    def test_denoise_level_enables_denoise(self, tmp_path: Path) -> None:
+    def test_denoise_level_enables_denoise(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """--denoise-level 지정 시 denoise 자동 활성화."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level="heavy",
-        )
+        args = _ns(targets=[str(existing_video)], denoise_level="heavy")
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.denoise is True
         assert result.denoise_level == "heavy"
 
-    def test_env_denoise_defaults(self, tmp_path: Path) -> None:
+    def test_env_denoise_defaults(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+    ) -> None:
         """환경 변수로 denoise 기본 활성화."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _ns(targets=[str(existing_video)])
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-        )
+        monkeypatch.setenv("TUBEARCHIVE_DENOISE", "true")
 
-        with patch.dict("os.environ", {"TUBEARCHIVE_DENOISE": "true"}):
-            result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.denoise is True
         assert result.denoise_level == "medium"
 
-    def test_env_denoise_level_defaults(self, tmp_path: Path) -> None:
+    def test_env_denoise_level_defaults(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+    ) -> None:
         """환경 변수 denoise level 지정 시 자동 활성화."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _ns(targets=[str(existing_video)])
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-        )
+        monkeypatch.setenv("TUBEARCHIVE_DENOISE_LEVEL", "heavy")
 
-        with patch.dict("os.environ", {"TUBEARCHIVE_DENOISE_LEVEL": "heavy"}):
-            result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.denoise is True
         assert result.denoise_level == "heavy"
 
-    def test_watermark_defaults(self, tmp_path: Path) -> None:
+    def test_watermark_defaults(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """워터마크 기본값은 False/기본값 유지."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _ns(targets=[str(existing_video)])
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
-
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.watermark is False
         assert result.watermark_pos == "bottom-right"
@@ -1526,19 +1170,12 @@ class TestValidateArgs:
         assert result.watermark_color == "white"
         assert result.watermark_alpha == 0.85
 
-    def test_watermark_options(self, tmp_path: Path) -> None:
+    def test_watermark_options(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """워터마크 인자 값이 ValidatedArgs에 반영."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
+        args = _ns(
+            targets=[str(existing_video)],
             watermark=True,
             watermark_pos="top-left",
             watermark_size=36,
@@ -1546,7 +1183,7 @@ class TestValidateArgs:
             watermark_alpha=0.6,
         )
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.watermark is True
         assert result.watermark_pos == "top-left"
@@ -1554,19 +1191,12 @@ class TestValidateArgs:
         assert result.watermark_color == "yellow"
         assert result.watermark_alpha == 0.6
 
-    def test_watermark_invalid_size_raises(self, tmp_path: Path) -> None:
+    def test_watermark_invalid_size_raises(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """워터마크 크기 0 이하면 ValueError."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
+        args = _ns(
+            targets=[str(existing_video)],
             watermark=True,
             watermark_pos="bottom-right",
             watermark_size=0,
@@ -1575,21 +1205,14 @@ class TestValidateArgs:
         )
 
         with pytest.raises(ValueError, match="Watermark size must be > 0"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
-    def test_watermark_invalid_alpha_raises(self, tmp_path: Path) -> None:
+    def test_watermark_invalid_alpha_raises(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """워터마크 투명도 범위 초과 시 ValueError."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
+        args = _ns(
+            targets=[str(existing_video)],
             watermark=True,
             watermark_pos="bottom-right",
             watermark_size=24,
@@ -1598,19 +1221,11 @@ class TestValidateArgs:
         )
 
         with pytest.raises(ValueError, match="Watermark alpha must be in"):
-            validate_args(args)
+            validate_args(args, stat_fn=cached_stat_fn)
 
     def test_raises_for_invalid_output_parent(self) -> None:
         """출력 파일 부모 디렉토리 없으면 에러."""
-        args = argparse.Namespace(
-            targets=[],
-            output="/nonexistent/dir/output.mp4",
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-        )
+        args = _ns(output="/nonexistent/dir/output.mp4")
 
         with pytest.raises(FileNotFoundError, match="Output directory"):
             validate_args(args)
@@ -1622,94 +1237,14 @@ class TestValidateArgs:
         target = tmp_path / "video.mp4"
         target.touch()
 
-        args = argparse.Namespace(
-            targets=[str(target)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut=str(lut_file),
-            auto_lut=None,
-            no_auto_lut=False,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args(targets=[str(target)], lut=str(lut_file))
         result = validate_args(args)
         assert result.lut_path is not None
         assert result.lut_path.name == "test.cube"
 
     def test_lut_nonexistent_file_raises(self) -> None:
         """존재하지 않는 LUT 파일 → FileNotFoundError."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut="/nonexistent/path/test.cube",
-            auto_lut=None,
-            no_auto_lut=False,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args(lut="/nonexistent/path/test.cube")
         with pytest.raises(FileNotFoundError, match="LUT file not found"):
             validate_args(args)
 
@@ -1718,231 +1253,31 @@ class TestValidateArgs:
         lut_file = tmp_path / "test.png"
         lut_file.write_text("not a lut\n")
 
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut=str(lut_file),
-            auto_lut=None,
-            no_auto_lut=False,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args(lut=str(lut_file))
         with pytest.raises(ValueError, match="Unsupported LUT format"):
             validate_args(args)
 
     def test_auto_lut_flag_sets_true(self) -> None:
         """--auto-lut 플래그가 auto_lut=True로 설정."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut=None,
-            auto_lut=True,
-            no_auto_lut=False,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args(auto_lut=True)
         result = validate_args(args)
         assert result.auto_lut is True
 
     def test_no_auto_lut_overrides(self) -> None:
         """--no-auto-lut이 환경변수/config보다 우선."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut=None,
-            auto_lut=None,
-            no_auto_lut=True,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args(no_auto_lut=True)
         result = validate_args(args)
         assert result.auto_lut is False
 
     def test_auto_lut_and_no_auto_lut_both_set(self) -> None:
         """--auto-lut + --no-auto-lut 동시 → --no-auto-lut 우선."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut=None,
-            auto_lut=True,
-            no_auto_lut=True,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args(auto_lut=True, no_auto_lut=True)
         result = validate_args(args)
         assert result.auto_lut is False
 
     def test_device_luts_passed_through(self) -> None:
         """device_luts 파라미터가 ValidatedArgs에 전달된다."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            denoise=False,
-            denoise_level=None,
-            normalize_audio=False,
-            group=False,
-            no_group=False,
-            fade_duration=None,
-            upload=False,
-            thumbnail=False,
-            thumbnail_at=None,
-            thumbnail_quality=2,
-            detect_silence=False,
-            trim_silence=False,
-            silence_threshold="-30dB",
-            silence_duration=2.0,
-            bgm=None,
-            bgm_volume=None,
-            bgm_loop=False,
-            exclude=None,
-            include_only=None,
-            sort=None,
-            reorder=False,
-            split_duration=None,
-            split_size=None,
-            archive_originals=None,
-            archive_force=False,
-            timelapse=None,
-            timelapse_audio=False,
-            timelapse_resolution=None,
-            lut=None,
-            auto_lut=None,
-            no_auto_lut=False,
-            lut_before_hdr=False,
-        )
+        args = _make_lut_args()
         luts = {"nikon": "/path/to/nikon.cube"}
         result = validate_args(args, device_luts=luts)
         assert result.device_luts == luts
@@ -1952,81 +1287,47 @@ class TestValidateArgs:
         template = tmp_path / "intro.mov"
         template.touch()
 
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_intro=str(template),
-            template_outro=None,
-        )
+        args = _ns(targets=[], template_intro=str(template), template_outro=None)
 
         result = validate_args(args)
         assert result.template_intro == template
 
     def test_template_intro_path_missing_raises(self, tmp_path: Path) -> None:
         """없는 template 경로는 FileNotFoundError."""
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_intro=str(tmp_path / "missing.mov"),
-            template_outro=None,
-        )
+        args = _ns(targets=[], template_intro=str(tmp_path / "missing.mov"), template_outro=None)
 
         with pytest.raises(FileNotFoundError, match="Template file not found"):
             validate_args(args)
 
-    def test_template_outro_env_fallback(self, tmp_path: Path) -> None:
+    def test_template_outro_env_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
         """템플릿 아웃트로는 env/config 기본값을 따름."""
         template = tmp_path / "outro.mov"
         template.touch()
 
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_intro=None,
-            template_outro=None,
-        )
+        args = _ns(targets=[], template_intro=None, template_outro=None)
 
-        with patch.dict("os.environ", {ENV_TEMPLATE_OUTRO: str(template)}):
-            result = validate_args(args)
+        monkeypatch.setenv(ENV_TEMPLATE_OUTRO, str(template))
+
+        result = validate_args(args)
 
         assert result.template_outro == template
 
-    def test_template_intro_cli_precedence(self, tmp_path: Path) -> None:
+    def test_template_intro_cli_precedence(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
         """template_intro CLI > env/template config."""
         cli_template = tmp_path / "cli_intro.mov"
         cli_template.touch()
         env_template = tmp_path / "env_intro.mov"
         env_template.touch()
 
-        args = argparse.Namespace(
-            targets=[],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            template_intro=str(cli_template),
-            template_outro=None,
-        )
+        args = _ns(targets=[], template_intro=str(cli_template), template_outro=None)
 
-        with patch.dict("os.environ", {ENV_TEMPLATE_INTRO: str(env_template)}):
-            result = validate_args(args)
+        monkeypatch.setenv(ENV_TEMPLATE_INTRO, str(env_template))
+
+        result = validate_args(args)
 
         assert result.template_intro == cli_template
 
@@ -2034,77 +1335,79 @@ class TestValidateArgs:
 class TestCmdInitConfig:
     """cmd_init_config 테스트."""
 
-    @patch("tubearchive.config.get_default_config_path")
-    def test_creates_config_file(self, mock_path: MagicMock, tmp_path: Path) -> None:
+    def test_creates_config_file(self, tmp_path: Path) -> None:
         """설정 파일 생성."""
-        from tubearchive.app.cli.main import cmd_init_config
+        config_path = tmp_path / ".tubearchive" / "config.toml"
 
+        cmd_init_config(config_path)
+
+        assert {"[general]", "[youtube]"} <= set(config_path.read_text().splitlines())
+
+    def test_defaults_to_default_config_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """경로 미지정 시 기본 설정 경로에 생성."""
         config_path = tmp_path / ".tubearchive" / "config.toml"
-        mock_path.return_value = config_path
+        monkeypatch.setattr("tubearchive.config.get_default_config_path", lambda: config_path)
 
         cmd_init_config()
 
         assert config_path.exists()
-        content = config_path.read_text()
-        assert "[general]" in content
-        assert "[youtube]" in content
 
     @patch("tubearchive.app.cli.main.safe_input", return_value="n")
-    @patch("tubearchive.config.get_default_config_path")
-    def test_skips_overwrite_when_declined(
-        self, mock_path: MagicMock, mock_input: MagicMock, tmp_path: Path
-    ) -> None:
+    def test_skips_overwrite_when_declined(self, mock_input: MagicMock, tmp_path: Path) -> None:
         """덮어쓰기 거부 시 스킵."""
-        from tubearchive.app.cli.main import cmd_init_config
-
         config_path = tmp_path / "config.toml"
         config_path.write_text("existing content")
-        mock_path.return_value = config_path
 
-        cmd_init_config()
+        cmd_init_config(config_path)
 
         assert config_path.read_text() == "existing content"
 
     @patch("tubearchive.app.cli.main.safe_input", return_value="y")
-    @patch("tubearchive.config.get_default_config_path")
-    def test_overwrites_when_confirmed(
-        self, mock_path: MagicMock, mock_input: MagicMock, tmp_path: Path
-    ) -> None:
+    def test_overwrites_when_confirmed(self, mock_input: MagicMock, tmp_path: Path) -> None:
         """덮어쓰기 확인 시 덮어씀."""
-        from tubearchive.app.cli.main import cmd_init_config
-
         config_path = tmp_path / "config.toml"
         config_path.write_text("old content")
-        mock_path.return_value = config_path
 
-        cmd_init_config()
+        cmd_init_config(config_path)
 
-        content = config_path.read_text()
-        assert "[general]" in content
+        assert "[general]" in config_path.read_text().splitlines()
 
 
 class TestMain:
     """main 함수 테스트."""
 
-    @patch("tubearchive.app.cli.main.run_pipeline")
-    def test_main_calls_pipeline(
+    def test_main_calls_pipeline(self, tmp_path: Path, existing_video: Path) -> None:
+        """main이 파이프라인 호출."""
+        pipeline = MagicMock(return_value=tmp_path / "output.mp4")
+
+        main([str(existing_video)], pipeline=pipeline)
+
+        pipeline.assert_called_once()
+        assert pipeline.call_args.args[0].targets == [existing_video]
+
+    @patch("tubearchive.app.cli.main.cmd_init_config")
+    @patch("tubearchive.app.cli.main.create_parser")
+    def test_main_init_config_skips_parser(
         self,
-        mock_pipeline: MagicMock,
-        tmp_path: Path,
+        mock_create_parser: MagicMock,
+        mock_init_config: MagicMock,
     ) -> None:
-        """main이 파이프라인 호출."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-        output_file = tmp_path / "output.mp4"
-        summary_file = tmp_path / "output_summary.md"
+        """단독 --init-config는 파서를 만들지 않고 바로 설정 파일을 생성한다."""
+        main(["--init-config"])
+
+        mock_init_config.assert_called_once_with()
+        mock_create_parser.assert_not_called()
 
-        # run_pipeline은 (output_path, summary_path) 튜플 반환
-        mock_pipeline.return_value = (output_file, summary_file)
+    def test_main_reads_sys_argv_by_default(self, tmp_path: Path, existing_video: Path) -> None:
+        """argv 미지정 시 sys.argv[1:]을 사용."""
+        pipeline = MagicMock(return_value=tmp_path / "output.mp4")
 
-        with patch("sys.argv", ["tubearchive", str(video_file)]):
-            main()
+        with patch("sys.argv", ["tubearchive", str(existing_video)]):
+            main(pipeline=pipeline)
 
-        mock_pipeline.assert_called_once()
+        assert pipeline.call_args.args[0].targets == [existing_video]
 
     @patch("tubearchive.app.cli.main._run_watch_mode")
     def test_main_calls_watch_mode(
@@ -2116,340 +1419,297 @@ class TestMain:
         watch_dir = tmp_path / "watch"
         watch_dir.mkdir()
 
-        with patch("sys.argv", ["tubearchive", "--watch", str(watch_dir)]):
-            main()
+        main(["--watch", str(watch_dir)])
 
         mock_watch_mode.assert_called_once()
 
-    @patch("tubearchive.app.cli.main.run_pipeline")
-    def test_main_dry_run_skips_pipeline(
-        self,
-        mock_pipeline: MagicMock,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
-    ) -> None:
+    def test_main_dry_run_skips_pipeline(self, existing_video: Path) -> None:
         """--dry-run은 파이프라인 스킵."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        pipeline = MagicMock()
+        stdout = io.StringIO()
 
-        with patch("sys.argv", ["tubearchive", "--dry-run", str(video_file)]):
-            main()
+        with contextlib.redirect_stdout(stdout):
+            main(["--dry-run", str(existing_video)], pipeline=pipeline)
 
-        mock_pipeline.assert_not_called()
-        captured = capsys.readouterr()
-        assert "Dry run" in captured.out or "dry" in captured.out.lower()
+        pipeline.assert_not_called()
+        assert "=== Dry Run Execution Plan ===" in stdout.getvalue()
 
-    def test_main_runs_run_hook(self, tmp_path: Path) -> None:
+    def test_main_runs_run_hook(self) -> None:
         """--run-hook 지정 시 run_hooks가 호출된다."""
         config = AppConfig(hooks=HooksConfig(on_merge=("echo merged",)))
 
         with (
             patch("tubearchive.app.cli.main.load_config", return_value=config),
             patch("tubearchive.app.cli.main.run_hooks") as mock_run_hooks,
-            patch("sys.argv", ["tubearchive", "--run-hook", "on_merge"]),
         ):
-            main()
+            main(["--run-hook", "on_merge"])
 
         mock_run_hooks.assert_called_once()
         assert mock_run_hooks.call_args.args[1] == "on_merge"
         assert mock_run_hooks.call_args.args[0] == config.hooks
 
-    @patch("tubearchive.app.cli.main.run_pipeline", side_effect=RuntimeError("pipeline failed"))
-    def test_main_invokes_error_hook_on_exception(
-        self,
-        _mock_pipeline: MagicMock,
-        tmp_path: Path,
-    ) -> None:
+    def test_main_invokes_error_hook_on_exception(self, existing_video: Path) -> None:
         """파이프라인 예외 발생 시 on_error 훅이 실행된다."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
         config = AppConfig(hooks=HooksConfig(on_error=("echo error",)))
+        pipeline = MagicMock(side_effect=RuntimeError("pipeline failed"))
+
+        with (
+            patch("tubearchive.app.cli.main.load_config", return_value=config),
+            patch("tubearchive.app.cli.main.run_hooks") as mock_run_hooks,
+            pytest.raises(SystemExit),
+        ):
+            main([str(existing_video)], pipeline=pipeline)
+
+        assert mock_run_hooks.call_count >= 1
+        events = [args.args[1] for args in mock_run_hooks.call_args_list]
+        assert "on_error" in events
+
+
+@dataclass
+class _StubConnection:
+    """``database_session``이 요구하는 ``close()``만 가진 DB 연결 stub."""
+
+    close_calls: int = 0
+
+    def close(self) -> None:
+        """호출 횟수만 기록한다."""
+        self.close_calls += 1
+
+
+@dataclass
+class _StubMergeJobRepository:
+    """``get_by_output_path``가 고정된 job을 돌려주는 MergeJobRepository stub."""
+
+    job: SimpleNamespace | None = None
+
+    def get_by_output_path(self, output_path: Path) -> SimpleNamespace | None:
+        return self.job
+
+
+@dataclass
+class _StubSplitJobRepository:
+    """분할 작업 조회/youtube_id 기록만 흉내 내는 SplitJobRepository stub."""
+
+    jobs: list[SimpleNamespace] = field(default_factory=list)
+    youtube_ids: list[tuple[int, str]] = field(default_factory=list)
+
+    def get_by_merge_job_id(self, merge_job_id: int) -> list[SimpleNamespace]:
+        return self.jobs
+
+    def append_youtube_id(self, split_job_id: int, video_id: str) -> None:
+        self.youtube_ids.append((split_job_id, video_id))
+
+
+@dataclass
+class _UploadStubs:
+    """업로드 테스트에서 공유하는 stub 묶음.
+
+    호출 기록 검증이 필요한 ``upload_to_youtube``만 MagicMock이고,
+    나머지 의존성은 고정 속성을 가진 가벼운 stub이다.
+    """
+
+    upload_to_youtube: MagicMock
+    merge_repo: _StubMergeJobRepository = field(default_factory=_StubMergeJobRepository)
+    split_repo: _StubSplitJobRepository = field(default_factory=_StubSplitJobRepository)
+
+
+# 분할 업로드 테스트용 clips_info_json 샘플
+_CLIPS_JSON_TWO_DEVICES = (
+    '[{"name":"A.mp4","duration":3600,"start":0,"end":3600,'
+    '"device":"Nikon","shot_time":"10:00"},'
+    '{"name":"B.mp4","duration":3600,"start":3600,"end":7200,'
+    '"device":"GoPro","shot_time":"11:00"}]'
+)
+_CLIPS_JSON_ONE_HOUR = (
+    '[{"name":"A.mp4","duration":3600,"start":0,"end":3600,"device":null,"shot_time":null}]'
+)
+_CLIPS_JSON_TWO_HOURS = (
+    '[{"name":"A.mp4","duration":7200,"start":0,"end":7200,"device":null,"shot_time":null}]'
+)
+_CLIPS_JSON_THREE_HOURS = (
+    '[{"name":"A.mp4","duration":10800,"start":0,"end":10800,"device":null,"shot_time":null}]'
+)
 
-        with (
-            patch("tubearchive.app.cli.main.load_config", return_value=config),
-            patch("tubearchive.app.cli.main.run_hooks") as mock_run_hooks,
-            patch("sys.argv", ["tubearchive", str(video_file)]),
-            pytest.raises(SystemExit),
-        ):
-            main()
 
-        assert mock_run_hooks.call_count >= 1
-        events = [args.args[1] for args in mock_run_hooks.call_args_list]
-        assert "on_error" in events
+def _upload_args(upload_privacy: str = "unlisted") -> argparse.Namespace:
+    """``_upload_after_pipeline``이 읽는 최소 CLI 인자."""
+    return argparse.Namespace(upload_privacy=upload_privacy, playlist=None, upload_chunk=32)
+
+
+def _merge_job(**fields: object) -> SimpleNamespace:
+    """``get_by_output_path`` 결과로 쓰는 merge_job stub. 필요한 필드만 덮어쓴다."""
+    defaults: dict[str, object] = {
+        "id": 1,
+        "title": "Video",
+        "summary_markdown": "desc",
+        "clips_info_json": None,
+    }
+    return SimpleNamespace(**{**defaults, **fields})
+
+
+@pytest.fixture(scope="class")
+def _upload_patches() -> Generator[_UploadStubs]:
+    """업로드 경로 의존성을 클래스 단위로 한 번만 패치한다.
+
+    테스트마다 ``@patch`` 스택을 새로 만드는 대신 클래스 시작 시 patcher를 켜고,
+    각 테스트 전에는 ``upload_stubs`` fixture가 호출 기록과 stub 상태만 초기화한다.
+    """
+    stubs = _UploadStubs(upload_to_youtube=MagicMock())
+    with (
+        patch.multiple(
+            "tubearchive.app.cli.upload",
+            upload_to_youtube=stubs.upload_to_youtube,
+            resolve_playlist_ids=lambda _playlist: [],
+            probe_duration=lambda _path: 3600.0,
+            MergeJobRepository=lambda _conn: stubs.merge_repo,
+            SplitJobRepository=lambda _conn: stubs.split_repo,
+        ),
+        patch("tubearchive.app.cli.main.init_database", new=_StubConnection),
+    ):
+        yield stubs
+
+
+@pytest.fixture
+def upload_stubs(_upload_patches: _UploadStubs) -> _UploadStubs:
+    """클래스 단위 업로드 stub을 초기 상태로 되돌려 반환."""
+    _upload_patches.upload_to_youtube.reset_mock(return_value=True, side_effect=True)
+    _upload_patches.merge_repo = _StubMergeJobRepository()
+    _upload_patches.split_repo = _StubSplitJobRepository()
+    return _upload_patches
 
 
 class TestUploadAfterPipeline:
     """_upload_after_pipeline 테스트."""
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_upload_after_pipeline_passes_privacy(
         self,
-        mock_db: MagicMock,
-        mock_playlist: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """privacy 파라미터 전달 확인."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
-        # MergeJobRepository mock
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = None
-
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
-        args = argparse.Namespace(
-            upload_privacy="private",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args(upload_privacy="private")
 
-        with patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo):
-            _upload_after_pipeline(output_path, args)
+        _upload_after_pipeline(output_path, args)
 
+        mock_upload = upload_stubs.upload_to_youtube
         mock_upload.assert_called_once()
         call_kwargs = mock_upload.call_args[1]
         assert call_kwargs["privacy"] == "private"
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_upload_after_pipeline_uses_explicit_thumbnail(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """명시 썸네일이 있으면 업로드에 그대로 전달."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = None
-
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
         thumbnail = tmp_path / "explicit.jpg"
-        thumbnail.touch()
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
 
-        with patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo):
-            _upload_after_pipeline(
-                output_path,
-                args,
-                generated_thumbnail_paths=None,
-                explicit_thumbnail=thumbnail,
-            )
+        _upload_after_pipeline(
+            output_path,
+            args,
+            generated_thumbnail_paths=None,
+            explicit_thumbnail=thumbnail,
+        )
 
-        call_kwargs = mock_upload.call_args[1]
+        call_kwargs = upload_stubs.upload_to_youtube.call_args[1]
         assert call_kwargs["thumbnail"] == thumbnail
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_upload_after_pipeline_passes_subtitle_args(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """자막 경로와 언어가 업로드 인자로 전달된다."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = None
-
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
         subtitle_path = tmp_path / "subtitle.srt"
-        subtitle_path.write_text("WEBVTT\n\n00:00:00.000 --> 00:00:01.000\n테스트\n")
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
 
-        with patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo):
-            _upload_after_pipeline(
-                output_path,
-                args,
-                subtitle_path=subtitle_path,
-                subtitle_language="ko",
-            )
+        _upload_after_pipeline(
+            output_path,
+            args,
+            subtitle_path=subtitle_path,
+            subtitle_language="ko",
+        )
 
+        mock_upload = upload_stubs.upload_to_youtube
         mock_upload.assert_called_once()
         call_kwargs = mock_upload.call_args.kwargs
         assert call_kwargs["subtitle_path"] == subtitle_path
         assert call_kwargs["subtitle_language"] == "ko"
 
     @patch("tubearchive.app.cli.upload._upload_split_files")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_upload_after_pipeline_passes_subtitle_args_to_split_upload(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
         mock_upload_split: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """분할 업로드 시 자막 경로/언어가 split 업로더에 전달된다."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
         split_file = tmp_path / "part1.mp4"
         split_file.write_bytes(b"segment")
         subtitle_path = tmp_path / "subtitle.srt"
-        subtitle_path.write_text("WEBVTT\n\n00:00:00.000 --> 00:00:01.000\n테스트\n")
 
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
+        upload_stubs.merge_repo.job = _merge_job(id=2, title="title", summary_markdown="")
+        upload_stubs.split_repo.jobs = [SimpleNamespace(id=5, output_files=[split_file])]
 
-        with (
-            patch(
-                "tubearchive.app.cli.upload.MergeJobRepository",
-                return_value=MagicMock(
-                    get_latest=MagicMock(
-                        return_value=MagicMock(
-                            id=2,
-                            title="title",
-                            summary_markdown="",
-                            clips_info_json=None,
-                        ),
-                    ),
-                ),
-            ),
-            patch(
-                "tubearchive.app.cli.upload.SplitJobRepository",
-                return_value=MagicMock(
-                    get_by_merge_job_id=MagicMock(
-                        return_value=[MagicMock(id=5, output_files=[split_file])]
-                    )
-                ),
-            ),
-        ):
-            _upload_after_pipeline(
-                output_path,
-                args,
-                subtitle_path=subtitle_path,
-                subtitle_language="ko",
-            )
+        _upload_after_pipeline(
+            output_path,
+            args,
+            subtitle_path=subtitle_path,
+            subtitle_language="ko",
+        )
 
         mock_upload_split.assert_called_once()
         call_kwargs = mock_upload_split.call_args.kwargs
         assert call_kwargs["subtitle_path"] == subtitle_path
         assert call_kwargs["subtitle_language"] == "ko"
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_upload_after_pipeline_uses_single_generated_thumbnail(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """생성 썸네일 1개는 자동 선택."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = None
-
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
         generated = tmp_path / "generated.jpg"
-        generated.touch()
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
 
-        with patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo):
-            _upload_after_pipeline(
-                output_path,
-                args,
-                generated_thumbnail_paths=[generated],
-            )
+        _upload_after_pipeline(
+            output_path,
+            args,
+            generated_thumbnail_paths=[generated],
+        )
 
-        call_kwargs = mock_upload.call_args[1]
+        call_kwargs = upload_stubs.upload_to_youtube.call_args[1]
         assert call_kwargs["thumbnail"] == generated
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
     @patch("tubearchive.app.cli.upload._resolve_upload_thumbnail")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_upload_after_pipeline_logs_selected_thumbnail(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
         mock_resolve_thumbnail: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """썸네일 선택 결과를 INFO 로그로 남긴다."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = None
-
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
         thumbnail = tmp_path / "selected.jpg"
-        thumbnail.touch()
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
         mock_resolve_thumbnail.return_value = thumbnail
 
-        with (
-            patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo),
-            caplog.at_level("INFO"),
-        ):
+        with caplog.at_level("INFO"):
             _upload_after_pipeline(
                 output_path,
                 args,
                 generated_thumbnail_paths=[tmp_path / "generated.jpg"],
             )
 
+        upload_stubs.upload_to_youtube.assert_called_once()
         assert "Using thumbnail for upload" in caplog.text
         assert thumbnail.name in caplog.text
 
@@ -2459,8 +1719,6 @@ class TestResolveUploadThumbnail:
 
     def test_resolve_upload_thumbnail_uses_explicit(self, tmp_path: Path) -> None:
         """명시 썸네일이 우선."""
-        from tubearchive.app.cli.main import _resolve_upload_thumbnail
-
         explicit = tmp_path / "a.jpg"
         generated = [tmp_path / "b.jpg"]
 
@@ -2468,8 +1726,6 @@ class TestResolveUploadThumbnail:
 
     def test_resolve_upload_thumbnail_single_generated(self, tmp_path: Path) -> None:
         """자동 생성 썸네일 1개는 해당 경로 사용."""
-        from tubearchive.app.cli.main import _resolve_upload_thumbnail
-
         generated = [tmp_path / "auto.jpg"]
         generated[0].touch()
 
@@ -2482,8 +1738,6 @@ class TestResolveUploadThumbnail:
         tmp_path: Path,
     ) -> None:
         """썸네일이 여러 개면 인터랙티브 선택 결과 사용."""
-        from tubearchive.app.cli.main import _resolve_upload_thumbnail
-
         generated = [tmp_path / "auto1.jpg", tmp_path / "auto2.jpg"]
         for path in generated:
             path.touch()
@@ -2497,8 +1751,6 @@ class TestResolveUploadThumbnail:
         tmp_path: Path,
     ) -> None:
         """사용자가 0번으로 건너뛰면 None을 반환한다."""
-        from tubearchive.app.cli.main import _resolve_upload_thumbnail
-
         generated = [tmp_path / "auto1.jpg", tmp_path / "auto2.jpg"]
         for path in generated:
             path.touch()
@@ -2509,197 +1761,102 @@ class TestResolveUploadThumbnail:
 class TestUploadSplitFiles:
     """_upload_split_files 분할 업로드 테스트."""
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=3600.0)
-    def test_uploads_each_split_file(
+    @pytest.mark.parametrize(
+        ("part_count", "clips_info_json", "side_effect"),
+        [
+            (2, _CLIPS_JSON_TWO_DEVICES, None),
+            (2, _CLIPS_JSON_TWO_HOURS, None),
+            (1, "not valid json {{{", None),
+            (1, None, None),
+            # 두 번째 파트만 실패해도 세 번째 파트까지 시도
+            (3, _CLIPS_JSON_THREE_HOURS, [None, Exception("network error"), None]),
+        ],
+        ids=["two-devices", "single-clip", "malformed-json", "no-json", "partial-failure"],
+    )
+    def test_uploads_every_part_with_part_title(
         self,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
+        part_count: int,
+        clips_info_json: str | None,
+        side_effect: list[object] | None,
     ) -> None:
-        """분할 파일 각각에 대해 upload_to_youtube가 호출된다."""
-        from tubearchive.app.cli.main import _upload_split_files
-
-        f1 = tmp_path / "video_001.mp4"
-        f2 = tmp_path / "video_002.mp4"
-        f1.touch()
-        f2.touch()
+        """분할 파일마다 '(Part N/M)' 제목으로 업로드를 시도한다.
 
-        clips_json = (
-            '[{"name":"A.mp4","duration":3600,"start":0,"end":3600,'
-            '"device":"Nikon","shot_time":"10:00"},'
-            '{"name":"B.mp4","duration":3600,"start":3600,"end":7200,'
-            '"device":"GoPro","shot_time":"11:00"}]'
-        )
+        clips_info_json이 없거나 깨져 있어도, 일부 파트 업로드가 실패해도
+        나머지 파트는 계속 업로드한다.
+        """
+        split_files = [tmp_path / f"video_{i:03d}.mp4" for i in range(1, part_count + 1)]
+        upload_stubs.upload_to_youtube.side_effect = side_effect
 
         _upload_split_files(
-            split_files=[f1, f2],
+            split_files=split_files,
             title="Test",
-            clips_info_json=clips_json,
-            privacy="unlisted",
-            merge_job_id=1,
-            playlist_ids=None,
-            chunk_mb=32,
-        )
-
-        assert mock_upload.call_count == 2
-
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=3600.0)
-    def test_title_includes_part_numbers(
-        self,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """제목에 (Part N/M) 형식이 포함된다."""
-        from tubearchive.app.cli.main import _upload_split_files
-
-        f1 = tmp_path / "video_001.mp4"
-        f2 = tmp_path / "video_002.mp4"
-        f1.touch()
-        f2.touch()
-
-        clips_json = (
-            '[{"name":"A.mp4","duration":7200,"start":0,"end":7200,"device":null,"shot_time":null}]'
-        )
-
-        _upload_split_files(
-            split_files=[f1, f2],
-            title="MyVideo",
-            clips_info_json=clips_json,
+            clips_info_json=clips_info_json,
             privacy="unlisted",
             merge_job_id=1,
             playlist_ids=None,
             chunk_mb=None,
         )
 
-        first_call_title = mock_upload.call_args_list[0][1]["title"]
-        second_call_title = mock_upload.call_args_list[1][1]["title"]
-        assert "(Part 1/2)" in first_call_title
-        assert "(Part 2/2)" in second_call_title
+        titles = [call.kwargs["title"] for call in upload_stubs.upload_to_youtube.call_args_list]
+        assert titles == [f"Test (Part {i}/{part_count})" for i in range(1, part_count + 1)]
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_falls_back_when_no_split_files(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """분할 파일이 없으면 단일 파일 업로드로 폴백한다."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = MagicMock(
-            id=1,
-            title="Video",
-            summary_markdown="desc",
-            clips_info_json=None,
-        )
-
-        mock_split_repo = MagicMock()
-        mock_split_repo.get_by_merge_job_id.return_value = []
+        upload_stubs.merge_repo.job = _merge_job()
 
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
 
-        with (
-            patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo),
-            patch("tubearchive.app.cli.upload.SplitJobRepository", return_value=mock_split_repo),
-        ):
-            _upload_after_pipeline(output_path, args)
+        _upload_after_pipeline(output_path, args)
 
         # 단일 파일로 업로드
+        mock_upload = upload_stubs.upload_to_youtube
         mock_upload.assert_called_once()
         call_kwargs = mock_upload.call_args[1]
         assert call_kwargs["file_path"] == output_path
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=3600.0)
-    @patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[])
-    @patch("tubearchive.app.cli.main.init_database")
     def test_uploads_split_files_when_present(
         self,
-        mock_db: MagicMock,
-        _mock_playlist: MagicMock,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """분할 파일이 DB에 있는 경우 분할 파일을 업로드한다."""
-        from tubearchive.app.cli.main import _upload_after_pipeline
-
-        mock_conn = MagicMock()
-        mock_db.return_value = mock_conn
-        mock_conn.close = MagicMock()
-
         f1 = tmp_path / "video_001.mp4"
         f2 = tmp_path / "video_002.mp4"
         f1.touch()
         f2.touch()
 
-        clips_json = (
-            '[{"name":"A.mp4","duration":3600,"start":0,"end":3600,"device":null,"shot_time":null}]'
-        )
-
-        mock_repo = MagicMock()
-        mock_repo.get_latest.return_value = MagicMock(
-            id=1,
-            title="Video",
-            summary_markdown="desc",
-            clips_info_json=clips_json,
-        )
-
-        mock_split_job = MagicMock()
-        mock_split_job.output_files = [f1, f2]
+        upload_stubs.merge_repo.job = _merge_job(clips_info_json=_CLIPS_JSON_ONE_HOUR)
 
-        mock_split_repo = MagicMock()
-        mock_split_repo.get_by_merge_job_id.return_value = [mock_split_job]
+        upload_stubs.split_repo.jobs = [SimpleNamespace(id=7, output_files=[f1, f2])]
 
         output_path = tmp_path / "output.mp4"
-        output_path.touch()
-        args = argparse.Namespace(
-            upload_privacy="unlisted",
-            playlist=None,
-            upload_chunk=32,
-        )
+        args = _upload_args()
 
-        with (
-            patch("tubearchive.app.cli.upload.MergeJobRepository", return_value=mock_repo),
-            patch("tubearchive.app.cli.upload.SplitJobRepository", return_value=mock_split_repo),
-        ):
-            _upload_after_pipeline(output_path, args)
+        _upload_after_pipeline(output_path, args)
 
-        # 분할 파일 2개가 업로드됨
-        assert mock_upload.call_count == 2
+        # 분할 파일 2개가 업로드되고 파트별 youtube_id가 split_job에 기록됨
+        assert upload_stubs.upload_to_youtube.call_count == 2
+        assert [job_id for job_id, _ in upload_stubs.split_repo.youtube_ids] == [7, 7]
 
 
 class TestUploadOnly:
     """--upload-only 처리 테스트."""
 
     @patch("tubearchive.app.cli.upload.run_hooks")
-    @patch("tubearchive.app.cli.upload.upload_to_youtube", return_value="yt123")
     def test_upload_only_calls_upload_hook(
         self,
-        mock_upload: MagicMock,
         mock_run_hooks: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """--upload-only 완료 후 on_upload 훅이 실행된다."""
-        from tubearchive.app.cli.main import cmd_upload_only
-
         file_path = tmp_path / "output.mp4"
         file_path.write_bytes(b"dummy")
 
@@ -2713,35 +1870,25 @@ class TestUploadOnly:
             set_thumbnail=None,
         )
 
-        with (
-            patch(
-                "tubearchive.app.cli.upload.MergeJobRepository",
-                return_value=MagicMock(get_by_output_path=MagicMock(return_value=None)),
-            ),
-            patch("tubearchive.app.cli.upload.resolve_playlist_ids", return_value=[]),
-            patch("tubearchive.app.cli.validators._resolve_set_thumbnail_path", return_value=None),
-        ):
+        upload_stubs.upload_to_youtube.return_value = "yt123"
+
+        with patch("tubearchive.app.cli.validators._resolve_set_thumbnail_path", return_value=None):
             result = cmd_upload_only(args, hooks=HooksConfig(on_upload=("echo upload",)))
 
         assert result == "yt123"
-        mock_upload.assert_called_once()
+        upload_stubs.upload_to_youtube.assert_called_once()
         mock_run_hooks.assert_called_once()
         assert mock_run_hooks.call_args.args[1] == "on_upload"
         context = mock_run_hooks.call_args.kwargs["context"]
         assert context.output_path == file_path
         assert context.youtube_id == "yt123"
 
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=3600.0)
     def test_split_upload_reuses_thumbnail_for_all_parts(
         self,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
+        upload_stubs: _UploadStubs,
         tmp_path: Path,
     ) -> None:
         """분할 업로드는 모든 파트에 동일한 썸네일을 전달한다."""
-        from tubearchive.app.cli.main import _upload_split_files
-
         f1 = tmp_path / "video_001.mp4"
         f2 = tmp_path / "video_002.mp4"
         f1.touch()
@@ -2753,10 +1900,7 @@ class TestUploadOnly:
         _upload_split_files(
             split_files=[f1, f2],
             title="Test",
-            clips_info_json=(
-                '[{"name":"A.mp4","duration":3600,"start":0,"end":3600,'
-                '"device":null,"shot_time":null}]'
-            ),
+            clips_info_json=_CLIPS_JSON_ONE_HOUR,
             privacy="unlisted",
             merge_job_id=1,
             playlist_ids=None,
@@ -2764,130 +1908,37 @@ class TestUploadOnly:
             thumbnail=thumbnail,
         )
 
-        assert mock_upload.call_count == 2
-        assert all(call.kwargs["thumbnail"] == thumbnail for call in mock_upload.call_args_list)
-
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=60.0)
-    def test_malformed_clips_json_does_not_crash(
-        self,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """잘못된 clips_info_json이어도 업로드가 진행된다."""
-        from tubearchive.app.cli.main import _upload_split_files
-
-        f1 = tmp_path / "video_001.mp4"
-        f1.touch()
-
-        _upload_split_files(
-            split_files=[f1],
-            title="Test",
-            clips_info_json="not valid json {{{",
-            privacy="unlisted",
-            merge_job_id=1,
-            playlist_ids=None,
-            chunk_mb=None,
-        )
-
-        assert mock_upload.call_count == 1
-
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=60.0)
-    def test_none_clips_json_does_not_crash(
-        self,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """clips_info_json이 None이어도 업로드가 진행된다."""
-        from tubearchive.app.cli.main import _upload_split_files
-
-        f1 = tmp_path / "video_001.mp4"
-        f1.touch()
-
-        _upload_split_files(
-            split_files=[f1],
-            title="Test",
-            clips_info_json=None,
-            privacy="unlisted",
-            merge_job_id=1,
-            playlist_ids=None,
-            chunk_mb=None,
-        )
-
-        assert mock_upload.call_count == 1
-
-    @patch("tubearchive.app.cli.upload.upload_to_youtube")
-    @patch("tubearchive.app.cli.upload.probe_duration", return_value=3600.0)
-    def test_partial_upload_failure_continues(
-        self,
-        _mock_probe: MagicMock,
-        mock_upload: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """한 파트 업로드 실패 시 나머지 파트는 계속 업로드한다."""
-        from tubearchive.app.cli.main import _upload_split_files
-
-        f1 = tmp_path / "video_001.mp4"
-        f2 = tmp_path / "video_002.mp4"
-        f3 = tmp_path / "video_003.mp4"
-        f1.touch()
-        f2.touch()
-        f3.touch()
-
-        # 두 번째 호출만 실패
-        mock_upload.side_effect = [None, Exception("network error"), None]
-
-        clips_json = (
-            '[{"name":"A.mp4","duration":10800,"start":0,"end":10800,'
-            '"device":null,"shot_time":null}]'
-        )
-
-        _upload_split_files(
-            split_files=[f1, f2, f3],
-            title="Test",
-            clips_info_json=clips_json,
-            privacy="unlisted",
-            merge_job_id=1,
-            playlist_ids=None,
-            chunk_mb=None,
+        assert upload_stubs.upload_to_youtube.call_count == 2
+        assert all(
+            call.kwargs["thumbnail"] == thumbnail
+            for call in upload_stubs.upload_to_youtube.call_args_list
         )
 
-        # 3번 모두 시도 (2번째 실패해도 3번째 진행)
-        assert mock_upload.call_count == 3
-
 
 class TestTruncatePath:
     """truncate_path 유틸리티 테스트."""
 
-    def test_short_path_unchanged(self) -> None:
-        """max_len 이하 경로는 그대로 반환."""
-        assert truncate_path("/short/path", max_len=40) == "/short/path"
-
-    def test_exact_length_unchanged(self) -> None:
-        """max_len과 정확히 같은 길이는 그대로 반환."""
-        path = "x" * 40
-        assert truncate_path(path, max_len=40) == path
-
-    def test_long_path_truncated(self) -> None:
-        """max_len 초과 경로는 '...' 접두사로 말줄임."""
-        path = "/very/long/path/that/exceeds/the/maximum/length/limit.mp4"
-        result = truncate_path(path, max_len=30)
-        assert result.startswith("...")
-        assert len(result) == 30
-
-    def test_custom_max_len(self) -> None:
-        """다양한 max_len 값에서 정상 동작."""
-        path = "a" * 50
-        result = truncate_path(path, max_len=20)
-        assert len(result) == 20
-        assert result == "..." + "a" * 17
+    @pytest.mark.parametrize(
+        ("path", "max_len", "expected"),
+        [
+            ("/short/path", 40, "/short/path"),
+            ("x" * 40, 40, "x" * 40),
+            (
+                "/very/long/path/that/exceeds/the/maximum/length/limit.mp4",
+                30,
+                "...he/maximum/length/limit.mp4",
+            ),
+            ("a" * 50, 20, "..." + "a" * 17),
+            ("", 40, ""),
+        ],
+        ids=["short", "exact-length", "long", "custom-max-len", "empty"],
+    )
+    def test_truncate_path(self, path: str, max_len: int, expected: str) -> None:
+        """max_len 이하 경로는 그대로, 초과 경로는 '...' 접두사로 max_len에 맞춰 말줄임."""
+        result = truncate_path(path, max_len=max_len)
 
-    def test_empty_string(self) -> None:
-        """빈 문자열은 그대로 반환."""
-        assert truncate_path("", max_len=40) == ""
+        assert result == expected
+        assert len(result) <= max_len
 
 
 class TestTranscodeOptions:
@@ -2903,8 +1954,6 @@ class TestTranscodeOptions:
 
     def test_custom_values(self) -> None:
         """커스텀 값이 정상 할당되는지 확인."""
-        from tubearchive.domain.models.video import FadeConfig
-
         fade_map = {Path("/a.mp4"): FadeConfig(fade_in=0.3, fade_out=0.7)}
         opts = TranscodeOptions(
             denoise=True,
@@ -2978,33 +2027,33 @@ class TestDatabaseSession:
     @patch("tubearchive.app.cli.main.init_database")
     def test_yields_connection(self, mock_init: MagicMock) -> None:
         """context manager가 DB 연결 객체를 yield한다."""
-        mock_conn = MagicMock()
-        mock_init.return_value = mock_conn
+        stub_conn = _StubConnection()
+        mock_init.return_value = stub_conn
 
         with database_session() as conn:
-            assert conn is mock_conn
+            assert conn is stub_conn
 
     @patch("tubearchive.app.cli.main.init_database")
     def test_closes_connection_on_exit(self, mock_init: MagicMock) -> None:
         """블록 종료 시 DB 연결이 닫힌다."""
-        mock_conn = MagicMock()
-        mock_init.return_value = mock_conn
+        stub_conn = _StubConnection()
+        mock_init.return_value = stub_conn
 
         with database_session():
-            mock_conn.close.assert_not_called()
+            assert stub_conn.close_calls == 0
 
-        mock_conn.close.assert_called_once()
+        assert stub_conn.close_calls == 1
 
     @patch("tubearchive.app.cli.main.init_database")
     def test_closes_connection_on_exception(self, mock_init: MagicMock) -> None:
         """예외 발생 시에도 DB 연결이 닫힌다."""
-        mock_conn = MagicMock()
-        mock_init.return_value = mock_conn
+        stub_conn = _StubConnection()
+        mock_init.return_value = stub_conn
 
-        with pytest.raises(ValueError), database_session():
+        with pytest.raises(ValueError, match="test error"), database_session():
             raise ValueError("test error")
 
-        mock_conn.close.assert_called_once()
+        assert stub_conn.close_calls == 1
 
 
 class TestClipInfo:
@@ -3143,15 +2192,11 @@ class TestSaveMergeJobToDb:
         tmp_path: Path,
     ) -> None:
         """summary와 merge_job_id를 tuple로 반환한다."""
-        from tubearchive.app.cli.main import save_merge_job_to_db
-
         output_file = tmp_path / "output.mp4"
-        output_file.write_bytes(b"\x00" * 100)
+        output_file.touch()
 
-        mock_conn = MagicMock()
-        mock_repo = MagicMock()
-        mock_repo.create.return_value = 42
-        mock_db_session.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        stub_repo = SimpleNamespace(create=lambda *_args, **_kwargs: 42)
+        mock_db_session.return_value.__enter__ = MagicMock(return_value=_StubConnection())
         mock_db_session.return_value.__exit__ = MagicMock(return_value=False)
 
         clips = [
@@ -3159,7 +2204,7 @@ class TestSaveMergeJobToDb:
         ]
 
         with (
-            patch("tubearchive.app.cli.main.MergeJobRepository", return_value=mock_repo),
+            patch("tubearchive.app.cli.main.MergeJobRepository", return_value=stub_repo),
             patch(
                 "tubearchive.shared.summary_generator.generate_clip_summary",
                 return_value="## Summary",
@@ -3184,8 +2229,6 @@ class TestSaveMergeJobToDb:
         tmp_path: Path,
     ) -> None:
         """DB 저장 실패 시 (None, None)을 반환한다."""
-        from tubearchive.app.cli.main import save_merge_job_to_db
-
         mock_db_session.return_value.__enter__ = MagicMock(side_effect=Exception("DB error"))
         mock_db_session.return_value.__exit__ = MagicMock(return_value=False)
 
@@ -3200,156 +2243,102 @@ class TestSaveMergeJobToDb:
 class TestStabilizeCLI:
     """영상 안정화 CLI 인자 테스트."""
 
-    def test_stabilize_flag_parsed(self) -> None:
-        """--stabilize 플래그 파싱."""
-        parser = create_parser()
-        args = parser.parse_args(["--stabilize", "/tmp"])
-        assert args.stabilize is True
-
-    def test_stabilize_strength_parsed(self) -> None:
-        """--stabilize-strength 파싱."""
-        parser = create_parser()
-        args = parser.parse_args(["--stabilize-strength", "heavy", "/tmp"])
-        assert args.stabilize_strength == "heavy"
-
-    def test_stabilize_crop_parsed(self) -> None:
-        """--stabilize-crop 파싱."""
-        parser = create_parser()
-        args = parser.parse_args(["--stabilize-crop", "expand", "/tmp"])
-        assert args.stabilize_crop == "expand"
-
-    def test_stabilize_strength_choices(self) -> None:
-        """--stabilize-strength 유효 선택지만 허용."""
-        parser = create_parser()
-        with pytest.raises(SystemExit):
-            parser.parse_args(["--stabilize-strength", "extreme", "/tmp"])
-
-    def test_stabilize_crop_choices(self) -> None:
-        """--stabilize-crop 유효 선택지만 허용."""
-        parser = create_parser()
+    @pytest.mark.parametrize(
+        ("argv", "attr", "expected"),
+        [
+            (["--stabilize"], "stabilize", True),
+            (["--stabilize-strength", "heavy"], "stabilize_strength", "heavy"),
+            (["--stabilize-crop", "expand"], "stabilize_crop", "expand"),
+        ],
+        ids=["flag", "strength", "crop"],
+    )
+    def test_stabilize_option_parsed(
+        self, parser: argparse.ArgumentParser, argv: list[str], attr: str, expected: object
+    ) -> None:
+        """--stabilize / --stabilize-strength / --stabilize-crop 파싱."""
+        args = parser.parse_args([*argv, "/tmp"])
+        assert getattr(args, attr) == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--stabilize-strength", "extreme"],
+            ["--stabilize-crop", "zoom"],
+        ],
+        ids=["strength", "crop"],
+    )
+    def test_stabilize_option_choices(
+        self, parser: argparse.ArgumentParser, argv: list[str]
+    ) -> None:
+        """--stabilize-strength / --stabilize-crop 유효 선택지만 허용."""
         with pytest.raises(SystemExit):
-            parser.parse_args(["--stabilize-crop", "zoom", "/tmp"])
+            parser.parse_args([*argv, "/tmp"])
 
-    def test_stabilize_flag_enables_in_validate_args(self, tmp_path: Path) -> None:
+    def test_stabilize_flag_enables_in_validate_args(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """--stabilize → ValidatedArgs.stabilize=True."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _stabilize_args(existing_video, stabilize=True)
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            stabilize=True,
-            stabilize_strength=None,
-            stabilize_crop=None,
-        )
-
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.stabilize is True
         assert result.stabilize_strength == "medium"  # 기본값
         assert result.stabilize_crop == "crop"  # 기본값
 
-    def test_strength_implicit_activation(self, tmp_path: Path) -> None:
+    def test_strength_implicit_activation(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """--stabilize-strength만 지정 시 stabilize 암묵적 활성화."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            stabilize=False,
-            stabilize_strength="heavy",
-            stabilize_crop=None,
-        )
+        args = _stabilize_args(existing_video, stabilize_strength="heavy")
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.stabilize is True
         assert result.stabilize_strength == "heavy"
 
-    def test_crop_implicit_activation(self, tmp_path: Path) -> None:
+    def test_crop_implicit_activation(
+        self, existing_video: Path, cached_stat_fn: Callable[[Path], bool]
+    ) -> None:
         """--stabilize-crop만 지정 시 stabilize 암묵적 활성화."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            stabilize=False,
-            stabilize_strength=None,
-            stabilize_crop="expand",
-        )
+        args = _stabilize_args(existing_video, stabilize_crop="expand")
 
-        result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.stabilize is True
         assert result.stabilize_crop == "expand"
 
-    def test_env_stabilize_enables(self, tmp_path: Path) -> None:
+    def test_env_stabilize_enables(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+    ) -> None:
         """환경변수 TUBEARCHIVE_STABILIZE=true로 활성화."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
+        args = _stabilize_args(existing_video)
 
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            stabilize=False,
-            stabilize_strength=None,
-            stabilize_crop=None,
-        )
+        monkeypatch.setenv("TUBEARCHIVE_STABILIZE", "true")
 
-        with patch.dict("os.environ", {"TUBEARCHIVE_STABILIZE": "true"}):
-            result = validate_args(args)
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.stabilize is True
         assert result.stabilize_strength == "medium"
 
-    def test_cli_overrides_env(self, tmp_path: Path) -> None:
+    def test_cli_overrides_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        existing_video: Path,
+        cached_stat_fn: Callable[[Path], bool],
+    ) -> None:
         """CLI 인자가 환경변수를 오버라이드."""
-        video_file = tmp_path / "video.mp4"
-        video_file.touch()
-
-        args = argparse.Namespace(
-            targets=[str(video_file)],
-            output=None,
-            no_resume=False,
-            keep_temp=False,
-            dry_run=False,
-            output_dir=None,
-            parallel=None,
-            stabilize=True,
-            stabilize_strength="heavy",
-            stabilize_crop="expand",
+        args = _stabilize_args(
+            existing_video, stabilize=True, stabilize_strength="heavy", stabilize_crop="expand"
         )
 
-        with patch.dict(
-            "os.environ",
-            {
-                "TUBEARCHIVE_STABILIZE_STRENGTH": "light",
-                "TUBEARCHIVE_STABILIZE_CROP": "crop",
-            },
-        ):
-            result = validate_args(args)
+        monkeypatch.setenv("TUBEARCHIVE_STABILIZE_STRENGTH", "light")
+        monkeypatch.setenv("TUBEARCHIVE_STABILIZE_CROP", "crop")
+
+        result = validate_args(args, stat_fn=cached_stat_fn)
 
         assert result.stabilize_strength == "heavy"
         assert result.stabilize_crop == "expand"
@@ -3370,32 +2359,26 @@ class TestFormatYoutubeTitle:
     """format_youtube_title: 날짜 → 한국어 포맷 변환."""
 
     def test_converts_yyyymmdd_prefix(self) -> None:
-        from tubearchive.app.cli.upload import format_youtube_title
 
         assert format_youtube_title("20240115 도쿄 여행") == "2024년 1월 15일 도쿄 여행"
 
     def test_strips_leading_zero_from_month_and_day(self) -> None:
-        from tubearchive.app.cli.upload import format_youtube_title
 
         assert format_youtube_title("20240101") == "2024년 1월 1일"
 
     def test_date_only_no_rest(self) -> None:
-        from tubearchive.app.cli.upload import format_youtube_title
 
         assert format_youtube_title("20231225") == "2023년 12월 25일"
 
     def test_no_date_pattern_returns_original(self) -> None:
-        from tubearchive.app.cli.upload import format_youtube_title
 
         assert format_youtube_title("제주도 여행") == "제주도 여행"
 
     def test_partial_date_returns_original(self) -> None:
-        from tubearchive.app.cli.upload import format_youtube_title
 
         assert format_youtube_title("2024-01-15 여행") == "2024-01-15 여행"
 
     def test_empty_string_returns_empty(self) -> None:
-        from tubearchive.app.cli.upload import format_youtube_title
 
         assert format_youtube_title("") == ""
 
@@ -3404,35 +2387,30 @@ class TestResolvePlaylistIds:
     """resolve_playlist_ids: 플레이리스트 ID 우선순위 처리."""
 
     def test_none_arg_with_env_returns_env_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from tubearchive.app.cli.upload import resolve_playlist_ids
 
         monkeypatch.setenv("TUBEARCHIVE_YOUTUBE_PLAYLIST", "PLaaa,PLbbb")
         result = resolve_playlist_ids(None)
         assert result == ["PLaaa", "PLbbb"]
 
     def test_none_arg_without_env_returns_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from tubearchive.app.cli.upload import resolve_playlist_ids
 
         monkeypatch.delenv("TUBEARCHIVE_YOUTUBE_PLAYLIST", raising=False)
         result = resolve_playlist_ids(None)
         assert result == []
 
     def test_direct_ids_returned_as_is(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from tubearchive.app.cli.upload import resolve_playlist_ids
 
         monkeypatch.delenv("TUBEARCHIVE_YOUTUBE_PLAYLIST", raising=False)
         result = resolve_playlist_ids(["PLxxx", "PLyyy"])
         assert result == ["PLxxx", "PLyyy"]
 
     def test_empty_list_returns_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from tubearchive.app.cli.upload import resolve_playlist_ids
 
         monkeypatch.delenv("TUBEARCHIVE_YOUTUBE_PLAYLIST", raising=False)
         result = resolve_playlist_ids([])
         assert result == []
 
     def test_env_with_spaces_stripped(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from tubearchive.app.cli.upload import resolve_playlist_ids
 
         monkeypatch.setenv("TUBEARCHIVE_YOUTUBE_PLAYLIST", " PLaaa , PLbbb ")
         result = resolve_playlist_ids(None)
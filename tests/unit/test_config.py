@@ -1,13 +1,22 @@
 """설정 파일(TOML) 지원 테스트."""
 
+import functools
+import logging
 import os
+import subprocess
+import sys
 import tomllib
+from collections.abc import Iterator
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+from operator import attrgetter
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from tubearchive.config import (
+    _ENV_MAP,
+    ENV_AUTO_WHITE_BALANCE,
     ENV_STABILIZE,
     ENV_STABILIZE_CROP,
     ENV_STABILIZE_STRENGTH,
@@ -17,6 +26,8 @@ from tubearchive.config import (
     ENV_SUBTITLE_MODEL,
     ENV_TEMPLATE_INTRO,
     ENV_TEMPLATE_OUTRO,
+    ENV_VIDEO_DENOISE,
+    ENV_VIDEO_DENOISE_LEVEL,
     ENV_WATCH_LOG,
     ENV_WATCH_PATHS,
     ENV_WATCH_POLL_INTERVAL,
@@ -24,13 +35,18 @@ from tubearchive.config import (
     AppConfig,
     ColorGradingConfig,
     GeneralConfig,
-    HooksConfig,
     TemplateConfig,
     WatchConfig,
     YouTubeConfig,
+    _build_app_config,
+    _get_toml_loads,
     apply_config_to_env,
+    clear_config_cache,
     generate_default_config,
+    get_default_auto_lut,
+    get_default_auto_white_balance,
     get_default_config_path,
+    get_default_normalize_audio,
     get_default_stabilize,
     get_default_stabilize_crop,
     get_default_stabilize_strength,
@@ -40,14 +56,98 @@ from tubearchive.config import (
     get_default_subtitle_model,
     get_default_template_intro,
     get_default_template_outro,
+    get_default_video_denoise,
+    get_default_video_denoise_level,
     get_default_watch_log_path,
     get_default_watch_paths,
     get_default_watch_poll_interval,
     get_default_watch_stability_checks,
     load_config,
+    load_config_from_string,
     save_config,
 )
 
+# 여러 테스트에서 쓰는 TOML 문서 (import 시 한 번만 생성)
+_TOML_FULL = """\
+[general]
+output_dir = "/tmp/output"
+parallel = 4
+db_path = "/tmp/test.db"
+group_sequences = true
+fade_duration = 0.75
+subtitle_lang = "en"
+subtitle_model = "base"
+subtitle_format = "vtt"
+subtitle_burn = true
+
+[youtube]
+client_secrets = "/tmp/secrets.json"
+token = "/tmp/token.json"
+playlist = ["PL111", "PL222"]
+upload_chunk_mb = 64
+upload_privacy = "private"
+"""
+# 파일 기반 테스트는 미리 인코딩한 바이트를 그대로 쓴다 (텍스트 인코딩 경로 생략)
+_TOML_FULL_BYTES = _TOML_FULL.encode()
+_TOML_PARALLEL_2_BYTES = b"[general]\nparallel = 2\n"
+_TOML_COMMENT_ONLY_BYTES = "# TubeArchive 설정\n\n  # [general]\n".encode()
+
+# 파라미터화 테스트용 단일 키 TOML 템플릿 (str.format)
+_TOML_PRIVACY_TPL = '[youtube]\nupload_privacy = "{privacy}"\n'
+_TOML_DENOISE_LEVEL_TPL = '[general]\ndenoise_level = "{level}"\n'
+_TOML_HOOK_TIMEOUT_TPL = "[hooks]\ntimeout_sec = {value}\n"
+
+# 읽기 전용 파싱 테스트용: 같은 TOML 문자열은 세션당 한 번만 파싱 (AppConfig는 frozen)
+# 경고 로그나 파서 호출 여부를 확인하는 테스트는 캐시를 거치지 않도록 직접 호출한다.
+_parse = functools.lru_cache(maxsize=128)(load_config_from_string)
+
+# 섹션이 없거나 비어 있을 때 load_config가 돌려주는 공유 기본값 (frozen)
+_EMPTY_APP = AppConfig.empty()
+# frozen이므로 여러 테스트가 같은 인스턴스를 공유해도 안전
+_STABILIZE_ON_APP = AppConfig(
+    general=GeneralConfig(stabilize=True, stabilize_strength="heavy", stabilize_crop="expand")
+)
+
+# 빈 AppConfig 적용 시 주입되면 안 되는 환경변수 키
+_NONE_FIELD_ENV_KEYS = (
+    "TUBEARCHIVE_OUTPUT_DIR",
+    "TUBEARCHIVE_PARALLEL",
+    "TUBEARCHIVE_DB_PATH",
+    "TUBEARCHIVE_YOUTUBE_CLIENT_SECRETS",
+    "TUBEARCHIVE_YOUTUBE_TOKEN",
+    "TUBEARCHIVE_YOUTUBE_PLAYLIST",
+    "TUBEARCHIVE_UPLOAD_CHUNK_MB",
+    "TUBEARCHIVE_GROUP_SEQUENCES",
+    "TUBEARCHIVE_FADE_DURATION",
+)
+
+# [general] bool 필드 → 환경변수 키 (주입/보존 테스트 공용)
+_GENERAL_BOOL_ENV_CASES = [
+    ("denoise", "TUBEARCHIVE_DENOISE"),
+    ("normalize_audio", "TUBEARCHIVE_NORMALIZE_AUDIO"),
+]
+
+# 테스트 환경에서 비워 둘 환경변수 접두사
+_ENV_PREFIX = "TUBEARCHIVE_"
+
+
+@pytest.fixture(scope="session")
+def _shared_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """세션 전체에서 재사용하는 설정 파일 디렉토리 (테스트마다 mkdir/rmtree 생략)."""
+    return tmp_path_factory.mktemp("cfg")
+
+
+@pytest.fixture
+def shared_config_path(_shared_config_dir: Path) -> Iterator[Path]:
+    """공유 디렉토리의 config.toml 경로.
+
+    파일 이름이 매번 같으므로 테스트 후 파일을 지우고 load_config 캐시도 비운다.
+    """
+    path = _shared_config_dir / "config.toml"
+    yield path
+    path.unlink(missing_ok=True)
+    clear_config_cache()
+
 
 class TestGetDefaultConfigPath:
     """기본 설정 파일 경로 테스트."""
@@ -61,32 +161,25 @@ class TestGetDefaultConfigPath:
         """Path 타입 반환."""
         assert isinstance(get_default_config_path(), Path)
 
+    def test_repeated_calls_return_cached_path(self) -> None:
+        """같은 HOME에서는 캐시된 동일 객체 반환."""
+        assert get_default_config_path() is get_default_config_path()
+
+    def test_follows_home_change(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """HOME이 바뀌면 새 HOME 기준 경로 반환."""
+        get_default_config_path()
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert get_default_config_path() == tmp_path / ".tubearchive" / "config.toml"
+
 
 class TestLoadConfigNormal:
     """load_config 정상 케이스."""
 
-    def test_loads_full_config(self, tmp_path: Path) -> None:
+    def test_loads_full_config(self, shared_config_path: Path) -> None:
         """전체 필드 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[general]
-output_dir = "/tmp/output"
-parallel = 4
-db_path = "/tmp/test.db"
-group_sequences = true
-fade_duration = 0.75
-subtitle_lang = "en"
-subtitle_model = "base"
-subtitle_format = "vtt"
-subtitle_burn = true
-
-[youtube]
-client_secrets = "/tmp/secrets.json"
-token = "/tmp/token.json"
-playlist = ["PL111", "PL222"]
-upload_chunk_mb = 64
-upload_privacy = "private"
-""")
+        config_file = shared_config_path
+        config_file.write_bytes(_TOML_FULL_BYTES)
         config = load_config(config_file)
 
         assert config.general.output_dir == "/tmp/output"
@@ -100,110 +193,131 @@ upload_privacy = "private"
         assert config.general.subtitle_burn is True
         assert config.youtube.client_secrets == "/tmp/secrets.json"
         assert config.youtube.token == "/tmp/token.json"
-        assert config.youtube.playlist == ["PL111", "PL222"]
+        assert config.youtube.playlist == ("PL111", "PL222")
         assert config.youtube.upload_chunk_mb == 64
         assert config.youtube.upload_privacy == "private"
 
-    def test_loads_partial_general_only(self, tmp_path: Path) -> None:
+    def test_string_and_file_loading_match(self, shared_config_path: Path) -> None:
+        """같은 TOML이면 문자열 로드와 파일 로드 결과가 같다."""
+        shared_config_path.write_bytes(_TOML_FULL_BYTES)
+
+        assert load_config_from_string(_TOML_FULL) == load_config(shared_config_path)
+
+    def test_loads_partial_general_only(self) -> None:
         """[general] 섹션만 있는 경우."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = 2
 """)
-        config = load_config(config_file)
 
         assert config.general.parallel == 2
         assert config.general.output_dir is None
-        assert config.youtube == YouTubeConfig()
+        assert config.youtube is _EMPTY_APP.youtube
 
-    def test_loads_template_paths(self, tmp_path: Path) -> None:
+    def test_loads_template_paths(self) -> None:
         """[template] 섹션을 정상 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [template]
 intro = "/tmp/intro.mov"
 outro = "/tmp/outro.mov"
 """)
-        config = load_config(config_file)
 
         assert config.template.intro == "/tmp/intro.mov"
         assert config.template.outro == "/tmp/outro.mov"
 
-    def test_loads_template_type_error(self, tmp_path: Path) -> None:
+    def test_loads_template_type_error(self) -> None:
         """[template] 타입 오류는 None 처리."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [template]
 intro = 123
 outro = [1,2,3]
 """)
-        config = load_config(config_file)
 
         assert config.template.intro is None
         assert config.template.outro is None
 
-    def test_loads_partial_youtube_only(self, tmp_path: Path) -> None:
+    def test_loads_partial_youtube_only(self) -> None:
         """[youtube] 섹션만 있는 경우."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [youtube]
 upload_privacy = "public"
 """)
-        config = load_config(config_file)
 
-        assert config.general == GeneralConfig()
+        assert config.general is _EMPTY_APP.general
         assert config.youtube.upload_privacy == "public"
 
-    def test_loads_empty_file(self, tmp_path: Path) -> None:
+    def test_loads_empty_file(self) -> None:
         """빈 파일 → 빈 AppConfig."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("")
+        config = _parse("")
 
-        config = load_config(config_file)
+        assert config is AppConfig.empty()
 
-        assert config == AppConfig()
+    def test_comment_only_file_skips_parser(self, shared_config_path: Path) -> None:
+        """공백·주석만 있는 파일 → TOML 파서 호출 없이 빈 AppConfig."""
+        config_file = shared_config_path
+        config_file.write_bytes(_TOML_COMMENT_ONLY_BYTES)
+
+        with patch("tubearchive.config._get_toml_loads") as mock_get_loads:
+            config = load_config(config_file)
+
+        mock_get_loads.assert_not_called()
+        assert config is AppConfig.empty()
 
     def test_loads_default_path_when_none(self) -> None:
         """path=None이면 기본 경로 사용 (파일 없으면 빈 config)."""
         config = load_config(None)
         assert isinstance(config, AppConfig)
 
-    def test_playlist_single_string(self, tmp_path: Path) -> None:
+    def test_playlist_single_string(self) -> None:
         """playlist 단일 문자열도 허용."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [youtube]
 playlist = "PLsingle"
 """)
-        config = load_config(config_file)
 
-        assert config.youtube.playlist == ["PLsingle"]
+        assert config.youtube.playlist == ("PLsingle",)
 
-    def test_upload_privacy_all_values(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("privacy", ["public", "unlisted", "private"])
+    def test_upload_privacy_all_values(self, privacy: str) -> None:
         """upload_privacy 허용 값 테스트."""
-        for privacy in ("public", "unlisted", "private"):
-            config_file = tmp_path / "config.toml"
-            config_file.write_text(f"""\
-[youtube]
-upload_privacy = "{privacy}"
-""")
-            config = load_config(config_file)
-            assert config.youtube.upload_privacy == privacy
+        config = _parse(_TOML_PRIVACY_TPL.format(privacy=privacy))
+
+        assert config.youtube.upload_privacy == privacy
 
 
 class TestLoadConfigBoundary:
     """load_config 경계 케이스."""
 
-    def test_file_not_found_returns_empty(self, tmp_path: Path) -> None:
+    def test_file_not_found_returns_empty(self, shared_config_path: Path) -> None:
         """파일 없음 → 빈 AppConfig."""
-        config = load_config(tmp_path / "nonexistent.toml")
-        assert config == AppConfig()
+        config = load_config(shared_config_path)
+        assert config is AppConfig.empty()
+
+    def test_empty_results_share_one_instance(
+        self, _shared_config_dir: Path, shared_config_path: Path
+    ) -> None:
+        """파일 없음·빈 파일은 같은 기본 AppConfig 인스턴스를 공유."""
+        shared_config_path.write_bytes(b"")
+
+        missing = _shared_config_dir / "nonexistent.toml"
+        assert load_config(missing) is load_config(shared_config_path)
+
+    def test_empty_config_has_no_mutable_collections(self) -> None:
+        """공유 기본 AppConfig에는 변경 가능한 list/dict/set 필드가 없다."""
+
+        def walk(obj: object) -> Iterator[object]:
+            for f in fields(obj):  # type: ignore[arg-type]
+                value = getattr(obj, f.name)
+                yield value
+                if is_dataclass(value):
+                    yield from walk(value)
+
+        mutable = [v for v in walk(AppConfig.empty()) if isinstance(v, (list, dict, set))]
+        assert mutable == []
 
-    def test_unknown_keys_ignored(self, tmp_path: Path) -> None:
+    def test_unknown_keys_ignored(self) -> None:
         """미지 키 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = 2
 unknown_key = "value"
@@ -214,203 +328,264 @@ unknown_section_key = true
 [unknown_section]
 foo = "bar"
 """)
-        config = load_config(config_file)
 
         assert config.general.parallel == 2
 
-    def test_empty_sections(self, tmp_path: Path) -> None:
+    def test_empty_sections(self) -> None:
         """빈 섹션."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 
 [youtube]
 """)
-        config = load_config(config_file)
 
-        assert config.general == GeneralConfig()
-        assert config.youtube == YouTubeConfig()
+        assert config.general is _EMPTY_APP.general
+        assert config.youtube is _EMPTY_APP.youtube
 
-    def test_none_fields_skipped_in_env(self, tmp_path: Path) -> None:
+    def test_none_fields_skipped_in_env(self, clean_env: os._Environ[str]) -> None:
         """None 필드는 환경변수에 주입 안 됨."""
-        config = AppConfig()
-        env_snapshot = os.environ.copy()
+        apply_config_to_env(_EMPTY_APP)
+
+        # 비워 둔 환경에서 시작하므로 확인할 키만 조회하면 된다
+        injected = [key for key in _NONE_FIELD_ENV_KEYS if key in clean_env]
+        assert injected == []
 
-        apply_config_to_env(config)
 
-        # 새 환경변수가 추가되지 않았는지 확인
-        for key in (
-            "TUBEARCHIVE_OUTPUT_DIR",
-            "TUBEARCHIVE_PARALLEL",
-            "TUBEARCHIVE_DB_PATH",
-            "TUBEARCHIVE_YOUTUBE_CLIENT_SECRETS",
-            "TUBEARCHIVE_YOUTUBE_TOKEN",
-            "TUBEARCHIVE_YOUTUBE_PLAYLIST",
-            "TUBEARCHIVE_UPLOAD_CHUNK_MB",
-            "TUBEARCHIVE_GROUP_SEQUENCES",
-            "TUBEARCHIVE_FADE_DURATION",
-        ):
-            if key not in env_snapshot:
-                assert key not in os.environ, f"{key} should not be set"
+class TestLoadConfigCache:
+    """load_config 파싱 캐시."""
+
+    def test_unchanged_file_returns_cached_instance(self, shared_config_path: Path) -> None:
+        """파일이 그대로면 같은 AppConfig 인스턴스를 반환."""
+        config_file = shared_config_path
+        config_file.write_bytes(_TOML_PARALLEL_2_BYTES)
+
+        assert load_config(config_file) is load_config(config_file)
+
+    def test_modified_file_is_reparsed(self, shared_config_path: Path) -> None:
+        """mtime이 바뀌면 다시 파싱."""
+        config_file = shared_config_path
+        config_file.write_bytes(_TOML_PARALLEL_2_BYTES)
+        first = load_config(config_file)
+
+        config_file.write_bytes(b"[general]\nparallel = 3\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert first.general.parallel == 2
+        assert load_config(config_file).general.parallel == 3
+
+    def test_clear_config_cache_forces_reparse(self, shared_config_path: Path) -> None:
+        """캐시를 비우면 같은 파일도 새 인스턴스로 파싱."""
+        config_file = shared_config_path
+        config_file.write_bytes(_TOML_PARALLEL_2_BYTES)
+        first = load_config(config_file)
+
+        clear_config_cache()
+
+        second = load_config(config_file)
+        assert second is not first
+        assert second == first
+
+    def test_cached_collections_are_read_only(self, shared_config_path: Path) -> None:
+        """캐시로 공유되는 설정의 컬렉션 필드는 변경할 수 없다."""
+        shared_config_path.write_bytes(
+            b'[youtube]\nplaylist = ["PL1"]\n\n[color_grading.device_luts]\nnikon = "/a.cube"\n'
+        )
+        config = load_config(shared_config_path)
+
+        assert config.youtube.playlist == ("PL1",)
+        with pytest.raises(TypeError):
+            config.color_grading.device_luts["sony"] = "/b.cube"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            config.color_grading.device_wb["nikon"] = "daylight"  # type: ignore[index]
+        assert load_config(shared_config_path).color_grading.device_luts == {"nikon": "/a.cube"}
+
+
+class TestTomlBackend:
+    """TOML 파서 로딩."""
+
+    def test_import_does_not_load_toml_parsers(self) -> None:
+        """tubearchive.config import만으로는 TOML 파서 모듈을 로드하지 않는다."""
+        code = (
+            "import sys, tubearchive.config; "
+            "print(sorted({'tomllib', 'tomlkit'} & sys.modules.keys()))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_uses_stdlib_tomllib(self) -> None:
+        """설정 파싱은 표준 tomllib을 사용."""
+        assert _get_toml_loads() is tomllib.loads
 
 
 class TestLoadConfigError:
     """load_config 오류 케이스."""
 
-    def test_invalid_toml_syntax(self, tmp_path: Path) -> None:
+    def test_invalid_toml_syntax(self) -> None:
         """잘못된 TOML 문법 → warning + 빈 AppConfig."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("invalid [[ toml syntax !!!")
+        config = load_config_from_string("invalid [[ toml syntax !!!")
+
+        assert config is AppConfig.empty()
+
+    def test_invalid_toml_file_warns_with_path(
+        self, shared_config_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """파일 경로로 로드하면 문법 오류 경고에 파일 경로가 표시된다."""
+        config_file = shared_config_path
+        config_file.write_bytes(b"invalid [[ toml syntax !!!")
+
+        with caplog.at_level(logging.WARNING):
+            config = load_config(config_file)
+
+        assert config is AppConfig.empty()
+        assert str(config_file) in caplog.text
+
+    def test_invalid_utf8_returns_empty(self, shared_config_path: Path) -> None:
+        """UTF-8이 아닌 파일 → warning + 빈 AppConfig."""
+        config_file = shared_config_path
+        config_file.write_bytes(b'[general]\noutput_dir = "\xff"\n')
 
         config = load_config(config_file)
 
-        assert config == AppConfig()
+        assert config is AppConfig.empty()
 
-    def test_type_error_parallel_string(self, tmp_path: Path) -> None:
+    def test_type_error_parallel_string(self) -> None:
         """parallel 타입 오류 (str) → 해당 필드 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = "abc"
 output_dir = "/valid/path"
 """)
-        config = load_config(config_file)
 
         assert config.general.parallel is None
         assert config.general.output_dir == "/valid/path"
 
-    def test_type_error_output_dir_int(self, tmp_path: Path) -> None:
+    def test_type_error_output_dir_int(self) -> None:
         """output_dir 타입 오류 (int) → 해당 필드 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 output_dir = 123
 """)
-        config = load_config(config_file)
 
         assert config.general.output_dir is None
 
-    def test_type_error_upload_chunk_string(self, tmp_path: Path) -> None:
+    def test_type_error_upload_chunk_string(self) -> None:
         """upload_chunk_mb 타입 오류 (str) → 해당 필드 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [youtube]
 upload_chunk_mb = "big"
 client_secrets = "/valid/path"
 """)
-        config = load_config(config_file)
 
         assert config.youtube.upload_chunk_mb is None
         assert config.youtube.client_secrets == "/valid/path"
 
-    def test_invalid_upload_privacy_value(self, tmp_path: Path) -> None:
+    def test_invalid_upload_privacy_value(self) -> None:
         """upload_privacy 허용되지 않는 값 → 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [youtube]
 upload_privacy = "secret"
 """)
-        config = load_config(config_file)
 
         assert config.youtube.upload_privacy is None
 
-    def test_permission_error(self, tmp_path: Path) -> None:
-        """권한 오류 → 빈 AppConfig."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("[general]\nparallel = 2\n")
-        config_file.chmod(0o000)
+    def test_permission_error(
+        self, shared_config_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """권한 오류 → 빈 AppConfig.
 
-        try:
-            config = load_config(config_file)
-            assert config == AppConfig()
-        finally:
-            config_file.chmod(0o644)
+        chmod는 root 실행 환경에서 접근을 막지 못하므로 읽기 자체를 실패시킨다.
+        """
+        config_file = shared_config_path
+        config_file.write_bytes(_TOML_PARALLEL_2_BYTES)
+
+        def _deny(_path: Path) -> bytes:
+            raise PermissionError(13, "Permission denied")
+
+        monkeypatch.setattr("tubearchive.config._read_toml_bytes", _deny)
 
-    def test_parallel_bool_ignored(self, tmp_path: Path) -> None:
-        """parallel에 bool 값 → 무시 (TOML에서 bool은 int 서브클래스)."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[general]
-parallel = true
-""")
         config = load_config(config_file)
 
+        assert config is AppConfig.empty()
+
+    def test_parallel_bool_ignored(self) -> None:
+        """parallel에 bool 값 → 무시 (TOML에서 bool은 int 서브클래스)."""
+        config = _build_app_config({"general": {"parallel": True}})
+
         assert config.general.parallel is None
 
 
+@pytest.fixture(scope="module")
+def full_config() -> AppConfig:
+    """모든 주입 대상 필드를 채운 AppConfig (모듈 단위 공유, frozen)."""
+    return AppConfig(
+        general=GeneralConfig(
+            output_dir="/tmp/out",
+            parallel=4,
+            db_path="/tmp/db.sqlite",
+            group_sequences=False,
+            fade_duration=0.25,
+            subtitle_lang="en",
+            subtitle_model="base",
+            subtitle_format="vtt",
+            subtitle_burn=False,
+        ),
+        youtube=YouTubeConfig(
+            client_secrets="/tmp/secrets.json",
+            token="/tmp/token.json",
+            playlist=("PL111", "PL222"),
+            upload_chunk_mb=64,
+        ),
+    )
+
+
+@pytest.fixture
+def clean_env() -> Iterator[os._Environ[str]]:
+    """TUBEARCHIVE_* 환경변수를 모두 비운 os.environ (테스트 후 자동 복원).
+
+    전체 환경을 스냅샷/복원하지 않고 TUBEARCHIVE_* 키만 저장·복원한다.
+    테스트 중 새로 주입된 키도 정리되므로 다음 테스트로 새지 않는다.
+    """
+    saved = {key: value for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)}
+    for key in saved:
+        del os.environ[key]
+    yield os.environ
+    for key in [key for key in os.environ if key.startswith(_ENV_PREFIX)]:
+        del os.environ[key]
+    os.environ.update(saved)
+
+
 class TestApplyConfigToEnv:
     """apply_config_to_env 테스트."""
 
-    def test_injects_all_fields(self) -> None:
-        """모든 필드 환경변수 주입."""
-        config = AppConfig(
-            general=GeneralConfig(
-                output_dir="/tmp/out",
-                parallel=4,
-                db_path="/tmp/db.sqlite",
-                group_sequences=False,
-                fade_duration=0.25,
-                subtitle_lang="en",
-                subtitle_model="base",
-                subtitle_format="vtt",
-                subtitle_burn=False,
-            ),
-            youtube=YouTubeConfig(
-                client_secrets="/tmp/secrets.json",
-                token="/tmp/token.json",
-                playlist=["PL111", "PL222"],
-                upload_chunk_mb=64,
-            ),
-        )
+    def test_env_map_keys_are_unique(self) -> None:
+        """매핑 테이블의 환경변수 키는 중복되지 않는다."""
+        keys = [env_key for _, env_key, _ in _ENV_MAP]
 
-        # 테스트 대상 환경변수 모두 제거
-        env_keys = [
-            "TUBEARCHIVE_OUTPUT_DIR",
-            "TUBEARCHIVE_PARALLEL",
-            "TUBEARCHIVE_DB_PATH",
-            "TUBEARCHIVE_YOUTUBE_CLIENT_SECRETS",
-            "TUBEARCHIVE_YOUTUBE_TOKEN",
-            "TUBEARCHIVE_YOUTUBE_PLAYLIST",
-            "TUBEARCHIVE_UPLOAD_CHUNK_MB",
-            "TUBEARCHIVE_GROUP_SEQUENCES",
-            "TUBEARCHIVE_FADE_DURATION",
-            "TUBEARCHIVE_TEMPLATE_INTRO",
-            "TUBEARCHIVE_TEMPLATE_OUTRO",
-            "TUBEARCHIVE_SUBTITLE_LANG",
-            "TUBEARCHIVE_SUBTITLE_MODEL",
-            "TUBEARCHIVE_SUBTITLE_FORMAT",
-            "TUBEARCHIVE_SUBTITLE_BURN",
-        ]
-        saved = {}
-        for key in env_keys:
-            saved[key] = os.environ.pop(key, None)
-
-        try:
-            apply_config_to_env(config)
-
-            assert os.environ.get("TUBEARCHIVE_OUTPUT_DIR") == "/tmp/out"
-            assert os.environ.get("TUBEARCHIVE_PARALLEL") == "4"
-            assert os.environ.get("TUBEARCHIVE_DB_PATH") == "/tmp/db.sqlite"
-            assert os.environ.get("TUBEARCHIVE_YOUTUBE_CLIENT_SECRETS") == "/tmp/secrets.json"
-            assert os.environ.get("TUBEARCHIVE_YOUTUBE_TOKEN") == "/tmp/token.json"
-            assert os.environ.get("TUBEARCHIVE_YOUTUBE_PLAYLIST") == "PL111,PL222"
-            assert os.environ.get("TUBEARCHIVE_UPLOAD_CHUNK_MB") == "64"
-            assert os.environ.get("TUBEARCHIVE_GROUP_SEQUENCES") == "false"
-            assert os.environ.get("TUBEARCHIVE_FADE_DURATION") == "0.25"
-            assert os.environ.get("TUBEARCHIVE_SUBTITLE_LANG") == "en"
-            assert os.environ.get("TUBEARCHIVE_SUBTITLE_MODEL") == "base"
-            assert os.environ.get("TUBEARCHIVE_SUBTITLE_FORMAT") == "vtt"
-            assert os.environ.get("TUBEARCHIVE_SUBTITLE_BURN") == "false"
-        finally:
-            # 환경변수 복원
-            for key in env_keys:
-                os.environ.pop(key, None)
-                if saved[key] is not None:
-                    saved_value = saved[key]
-                    assert saved_value is not None
-                    os.environ[key] = saved_value
-
-    def test_injects_watch_envs_to_env(self, tmp_path: Path) -> None:
+        assert len(keys) == len(set(keys))
+
+    def test_injects_all_fields(self, full_config: AppConfig, clean_env: os._Environ[str]) -> None:
+        """모든 필드 환경변수 주입."""
+        apply_config_to_env(full_config)
+
+        assert clean_env.get("TUBEARCHIVE_OUTPUT_DIR") == "/tmp/out"
+        assert clean_env.get("TUBEARCHIVE_PARALLEL") == "4"
+        assert clean_env.get("TUBEARCHIVE_DB_PATH") == "/tmp/db.sqlite"
+        assert clean_env.get("TUBEARCHIVE_YOUTUBE_CLIENT_SECRETS") == "/tmp/secrets.json"
+        assert clean_env.get("TUBEARCHIVE_YOUTUBE_TOKEN") == "/tmp/token.json"
+        assert clean_env.get("TUBEARCHIVE_YOUTUBE_PLAYLIST") == "PL111,PL222"
+        assert clean_env.get("TUBEARCHIVE_UPLOAD_CHUNK_MB") == "64"
+        assert clean_env.get("TUBEARCHIVE_GROUP_SEQUENCES") == "false"
+        assert clean_env.get("TUBEARCHIVE_FADE_DURATION") == "0.25"
+        assert clean_env.get("TUBEARCHIVE_SUBTITLE_LANG") == "en"
+        assert clean_env.get("TUBEARCHIVE_SUBTITLE_MODEL") == "base"
+        assert clean_env.get("TUBEARCHIVE_SUBTITLE_FORMAT") == "vtt"
+        assert clean_env.get("TUBEARCHIVE_SUBTITLE_BURN") == "false"
+
+    def test_injects_watch_envs_to_env(self, tmp_path: Path, clean_env: os._Environ[str]) -> None:
         """watch 설정이 환경변수로 주입된다."""
         watch_dir_1 = tmp_path / "watch_1"
         watch_dir_1.mkdir()
@@ -427,32 +602,14 @@ class TestApplyConfigToEnv:
             )
         )
 
-        env_keys = [
-            ENV_WATCH_PATHS,
-            ENV_WATCH_POLL_INTERVAL,
-            ENV_WATCH_STABILITY_CHECKS,
-            ENV_WATCH_LOG,
-        ]
-        saved = {}
-        for key in env_keys:
-            saved[key] = os.environ.pop(key, None)
-
-        try:
-            apply_config_to_env(config)
-
-            assert os.environ.get(ENV_WATCH_PATHS) == f"{watch_dir_1},{watch_dir_2}"
-            assert os.environ.get(ENV_WATCH_POLL_INTERVAL) == "1.75"
-            assert os.environ.get(ENV_WATCH_STABILITY_CHECKS) == "4"
-            assert os.environ.get(ENV_WATCH_LOG) == str(watch_log)
-        finally:
-            for key in env_keys:
-                os.environ.pop(key, None)
-                if saved[key] is not None:
-                    saved_value = saved[key]
-                    assert saved_value is not None
-                    os.environ[key] = saved_value
-
-    def test_template_paths_injected_to_env(self) -> None:
+        apply_config_to_env(config)
+
+        assert clean_env.get(ENV_WATCH_PATHS) == f"{watch_dir_1},{watch_dir_2}"
+        assert clean_env.get(ENV_WATCH_POLL_INTERVAL) == "1.75"
+        assert clean_env.get(ENV_WATCH_STABILITY_CHECKS) == "4"
+        assert clean_env.get(ENV_WATCH_LOG) == str(watch_log)
+
+    def test_template_paths_injected_to_env(self, clean_env: os._Environ[str]) -> None:
         """template intro/outro 경로가 환경변수로 주입된다."""
         config = AppConfig(
             template=TemplateConfig(
@@ -460,93 +617,100 @@ class TestApplyConfigToEnv:
                 outro="/tmp/template_outro.mov",
             )
         )
-        saved_intro = os.environ.pop("TUBEARCHIVE_TEMPLATE_INTRO", None)
-        saved_outro = os.environ.pop("TUBEARCHIVE_TEMPLATE_OUTRO", None)
-
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_TEMPLATE_INTRO") == "/tmp/template_intro.mov"
-            assert os.environ.get("TUBEARCHIVE_TEMPLATE_OUTRO") == "/tmp/template_outro.mov"
-        finally:
-            os.environ.pop("TUBEARCHIVE_TEMPLATE_INTRO", None)
-            os.environ.pop("TUBEARCHIVE_TEMPLATE_OUTRO", None)
-            if saved_intro is not None:
-                os.environ["TUBEARCHIVE_TEMPLATE_INTRO"] = saved_intro
-            if saved_outro is not None:
-                os.environ["TUBEARCHIVE_TEMPLATE_OUTRO"] = saved_outro
-
-    def test_preserves_existing_env(self) -> None:
-        """기존 환경변수 보존 (config 값으로 덮어쓰지 않음)."""
-        config = AppConfig(
-            general=GeneralConfig(parallel=8),
-        )
 
-        saved = os.environ.get("TUBEARCHIVE_PARALLEL")
-        os.environ["TUBEARCHIVE_PARALLEL"] = "2"
+        apply_config_to_env(config)
+
+        assert clean_env.get("TUBEARCHIVE_TEMPLATE_INTRO") == "/tmp/template_intro.mov"
+        assert clean_env.get("TUBEARCHIVE_TEMPLATE_OUTRO") == "/tmp/template_outro.mov"
+
+    def test_preserves_existing_env(
+        self, full_config: AppConfig, clean_env: os._Environ[str]
+    ) -> None:
+        """기존 환경변수 보존 (config 값으로 덮어쓰지 않음)."""
+        clean_env["TUBEARCHIVE_PARALLEL"] = "2"
 
-        try:
-            apply_config_to_env(config)
+        apply_config_to_env(full_config)
 
-            # 기존 값 "2"가 보존되어야 함
-            assert os.environ.get("TUBEARCHIVE_PARALLEL") == "2"
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_PARALLEL"] = saved
-            else:
-                os.environ.pop("TUBEARCHIVE_PARALLEL", None)
+        # 기존 값 "2"가 보존되어야 함
+        assert clean_env.get("TUBEARCHIVE_PARALLEL") == "2"
 
-    def test_overwrites_existing_env_when_requested(self) -> None:
+    def test_overwrites_existing_env_when_requested(self, clean_env: os._Environ[str]) -> None:
         """reload용으로 기존 환경변수를 강제 덮어쓴다."""
         config = AppConfig(
             general=GeneralConfig(parallel=8),
         )
+        clean_env["TUBEARCHIVE_PARALLEL"] = "2"
 
-        os.environ["TUBEARCHIVE_PARALLEL"] = "2"
-
-        try:
-            apply_config_to_env(config, overwrite=True)
+        apply_config_to_env(config, overwrite=True)
 
-            assert os.environ.get("TUBEARCHIVE_PARALLEL") == "8"
-        finally:
-            os.environ.pop("TUBEARCHIVE_PARALLEL", None)
+        assert clean_env.get("TUBEARCHIVE_PARALLEL") == "8"
 
-    def test_playlist_csv_conversion(self) -> None:
+    def test_playlist_csv_conversion(
+        self, full_config: AppConfig, clean_env: os._Environ[str]
+    ) -> None:
         """playlist 리스트 → CSV 변환."""
-        config = AppConfig(
-            youtube=YouTubeConfig(playlist=["PL1", "PL2", "PL3"]),
-        )
+        apply_config_to_env(full_config)
 
-        saved = os.environ.pop("TUBEARCHIVE_YOUTUBE_PLAYLIST", None)
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_YOUTUBE_PLAYLIST") == "PL1,PL2,PL3"
-        finally:
-            os.environ.pop("TUBEARCHIVE_YOUTUBE_PLAYLIST", None)
-            if saved is not None:
-                os.environ["TUBEARCHIVE_YOUTUBE_PLAYLIST"] = saved
+        assert clean_env.get("TUBEARCHIVE_YOUTUBE_PLAYLIST") == "PL111,PL222"
 
-    def test_empty_playlist_not_injected(self) -> None:
+    def test_empty_playlist_not_injected(self, clean_env: os._Environ[str]) -> None:
         """빈 playlist는 환경변수에 주입 안 됨."""
         config = AppConfig(
-            youtube=YouTubeConfig(playlist=[]),
+            youtube=YouTubeConfig(playlist=()),
         )
 
-        saved = os.environ.pop("TUBEARCHIVE_YOUTUBE_PLAYLIST", None)
-        try:
-            apply_config_to_env(config)
-            assert "TUBEARCHIVE_YOUTUBE_PLAYLIST" not in os.environ
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_YOUTUBE_PLAYLIST"] = saved
+        apply_config_to_env(config)
 
-    def test_auto_white_balance_injected_to_env(self) -> None:
-        """auto_white_balance=True → 환경변수 주입."""
-        from tubearchive.config import ENV_AUTO_WHITE_BALANCE
+        assert "TUBEARCHIVE_YOUTUBE_PLAYLIST" not in clean_env
+
+    @pytest.mark.parametrize(("field", "env_key"), _GENERAL_BOOL_ENV_CASES)
+    @pytest.mark.parametrize("value", [True, False])
+    def test_general_bool_env_injection(
+        self, clean_env: os._Environ[str], field: str, env_key: str, value: bool
+    ) -> None:
+        """[general] bool 필드 → "true"/"false" 주입."""
+        config = AppConfig(general=GeneralConfig(**{field: value}))
 
+        apply_config_to_env(config)
+
+        assert clean_env.get(env_key) == str(value).lower()
+
+    @pytest.mark.parametrize(("field", "env_key"), _GENERAL_BOOL_ENV_CASES)
+    def test_general_bool_env_preserves_existing(
+        self, clean_env: os._Environ[str], field: str, env_key: str
+    ) -> None:
+        """[general] bool 필드도 기존 환경변수를 덮어쓰지 않는다."""
+        config = AppConfig(general=GeneralConfig(**{field: True}))
+        clean_env[env_key] = "false"
+
+        apply_config_to_env(config)
+
+        assert clean_env.get(env_key) == "false"
+
+    def test_auto_white_balance_injected_to_env(self, clean_env: os._Environ[str]) -> None:
+        """auto_white_balance=True → 환경변수 주입."""
         config = AppConfig(color_grading=ColorGradingConfig(auto_white_balance=True))
-        with patch.dict(os.environ, {}, clear=True):
-            apply_config_to_env(config)
-            assert os.environ.get(ENV_AUTO_WHITE_BALANCE) == "true"
+
+        apply_config_to_env(config)
+
+        assert clean_env.get(ENV_AUTO_WHITE_BALANCE) == "true"
+
+
+@functools.cache
+def _uncommented_template() -> str:
+    """기본 템플릿의 "# key = value" 줄을 주석 해제한 TOML (템플릿은 상수라 한 번만 계산)."""
+    lines = []
+    for line in generate_default_config().splitlines():
+        stripped = line.lstrip()
+        if stripped.startswith("# ") and "=" in stripped:
+            # "# key = value" → "key = value"
+            lines.append(stripped[2:])
+        elif stripped.startswith("#"):
+            # 순수 주석은 스킵
+            continue
+        else:
+            lines.append(line)
+    return "\n".join(lines)
 
 
 class TestGenerateDefaultConfig:
@@ -596,23 +760,8 @@ class TestGenerateDefaultConfig:
 
     def test_template_is_valid_toml_when_uncommented(self) -> None:
         """주석 해제 시 유효한 TOML."""
-        template = generate_default_config()
-        # 주석 해제
-        lines = []
-        for line in template.splitlines():
-            stripped = line.lstrip()
-            if stripped.startswith("# ") and "=" in stripped:
-                # "# key = value" → "key = value"
-                lines.append(stripped[2:])
-            elif stripped.startswith("#"):
-                # 순수 주석은 스킵
-                continue
-            else:
-                lines.append(line)
-
-        toml_str = "\n".join(lines)
-        # 파싱 가능해야 함
-        parsed = tomllib.loads(toml_str)
+        parsed = tomllib.loads(_uncommented_template())
+
         assert "general" in parsed
         assert "youtube" in parsed
         assert "watch" in parsed
@@ -667,24 +816,21 @@ class TestWatchConfigDefaults:
         with patch.dict(os.environ, {ENV_WATCH_PATHS: f"{dir_1}, {dir_2}"}):
             assert get_default_watch_paths() == (str(dir_1), str(dir_2))
 
-    def test_get_default_watch_paths_empty(self) -> None:
+    def test_get_default_watch_paths_empty(self, clean_env: os._Environ[str]) -> None:
         """watch 경로 미설정 시 빈 tuple."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert get_default_watch_paths() == ()
+        assert get_default_watch_paths() == ()
 
-    def test_get_default_watch_poll_interval(self) -> None:
+    def test_get_default_watch_poll_interval(self, clean_env: os._Environ[str]) -> None:
         """watch poll_interval 기본값/검증 동작."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert get_default_watch_poll_interval() == 1.0
+        assert get_default_watch_poll_interval() == 1.0
         with patch.dict(os.environ, {ENV_WATCH_POLL_INTERVAL: "2.5"}):
             assert get_default_watch_poll_interval() == 2.5
         with patch.dict(os.environ, {ENV_WATCH_POLL_INTERVAL: "0"}):
             assert get_default_watch_poll_interval() == 1.0
 
-    def test_get_default_watch_stability_checks(self) -> None:
+    def test_get_default_watch_stability_checks(self, clean_env: os._Environ[str]) -> None:
         """watch stability_checks 기본값/검증 동작."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert get_default_watch_stability_checks() == 2
+        assert get_default_watch_stability_checks() == 2
         with patch.dict(os.environ, {ENV_WATCH_STABILITY_CHECKS: "4"}):
             assert get_default_watch_stability_checks() == 4
         with patch.dict(os.environ, {ENV_WATCH_STABILITY_CHECKS: "0"}):
@@ -696,316 +842,176 @@ class TestWatchConfigDefaults:
         with patch.dict(os.environ, {ENV_WATCH_LOG: str(log_path)}):
             assert get_default_watch_log_path() == log_path
 
+    def test_toml_watch_bool_values_rejected(self) -> None:
+        """[watch] 숫자 필드에 bool 값은 타입 오류로 무시."""
+        config = _build_app_config({"watch": {"poll_interval": True, "stability_checks": True}})
+
+        assert config.watch.poll_interval is None
+        assert config.watch.stability_checks is None
+
 
 class TestDenoiseConfig:
     """denoise 설정 테스트."""
 
-    def test_loads_denoise_config(self, tmp_path: Path) -> None:
+    def test_loads_denoise_config(self) -> None:
         """denoise=true, denoise_level="heavy" 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 denoise = true
 denoise_level = "heavy"
 """)
-        config = load_config(config_file)
 
         assert config.general.denoise is True
         assert config.general.denoise_level == "heavy"
 
-    def test_denoise_default_none(self, tmp_path: Path) -> None:
+    def test_denoise_default_none(self) -> None:
         """미설정 시 None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = 2
 """)
-        config = load_config(config_file)
 
         assert config.general.denoise is None
         assert config.general.denoise_level is None
 
-    def test_denoise_type_error(self, tmp_path: Path) -> None:
+    def test_denoise_type_error(self) -> None:
         """denoise="yes" → 타입 경고 + None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 denoise = "yes"
 """)
-        config = load_config(config_file)
 
         assert config.general.denoise is None
 
-    def test_denoise_level_invalid_value(self, tmp_path: Path) -> None:
+    def test_denoise_level_invalid_value(self) -> None:
         """denoise_level="extreme" → 경고 + None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 denoise_level = "extreme"
 """)
-        config = load_config(config_file)
 
         assert config.general.denoise_level is None
 
-    def test_denoise_env_injection(self) -> None:
-        """apply_config_to_env로 환경변수 주입 확인."""
-        config = AppConfig(
-            general=GeneralConfig(denoise=True, denoise_level="heavy"),
-        )
-
-        env_keys = ["TUBEARCHIVE_DENOISE", "TUBEARCHIVE_DENOISE_LEVEL"]
-        saved = {k: os.environ.pop(k, None) for k in env_keys}
-
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_DENOISE") == "true"
-            assert os.environ.get("TUBEARCHIVE_DENOISE_LEVEL") == "heavy"
-        finally:
-            for k in env_keys:
-                os.environ.pop(k, None)
-                if saved[k] is not None:
-                    saved_value = saved[k]
-                    assert saved_value is not None
-                    os.environ[k] = saved_value
-
-    def test_denoise_env_preserves_existing(self) -> None:
-        """기존 환경변수 미덮어쓰기."""
+    def test_denoise_level_env_injection(self, clean_env: os._Environ[str]) -> None:
+        """apply_config_to_env로 denoise_level 환경변수 주입 확인."""
         config = AppConfig(
             general=GeneralConfig(denoise=True, denoise_level="heavy"),
         )
 
-        saved_denoise = os.environ.get("TUBEARCHIVE_DENOISE")
-        saved_level = os.environ.get("TUBEARCHIVE_DENOISE_LEVEL")
-        os.environ["TUBEARCHIVE_DENOISE"] = "false"
-        os.environ["TUBEARCHIVE_DENOISE_LEVEL"] = "light"
-
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_DENOISE") == "false"
-            assert os.environ.get("TUBEARCHIVE_DENOISE_LEVEL") == "light"
-        finally:
-            for k, v in [
-                ("TUBEARCHIVE_DENOISE", saved_denoise),
-                ("TUBEARCHIVE_DENOISE_LEVEL", saved_level),
-            ]:
-                if v is not None:
-                    os.environ[k] = v
-                else:
-                    os.environ.pop(k, None)
-
-    def test_denoise_false_env_injection(self) -> None:
-        """denoise=False → "false" 주입."""
-        config = AppConfig(
-            general=GeneralConfig(denoise=False),
-        )
+        apply_config_to_env(config)
 
-        saved = os.environ.pop("TUBEARCHIVE_DENOISE", None)
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_DENOISE") == "false"
-        finally:
-            os.environ.pop("TUBEARCHIVE_DENOISE", None)
-            if saved is not None:
-                os.environ["TUBEARCHIVE_DENOISE"] = saved
+        assert clean_env.get("TUBEARCHIVE_DENOISE_LEVEL") == "heavy"
 
-    def test_denoise_level_all_values(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("level", ["light", "medium", "heavy"])
+    def test_denoise_level_all_values(self, level: str) -> None:
         """denoise_level 허용 값 테스트 (light/medium/heavy)."""
-        for level in ("light", "medium", "heavy"):
-            config_file = tmp_path / "config.toml"
-            config_file.write_text(f"""\
-[general]
-denoise_level = "{level}"
-""")
-            config = load_config(config_file)
-            assert config.general.denoise_level == level
+        config = _parse(_TOML_DENOISE_LEVEL_TPL.format(level=level))
+
+        assert config.general.denoise_level == level
 
 
 class TestNormalizeAudioConfig:
     """normalize_audio 설정 테스트."""
 
-    def test_loads_normalize_audio_true(self, tmp_path: Path) -> None:
+    def test_loads_normalize_audio_true(self) -> None:
         """normalize_audio=true 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 normalize_audio = true
 """)
-        config = load_config(config_file)
 
         assert config.general.normalize_audio is True
 
-    def test_loads_normalize_audio_false(self, tmp_path: Path) -> None:
+    def test_loads_normalize_audio_false(self) -> None:
         """normalize_audio=false 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 normalize_audio = false
 """)
-        config = load_config(config_file)
 
         assert config.general.normalize_audio is False
 
-    def test_normalize_audio_default_none(self, tmp_path: Path) -> None:
+    def test_normalize_audio_default_none(self) -> None:
         """미설정 시 None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = 2
 """)
-        config = load_config(config_file)
 
         assert config.general.normalize_audio is None
 
-    def test_normalize_audio_type_error(self, tmp_path: Path) -> None:
+    def test_normalize_audio_type_error(self) -> None:
         """normalize_audio="yes" → 타입 경고 + None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 normalize_audio = "yes"
 """)
-        config = load_config(config_file)
 
         assert config.general.normalize_audio is None
 
-    def test_normalize_audio_env_injection(self) -> None:
-        """apply_config_to_env로 환경변수 주입 확인."""
-        config = AppConfig(
-            general=GeneralConfig(normalize_audio=True),
-        )
-
-        saved = os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_NORMALIZE_AUDIO") == "true"
-        finally:
-            os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-            if saved is not None:
-                os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = saved
-
-    def test_normalize_audio_env_preserves_existing(self) -> None:
-        """기존 환경변수 미덮어쓰기."""
-        config = AppConfig(
-            general=GeneralConfig(normalize_audio=True),
-        )
-
-        saved = os.environ.get("TUBEARCHIVE_NORMALIZE_AUDIO")
-        os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = "false"
-
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_NORMALIZE_AUDIO") == "false"
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = saved
-            else:
-                os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-
-    def test_normalize_audio_default_true(self) -> None:
+    def test_normalize_audio_default_true(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """환경변수 미설정 시 기본값 True."""
-        from tubearchive.config import get_default_normalize_audio
+        monkeypatch.delenv("TUBEARCHIVE_NORMALIZE_AUDIO", raising=False)
 
-        saved = os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-        try:
-            assert get_default_normalize_audio() is True
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = saved
+        assert get_default_normalize_audio() is True
 
-    def test_normalize_audio_env_override_false(self) -> None:
+    def test_normalize_audio_env_override_false(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """환경변수로 기본값 비활성화 가능."""
-        from tubearchive.config import get_default_normalize_audio
-
-        saved = os.environ.get("TUBEARCHIVE_NORMALIZE_AUDIO")
-        try:
-            os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = "false"
-            assert get_default_normalize_audio() is False
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = saved
-            else:
-                os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-
-    def test_normalize_audio_false_env_injection(self) -> None:
-        """normalize_audio=False → "false" 주입."""
-        config = AppConfig(
-            general=GeneralConfig(normalize_audio=False),
-        )
+        monkeypatch.setenv("TUBEARCHIVE_NORMALIZE_AUDIO", "false")
 
-        saved = os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_NORMALIZE_AUDIO") == "false"
-        finally:
-            os.environ.pop("TUBEARCHIVE_NORMALIZE_AUDIO", None)
-            if saved is not None:
-                os.environ["TUBEARCHIVE_NORMALIZE_AUDIO"] = saved
+        assert get_default_normalize_audio() is False
 
 
 class TestConfigValidation:
     """PR 리뷰 반영 검증 테스트."""
 
-    def test_playlist_mixed_type_warns(self, tmp_path: Path) -> None:
+    def test_playlist_mixed_type_warns(self) -> None:
         """playlist 혼합 타입 → 비문자열 항목 무시 경고."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [youtube]
 playlist = ["PL111", 123, "PL222"]
 """)
-        config = load_config(config_file)
 
-        assert config.youtube.playlist == ["PL111", "PL222"]
+        assert config.youtube.playlist == ("PL111", "PL222")
 
-    def test_section_not_table_warns(self, tmp_path: Path) -> None:
+    def test_section_not_table_warns(self) -> None:
         """비-dict 섹션 → 경고 + 기본값."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 general = "not a table"
 """)
-        config = load_config(config_file)
 
-        assert config.general == GeneralConfig()
+        assert config.general is _EMPTY_APP.general
 
-    def test_upload_chunk_mb_out_of_range(self, tmp_path: Path) -> None:
-        """upload_chunk_mb 범위 초과 → 경고 + None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[youtube]
-upload_chunk_mb = 999
-""")
-        config = load_config(config_file)
+    def test_empty_section_skips_parser(self) -> None:
+        """빈 섹션은 섹션 파서를 호출하지 않고 기본값 사용."""
+        with patch("tubearchive.config._parse_general") as mock_parse_general:
+            config = load_config_from_string('[general]\n\n[youtube]\nupload_privacy = "public"\n')
 
-        assert config.youtube.upload_chunk_mb is None
+        mock_parse_general.assert_not_called()
+        assert config.general is _EMPTY_APP.general
+        assert config.youtube.upload_privacy == "public"
 
-    def test_upload_chunk_mb_zero_out_of_range(self, tmp_path: Path) -> None:
-        """upload_chunk_mb = 0 → 범위 초과."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[youtube]
-upload_chunk_mb = 0
-""")
-        config = load_config(config_file)
+    @pytest.mark.parametrize("val", [0, 257, 999])
+    def test_upload_chunk_mb_out_of_range(self, val: int) -> None:
+        """upload_chunk_mb 범위(1-256) 밖 → 경고 + None."""
+        config = _build_app_config({"youtube": {"upload_chunk_mb": val}})
 
         assert config.youtube.upload_chunk_mb is None
 
-    def test_upload_chunk_mb_boundary_valid(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("val", [1, 256])
+    def test_upload_chunk_mb_boundary_valid(self, val: int) -> None:
         """upload_chunk_mb 경계값 1, 256 정상."""
-        for val in (1, 256):
-            config_file = tmp_path / "config.toml"
-            config_file.write_text(f"""\
-[youtube]
-upload_chunk_mb = {val}
-""")
-            config = load_config(config_file)
-            assert config.youtube.upload_chunk_mb == val
+        config = _build_app_config({"youtube": {"upload_chunk_mb": val}})
+
+        assert config.youtube.upload_chunk_mb == val
 
 
 class TestHooksConfig:
     """[hooks] 섹션 파서 테스트."""
 
-    def test_loads_hook_commands_and_timeout(self, tmp_path: Path) -> None:
+    def test_loads_hook_commands_and_timeout(self) -> None:
         """[hooks] 섹션을 파싱해 각 이벤트 명령과 timeout을 반영한다."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [hooks]
 timeout_sec = 120
 on_transcode = "/tmp/transcode.sh"
@@ -1014,40 +1020,27 @@ on_upload = ["/tmp/upload.sh"]
 on_error = "/tmp/error.sh"
 """)
 
-        config = load_config(config_file)
-
         assert config.hooks.timeout_sec == 120
         assert config.hooks.on_transcode == ("/tmp/transcode.sh",)
         assert config.hooks.on_merge == ("/tmp/merge_1.sh", "/tmp/merge_2.sh")
         assert config.hooks.on_upload == ("/tmp/upload.sh",)
         assert config.hooks.on_error == ("/tmp/error.sh",)
 
-    def test_hook_timeout_invalid_type_uses_default(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("value", ['"120"', "true", "-1"])
+    def test_hook_timeout_invalid_type_uses_default(self, value: str) -> None:
         """timeout_sec가 숫자 아님/비정상 값이면 기본값을 사용한다."""
-        for label, value in ("string", '"120"'), ("nonnumeric", "true"), ("negative", "-1"):
-            config_file = tmp_path / f"config_{label}.toml"
-            config_file.write_text(
-                f"""\
-[hooks]
-timeout_sec = {value}
-"""
-            )
+        config = _parse(_TOML_HOOK_TIMEOUT_TPL.format(value=value))
 
-            config = load_config(config_file)
-
-            assert config.hooks.timeout_sec == 60
+        assert config.hooks.timeout_sec == 60
 
-    def test_hooks_defaults_when_not_configured(self, tmp_path: Path) -> None:
+    def test_hooks_defaults_when_not_configured(self) -> None:
         """[hooks] 섹션이 없으면 기본 HooksConfig가 사용된다."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = 1
 """)
 
-        config = load_config(config_file)
-
-        assert config.hooks == HooksConfig()
+        assert config.hooks is _EMPTY_APP.hooks
 
     def test_generate_default_config_includes_hooks_section(self) -> None:
         """기본 템플릿에 [hooks] 섹션이 포함된다."""
@@ -1064,23 +1057,29 @@ parallel = 1
 class TestDataclassFrozen:
     """dataclass frozen 속성 테스트."""
 
-    def test_general_config_frozen(self) -> None:
-        """GeneralConfig는 불변."""
-        config = GeneralConfig(parallel=2)
-        with pytest.raises(AttributeError):
-            config.parallel = 4  # type: ignore[misc]
-
-    def test_youtube_config_frozen(self) -> None:
-        """YouTubeConfig는 불변."""
-        config = YouTubeConfig(upload_privacy="public")
-        with pytest.raises(AttributeError):
-            config.upload_privacy = "private"  # type: ignore[misc]
-
-    def test_app_config_frozen(self) -> None:
-        """AppConfig는 불변."""
-        config = AppConfig()
-        with pytest.raises(AttributeError):
-            config.general = GeneralConfig()  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        ("config", "attr", "value"),
+        [
+            (GeneralConfig(parallel=2), "parallel", 4),
+            (YouTubeConfig(upload_privacy="public"), "upload_privacy", "private"),
+            (ColorGradingConfig(auto_lut=True), "auto_lut", False),
+            (AppConfig(), "general", GeneralConfig()),
+        ],
+        ids=["general", "youtube", "color_grading", "app"],
+    )
+    def test_config_frozen(self, config: object, attr: str, value: object) -> None:
+        """설정 dataclass는 불변 (필드 대입 시 FrozenInstanceError)."""
+        with pytest.raises(FrozenInstanceError):
+            setattr(config, attr, value)
+
+    @pytest.mark.parametrize(
+        "config",
+        [GeneralConfig(), YouTubeConfig(), AppConfig()],
+        ids=["general", "youtube", "app"],
+    )
+    def test_config_uses_slots(self, config: object) -> None:
+        """설정 dataclass는 slots 기반으로 인스턴스 __dict__가 없다."""
+        assert not hasattr(config, "__dict__")
 
 
 class TestStabilizeConfig:
@@ -1088,11 +1087,9 @@ class TestStabilizeConfig:
 
     # --- get_default_stabilize ---
 
-    def test_get_default_stabilize_false_when_unset(self) -> None:
+    def test_get_default_stabilize_false_when_unset(self, clean_env: os._Environ[str]) -> None:
         """환경변수 미설정 시 False."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop(ENV_STABILIZE, None)
-            assert get_default_stabilize() is False
+        assert get_default_stabilize() is False
 
     def test_get_default_stabilize_true(self) -> None:
         """TUBEARCHIVE_STABILIZE=true → True."""
@@ -1106,17 +1103,15 @@ class TestStabilizeConfig:
 
     # --- get_default_stabilize_strength ---
 
-    def test_get_default_stabilize_strength_unset(self) -> None:
+    def test_get_default_stabilize_strength_unset(self, clean_env: os._Environ[str]) -> None:
         """환경변수 미설정 시 None."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop(ENV_STABILIZE_STRENGTH, None)
-            assert get_default_stabilize_strength() is None
+        assert get_default_stabilize_strength() is None
 
-    def test_get_default_stabilize_strength_valid(self) -> None:
+    @pytest.mark.parametrize("val", ["light", "medium", "heavy"])
+    def test_get_default_stabilize_strength_valid(self, val: str) -> None:
         """유효값(light/medium/heavy) 정상 반환."""
-        for val in ("light", "medium", "heavy"):
-            with patch.dict(os.environ, {ENV_STABILIZE_STRENGTH: val}):
-                assert get_default_stabilize_strength() == val
+        with patch.dict(os.environ, {ENV_STABILIZE_STRENGTH: val}):
+            assert get_default_stabilize_strength() == val
 
     def test_get_default_stabilize_strength_uppercase(self) -> None:
         """대문자 → 소문자 변환."""
@@ -1130,17 +1125,15 @@ class TestStabilizeConfig:
 
     # --- get_default_stabilize_crop ---
 
-    def test_get_default_stabilize_crop_unset(self) -> None:
+    def test_get_default_stabilize_crop_unset(self, clean_env: os._Environ[str]) -> None:
         """환경변수 미설정 시 None."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop(ENV_STABILIZE_CROP, None)
-            assert get_default_stabilize_crop() is None
+        assert get_default_stabilize_crop() is None
 
-    def test_get_default_stabilize_crop_valid(self) -> None:
+    @pytest.mark.parametrize("val", ["crop", "expand"])
+    def test_get_default_stabilize_crop_valid(self, val: str) -> None:
         """유효값(crop/expand) 정상 반환."""
-        for val in ("crop", "expand"):
-            with patch.dict(os.environ, {ENV_STABILIZE_CROP: val}):
-                assert get_default_stabilize_crop() == val
+        with patch.dict(os.environ, {ENV_STABILIZE_CROP: val}):
+            assert get_default_stabilize_crop() == val
 
     def test_get_default_stabilize_crop_uppercase(self) -> None:
         """대문자 → 소문자 변환."""
@@ -1154,63 +1147,44 @@ class TestStabilizeConfig:
 
     # --- TOML 파싱 ---
 
-    def test_toml_parses_stabilize_fields(self, tmp_path: Path) -> None:
+    def test_toml_parses_stabilize_fields(self) -> None:
         """TOML에서 stabilize 관련 필드 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(
+        config = _parse(
             '[general]\nstabilize = true\nstabilize_strength = "heavy"\nstabilize_crop = "expand"\n'
         )
-        config = load_config(config_file)
         assert config.general.stabilize is True
         assert config.general.stabilize_strength == "heavy"
         assert config.general.stabilize_crop == "expand"
 
-    def test_toml_invalid_stabilize_strength_ignored(self, tmp_path: Path) -> None:
-        """TOML에서 유효하지 않은 stabilize_strength → None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text('[general]\nstabilize_strength = "extreme"\n')
-        config = load_config(config_file)
-        assert config.general.stabilize_strength is None
-
-    def test_toml_invalid_stabilize_crop_ignored(self, tmp_path: Path) -> None:
-        """TOML에서 유효하지 않은 stabilize_crop → None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text('[general]\nstabilize_crop = "zoom"\n')
-        config = load_config(config_file)
-        assert config.general.stabilize_crop is None
-
-    def test_toml_stabilize_type_error_ignored(self, tmp_path: Path) -> None:
-        """TOML에서 stabilize 타입 오류 → 기본값."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text('[general]\nstabilize = "not_a_bool"\n')
-        config = load_config(config_file)
-        assert config.general.stabilize is None
+    @pytest.mark.parametrize(
+        ("toml_text", "field"),
+        [
+            ('[general]\nstabilize_strength = "extreme"\n', "general.stabilize_strength"),
+            ('[general]\nstabilize_crop = "zoom"\n', "general.stabilize_crop"),
+            ('[general]\nstabilize = "not_a_bool"\n', "general.stabilize"),
+        ],
+        ids=["invalid_strength", "invalid_crop", "stabilize_type_error"],
+    )
+    def test_toml_invalid_stabilize_value_ignored(self, toml_text: str, field: str) -> None:
+        """TOML에서 허용값 밖/타입 오류인 stabilize 필드 → None."""
+        config = _parse(toml_text)
+        assert attrgetter(field)(config) is None
 
     # --- apply_config_to_env ---
 
-    def test_apply_config_to_env_stabilize(self) -> None:
+    def test_apply_config_to_env_stabilize(self, clean_env: os._Environ[str]) -> None:
         """apply_config_to_env가 stabilize 환경변수를 설정한다."""
-        config = AppConfig(
-            general=GeneralConfig(
-                stabilize=True,
-                stabilize_strength="heavy",
-                stabilize_crop="expand",
-            )
-        )
-        with patch.dict(os.environ, {}, clear=True):
-            apply_config_to_env(config)
-            assert os.environ.get(ENV_STABILIZE) == "true"
-            assert os.environ.get(ENV_STABILIZE_STRENGTH) == "heavy"
-            assert os.environ.get(ENV_STABILIZE_CROP) == "expand"
+        apply_config_to_env(_STABILIZE_ON_APP)
+        assert clean_env.get(ENV_STABILIZE) == "true"
+        assert clean_env.get(ENV_STABILIZE_STRENGTH) == "heavy"
+        assert clean_env.get(ENV_STABILIZE_CROP) == "expand"
 
-    def test_apply_config_to_env_skips_none_stabilize(self) -> None:
+    def test_apply_config_to_env_skips_none_stabilize(self, clean_env: os._Environ[str]) -> None:
         """stabilize 값이 None이면 환경변수를 설정하지 않는다."""
-        config = AppConfig(general=GeneralConfig())
-        with patch.dict(os.environ, {}, clear=True):
-            apply_config_to_env(config)
-            assert ENV_STABILIZE not in os.environ
-            assert ENV_STABILIZE_STRENGTH not in os.environ
-            assert ENV_STABILIZE_CROP not in os.environ
+        apply_config_to_env(_EMPTY_APP)
+        assert ENV_STABILIZE not in clean_env
+        assert ENV_STABILIZE_STRENGTH not in clean_env
+        assert ENV_STABILIZE_CROP not in clean_env
 
     # --- generate_default_config ---
 
@@ -1219,48 +1193,34 @@ class TestStabilizeConfig:
         content = generate_default_config()
         assert "stabilize" in content
 
-    def test_color_grading_config_frozen(self) -> None:
-        """ColorGradingConfig는 불변."""
-        config = ColorGradingConfig(auto_lut=True)
-        with pytest.raises(AttributeError):
-            config.auto_lut = False  # type: ignore[misc]
-
 
 class TestSubtitleConfig:
     """[general] 자막 설정 테스트."""
 
-    def test_toml_parses_subtitle_general_fields(self, tmp_path: Path) -> None:
+    def test_toml_parses_subtitle_general_fields(self) -> None:
         """subtitle 관련 필드를 파싱한다."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(
-            """\
+        config = _parse("""\
 [general]
 subtitle_lang = "EN"
 subtitle_model = "base"
 subtitle_format = "vtt"
 subtitle_burn = true
-"""
-        )
-        config = load_config(config_file)
+""")
 
         assert config.general.subtitle_lang == "en"
         assert config.general.subtitle_model == "base"
         assert config.general.subtitle_format == "vtt"
         assert config.general.subtitle_burn is True
 
-    def test_toml_invalid_subtitle_model_ignored(self, tmp_path: Path) -> None:
+    def test_toml_invalid_subtitle_model_ignored(self) -> None:
         """유효하지 않은 subtitle_model은 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(
-            """\
+        config = _parse("""\
 [general]
 subtitle_model = "giant"
-"""
-        )
-        config = load_config(config_file)
+""")
         assert config.general.subtitle_model is None
 
-    def test_apply_config_to_env_subtitle_settings(self) -> None:
+    def test_apply_config_to_env_subtitle_settings(self, clean_env: os._Environ[str]) -> None:
         """자막 설정을 환경변수에 주입한다."""
         config = AppConfig(
             general=GeneralConfig(
@@ -1271,28 +1231,24 @@ subtitle_model = "giant"
             )
         )
 
-        with patch.dict(os.environ, {}, clear=True):
-            apply_config_to_env(config)
-            assert os.environ.get(ENV_SUBTITLE_LANG) == "EN"
-            assert os.environ.get(ENV_SUBTITLE_MODEL) == "base"
-            assert os.environ.get(ENV_SUBTITLE_FORMAT) == "srt"
-            assert os.environ.get(ENV_SUBTITLE_BURN) == "false"
+        apply_config_to_env(config)
+        assert clean_env.get(ENV_SUBTITLE_LANG) == "EN"
+        assert clean_env.get(ENV_SUBTITLE_MODEL) == "base"
+        assert clean_env.get(ENV_SUBTITLE_FORMAT) == "srt"
+        assert clean_env.get(ENV_SUBTITLE_BURN) == "false"
 
     def test_get_default_subtitle_lang_lowercase(self) -> None:
         """자막 언어 기본값은 소문자 정규화."""
         with patch.dict(os.environ, {ENV_SUBTITLE_LANG: "EN"}):
             assert get_default_subtitle_lang() == "en"
 
-    def test_get_default_subtitle_model_unset(self) -> None:
+    def test_get_default_subtitle_model_unset(self, clean_env: os._Environ[str]) -> None:
         """subtitle_model 미설정 시 None."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop(ENV_SUBTITLE_MODEL, None)
-            assert get_default_subtitle_model() is None
+        assert get_default_subtitle_model() is None
 
-    def test_get_default_subtitle_burn_default_false(self) -> None:
+    def test_get_default_subtitle_burn_default_false(self, clean_env: os._Environ[str]) -> None:
         """subtitle_burn 미설정 시 False."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert get_default_subtitle_burn() is False
+        assert get_default_subtitle_burn() is False
 
     def test_get_default_subtitle_format_invalid(self) -> None:
         """유효하지 않은 subtitle_format은 None."""
@@ -1303,30 +1259,19 @@ subtitle_model = "giant"
 class TestColorGradingConfig:
     """[color_grading] 섹션 파싱 테스트."""
 
-    def test_loads_auto_lut_true(self, tmp_path: Path) -> None:
-        """auto_lut=true 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[color_grading]
-auto_lut = true
-""")
-        config = load_config(config_file)
-        assert config.color_grading.auto_lut is True
-
-    def test_loads_auto_lut_false(self, tmp_path: Path) -> None:
-        """auto_lut=false 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[color_grading]
-auto_lut = false
-""")
-        config = load_config(config_file)
-        assert config.color_grading.auto_lut is False
-
-    def test_loads_device_luts(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("true", True), ("false", False), ('"yes"', None)],
+        ids=["true", "false", "type_error"],
+    )
+    def test_loads_auto_lut(self, raw: str, expected: bool | None) -> None:
+        """auto_lut bool 파싱 (문자열 등 타입 오류 → 경고 + None)."""
+        config = _parse(f"[color_grading]\nauto_lut = {raw}\n")
+        assert config.color_grading.auto_lut is expected
+
+    def test_loads_device_luts(self) -> None:
         """device_luts 중첩 테이블 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [color_grading]
 auto_lut = true
 
@@ -1334,123 +1279,94 @@ auto_lut = true
 nikon = "/path/to/nikon.cube"
 gopro = "/path/to/gopro.cube"
 """)
-        config = load_config(config_file)
         assert config.color_grading.auto_lut is True
         assert config.color_grading.device_luts == {
             "nikon": "/path/to/nikon.cube",
             "gopro": "/path/to/gopro.cube",
         }
 
-    def test_missing_section_returns_default(self, tmp_path: Path) -> None:
+    def test_missing_section_returns_default(self) -> None:
         """[color_grading] 미존재 시 기본값."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [general]
 parallel = 2
 """)
-        config = load_config(config_file)
-        assert config.color_grading == ColorGradingConfig()
+        assert config.color_grading is _EMPTY_APP.color_grading
         assert config.color_grading.auto_lut is None
         assert config.color_grading.device_luts == {}
 
-    def test_empty_section_returns_default(self, tmp_path: Path) -> None:
+    def test_empty_section_returns_default(self) -> None:
         """빈 [color_grading] → 기본값."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
+        config = _parse("""\
 [color_grading]
 """)
-        config = load_config(config_file)
+        assert config.color_grading is _EMPTY_APP.color_grading
         assert config.color_grading.auto_lut is None
         assert config.color_grading.device_luts == {}
 
-    def test_auto_lut_type_error(self, tmp_path: Path) -> None:
-        """auto_lut="yes" → 타입 경고 + None."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[color_grading]
-auto_lut = "yes"
-""")
-        config = load_config(config_file)
-        assert config.color_grading.auto_lut is None
-
-    def test_device_luts_non_string_value_ignored(self, tmp_path: Path) -> None:
-        """device_luts 값이 문자열이 아닌 경우 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[color_grading]
-[color_grading.device_luts]
-nikon = "/valid/path.cube"
-bad_entry = 123
-""")
-        config = load_config(config_file)
-        assert config.color_grading.device_luts == {"nikon": "/valid/path.cube"}
-
-    def test_device_luts_not_table_ignored(self, tmp_path: Path) -> None:
-        """device_luts가 테이블이 아닌 경우 무시."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""\
-[color_grading]
-device_luts = "not_a_table"
-""")
-        config = load_config(config_file)
-        assert config.color_grading.device_luts == {}
+    @pytest.mark.parametrize(
+        "toml_text",
+        ["[color_grading]\n", "[general]\n[youtube]\n", "[unknown]\nkey = 1\n"],
+        ids=["empty-section", "empty-sections", "unknown-section"],
+    )
+    def test_no_effective_sections_returns_empty_config(self, toml_text: str) -> None:
+        """인식하는 섹션에 내용이 없으면 공유 기본 설정 객체를 그대로 반환."""
+        assert _parse(toml_text) is AppConfig.empty()
+
+    @pytest.mark.parametrize(
+        ("toml_text", "expected"),
+        [
+            (
+                '[color_grading.device_luts]\nnikon = "/valid/path.cube"\nbad_entry = 123\n',
+                {"nikon": "/valid/path.cube"},
+            ),
+            ('[color_grading]\ndevice_luts = "not_a_table"\n', {}),
+        ],
+        ids=["non_string_value", "not_a_table"],
+    )
+    def test_device_luts_invalid_entries_ignored(
+        self, toml_text: str, expected: dict[str, str]
+    ) -> None:
+        """device_luts 값이 문자열이 아니거나 테이블이 아니면 해당 항목 무시."""
+        config = _parse(toml_text)
+        assert config.color_grading.device_luts == expected
 
-    def test_auto_lut_env_injection(self) -> None:
+    def test_auto_lut_env_injection(self, clean_env: os._Environ[str]) -> None:
         """apply_config_to_env로 auto_lut 환경변수 주입 확인."""
         config = AppConfig(
             color_grading=ColorGradingConfig(auto_lut=True),
         )
 
-        saved = os.environ.pop("TUBEARCHIVE_AUTO_LUT", None)
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_AUTO_LUT") == "true"
-        finally:
-            os.environ.pop("TUBEARCHIVE_AUTO_LUT", None)
-            if saved is not None:
-                os.environ["TUBEARCHIVE_AUTO_LUT"] = saved
+        apply_config_to_env(config)
+
+        assert clean_env.get("TUBEARCHIVE_AUTO_LUT") == "true"
 
-    def test_auto_lut_env_preserves_existing(self) -> None:
+    def test_auto_lut_env_preserves_existing(self, clean_env: os._Environ[str]) -> None:
         """기존 환경변수 미덮어쓰기."""
         config = AppConfig(
             color_grading=ColorGradingConfig(auto_lut=True),
         )
+        clean_env["TUBEARCHIVE_AUTO_LUT"] = "false"
 
-        saved = os.environ.get("TUBEARCHIVE_AUTO_LUT")
-        os.environ["TUBEARCHIVE_AUTO_LUT"] = "false"
-        try:
-            apply_config_to_env(config)
-            assert os.environ.get("TUBEARCHIVE_AUTO_LUT") == "false"
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_AUTO_LUT"] = saved
-            else:
-                os.environ.pop("TUBEARCHIVE_AUTO_LUT", None)
-
-    def test_get_default_auto_lut(self) -> None:
-        """환경변수 미설정 시 기본값 False."""
-        from tubearchive.config import get_default_auto_lut
-
-        saved = os.environ.pop("TUBEARCHIVE_AUTO_LUT", None)
-        try:
-            assert get_default_auto_lut() is False
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_AUTO_LUT"] = saved
-
-    def test_get_default_auto_lut_env_override(self) -> None:
-        """환경변수로 auto_lut 활성화."""
-        from tubearchive.config import get_default_auto_lut
-
-        saved = os.environ.get("TUBEARCHIVE_AUTO_LUT")
-        try:
-            os.environ["TUBEARCHIVE_AUTO_LUT"] = "true"
-            assert get_default_auto_lut() is True
-        finally:
-            if saved is not None:
-                os.environ["TUBEARCHIVE_AUTO_LUT"] = saved
-            else:
-                os.environ.pop("TUBEARCHIVE_AUTO_LUT", None)
+        apply_config_to_env(config)
+
+        assert clean_env.get("TUBEARCHIVE_AUTO_LUT") == "false"
+
+    @pytest.mark.parametrize(
+        ("env_value", "expected"),
+        [(None, False), ("true", True), ("false", False)],
+        ids=["unset", "true", "false"],
+    )
+    def test_get_default_auto_lut(
+        self, monkeypatch: pytest.MonkeyPatch, env_value: str | None, expected: bool
+    ) -> None:
+        """TUBEARCHIVE_AUTO_LUT 미설정 시 False, 설정 시 값에 따름."""
+        if env_value is None:
+            monkeypatch.delenv("TUBEARCHIVE_AUTO_LUT", raising=False)
+        else:
+            monkeypatch.setenv("TUBEARCHIVE_AUTO_LUT", env_value)
+
+        assert get_default_auto_lut() is expected
 
     def test_generate_default_config_includes_color_grading(self) -> None:
         """generate_default_config에 [color_grading] 섹션 포함."""
@@ -1459,32 +1375,22 @@ device_luts = "not_a_table"
         assert "auto_lut" in result
         assert "device_luts" in result
 
-    def test_loads_color_grading_auto_white_balance(self, tmp_path: Path) -> None:
+    def test_loads_color_grading_auto_white_balance(self) -> None:
         """auto_white_balance 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("[color_grading]\nauto_white_balance = true\n")
-        config = load_config(config_file)
+        config = _parse("[color_grading]\nauto_white_balance = true\n")
         assert config.color_grading.auto_white_balance is True
 
-    def test_loads_color_grading_device_wb(self, tmp_path: Path) -> None:
+    def test_loads_color_grading_device_wb(self) -> None:
         """device_wb 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text('[color_grading.device_wb]\nnikon = "daylight"\ngopro = "cloudy"\n')
-        config = load_config(config_file)
+        config = _parse('[color_grading.device_wb]\nnikon = "daylight"\ngopro = "cloudy"\n')
         assert config.color_grading.device_wb == {"nikon": "daylight", "gopro": "cloudy"}
 
-    def test_device_wb_invalid_preset_ignored(
-        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
-    ) -> None:
+    def test_device_wb_invalid_preset_ignored(self, caplog: pytest.LogCaptureFixture) -> None:
         """device_wb에 WB_PRESETS 외 값 → 해당 항목 무시 + warning."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(
-            '[color_grading.device_wb]\nnikon = "invalid_preset"\ngopro = "cloudy"\n'
-        )
-        import logging
-
         with caplog.at_level(logging.WARNING):
-            config = load_config(config_file)
+            config = load_config_from_string(
+                '[color_grading.device_wb]\nnikon = "invalid_preset"\ngopro = "cloudy"\n'
+            )
         assert "nikon" not in config.color_grading.device_wb
         assert config.color_grading.device_wb == {"gopro": "cloudy"}
         assert "invalid_preset" in caplog.text
@@ -1493,12 +1399,12 @@ device_luts = "not_a_table"
 class TestSaveConfig:
     """save_config() 테스트."""
 
-    def test_creates_new_file_from_template(self, tmp_path: Path) -> None:
+    def test_creates_new_file_from_template(self, shared_config_path: Path) -> None:
         """config.toml이 없을 때 템플릿 기반으로 신규 생성."""
-        config_file = tmp_path / "config.toml"
+        config_file = shared_config_path
         assert not config_file.exists()
 
-        config = AppConfig(youtube=YouTubeConfig(upload_privacy="public", playlist=["pl1", "pl2"]))
+        config = AppConfig(youtube=YouTubeConfig(upload_privacy="public", playlist=("pl1", "pl2")))
         saved_path = save_config(config, config_file)
 
         assert saved_path == config_file
@@ -1507,72 +1413,71 @@ class TestSaveConfig:
         assert "public" in text
         assert "pl1" in text
 
-    def test_updates_youtube_section_only(self, tmp_path: Path) -> None:
+    def test_updates_youtube_section_only(self, shared_config_path: Path) -> None:
         """[youtube] 섹션만 갱신하고 다른 섹션은 보존."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(
-            "[general]\nparallel = 4\n\n[youtube]\nupload_chunk_mb = 32\n\n"
-            '[archive]\npolicy = "keep"\n'
+        config_file = shared_config_path
+        config_file.write_bytes(
+            b"[general]\nparallel = 4\n\n[youtube]\nupload_chunk_mb = 32\n\n"
+            b'[archive]\npolicy = "keep"\n'
         )
 
-        config = AppConfig(youtube=YouTubeConfig(upload_privacy="private", playlist=["plA"]))
+        config = AppConfig(youtube=YouTubeConfig(upload_privacy="private", playlist=("plA",)))
         save_config(config, config_file)
 
         loaded = load_config(config_file)
         assert loaded.general.parallel == 4
         assert loaded.youtube.upload_privacy == "private"
-        assert loaded.youtube.playlist == ["plA"]
+        assert loaded.youtube.playlist == ("plA",)
         assert loaded.youtube.upload_chunk_mb == 32
         assert loaded.archive.policy == "keep"
 
-    def test_preserves_other_youtube_keys(self, tmp_path: Path) -> None:
+    def test_preserves_other_youtube_keys(self, shared_config_path: Path) -> None:
         """[youtube] 내 client_secrets 등 다른 키는 그대로 유지."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(
-            '[youtube]\nclient_secrets = "/my/secrets.json"\nupload_chunk_mb = 64\n'
+        config_file = shared_config_path
+        config_file.write_bytes(
+            b'[youtube]\nclient_secrets = "/my/secrets.json"\nupload_chunk_mb = 64\n'
         )
 
-        config = AppConfig(youtube=YouTubeConfig(upload_privacy="unlisted", playlist=[]))
+        config = AppConfig(youtube=YouTubeConfig(upload_privacy="unlisted", playlist=()))
         save_config(config, config_file)
 
         loaded = load_config(config_file)
         assert loaded.youtube.client_secrets == "/my/secrets.json"
         assert loaded.youtube.upload_chunk_mb == 64
 
-    def test_round_trip(self, tmp_path: Path) -> None:
+    def test_round_trip(self, shared_config_path: Path) -> None:
         """저장 후 load_config()로 다시 읽으면 같은 값."""
-        config_file = tmp_path / "config.toml"
-        config = AppConfig(youtube=YouTubeConfig(upload_privacy="public", playlist=["pl1"]))
+        config_file = shared_config_path
+        config = AppConfig(youtube=YouTubeConfig(upload_privacy="public", playlist=("pl1",)))
         save_config(config, config_file)
 
         loaded = load_config(config_file)
         assert loaded.youtube.upload_privacy == "public"
-        assert loaded.youtube.playlist == ["pl1"]
+        assert loaded.youtube.playlist == ("pl1",)
 
-    def test_empty_playlist(self, tmp_path: Path) -> None:
+    def test_empty_playlist(self, shared_config_path: Path) -> None:
         """빈 플레이리스트는 빈 배열로 저장."""
-        config_file = tmp_path / "config.toml"
-        config = AppConfig(youtube=YouTubeConfig(upload_privacy="unlisted", playlist=[]))
+        config_file = shared_config_path
+        config = AppConfig(youtube=YouTubeConfig(upload_privacy="unlisted", playlist=()))
         save_config(config, config_file)
 
         loaded = load_config(config_file)
-        assert loaded.youtube.playlist == []
+        assert loaded.youtube.playlist == ()
 
-    def test_returns_path(self, tmp_path: Path) -> None:
+    def test_returns_path(self, shared_config_path: Path) -> None:
         """저장된 파일 경로를 반환."""
-        config_file = tmp_path / "config.toml"
-        config = AppConfig()
-        result = save_config(config, config_file)
+        config_file = shared_config_path
+        result = save_config(_EMPTY_APP, config_file)
         assert result == config_file
 
     def test_uses_default_path_when_none(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, shared_config_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """path=None 이면 기본 경로를 사용."""
-        fake_path = tmp_path / "config.toml"
+        fake_path = shared_config_path
         monkeypatch.setattr("tubearchive.config.get_default_config_path", lambda: fake_path)
 
-        config = AppConfig(youtube=YouTubeConfig(upload_privacy="private", playlist=[]))
+        config = AppConfig(youtube=YouTubeConfig(upload_privacy="private", playlist=()))
         saved = save_config(config, None)
         assert saved == fake_path
         assert fake_path.exists()
@@ -1581,44 +1486,30 @@ class TestSaveConfig:
 class TestGetDefaultVideoDenoiseEnv:
     """get_default_video_denoise*, get_default_auto_white_balance 테스트."""
 
-    def test_video_denoise_default_false(self) -> None:
+    def test_video_denoise_default_false(self, clean_env: os._Environ[str]) -> None:
         """미설정 시 False 반환."""
-        from tubearchive.config import get_default_video_denoise
-
-        with patch.dict(os.environ, {}, clear=True):
-            assert get_default_video_denoise() is False
+        assert get_default_video_denoise() is False
 
     def test_video_denoise_true_from_env(self) -> None:
         """TUBEARCHIVE_VIDEO_DENOISE=true → True."""
-        from tubearchive.config import ENV_VIDEO_DENOISE, get_default_video_denoise
-
         with patch.dict(os.environ, {ENV_VIDEO_DENOISE: "true"}):
             assert get_default_video_denoise() is True
 
     def test_video_denoise_level_valid(self) -> None:
         """TUBEARCHIVE_VIDEO_DENOISE_LEVEL=heavy → 'heavy'."""
-        from tubearchive.config import ENV_VIDEO_DENOISE_LEVEL, get_default_video_denoise_level
-
         with patch.dict(os.environ, {ENV_VIDEO_DENOISE_LEVEL: "heavy"}):
             assert get_default_video_denoise_level() == "heavy"
 
     def test_video_denoise_level_invalid_returns_none(self) -> None:
         """잘못된 LEVEL → None."""
-        from tubearchive.config import ENV_VIDEO_DENOISE_LEVEL, get_default_video_denoise_level
-
         with patch.dict(os.environ, {ENV_VIDEO_DENOISE_LEVEL: "ultra"}):
             assert get_default_video_denoise_level() is None
 
-    def test_auto_white_balance_default_false(self) -> None:
+    def test_auto_white_balance_default_false(self, clean_env: os._Environ[str]) -> None:
         """미설정 시 False."""
-        from tubearchive.config import get_default_auto_white_balance
-
-        with patch.dict(os.environ, {}, clear=True):
-            assert get_default_auto_white_balance() is False
+        assert get_default_auto_white_balance() is False
 
     def test_auto_white_balance_true_from_env(self) -> None:
         """TUBEARCHIVE_AUTO_WHITE_BALANCE=true → True."""
-        from tubearchive.config import ENV_AUTO_WHITE_BALANCE, get_default_auto_white_balance
-
         with patch.dict(os.environ, {ENV_AUTO_WHITE_BALANCE: "true"}):
             assert get_default_auto_white_balance() is True
@@ -1,6 +1,7 @@
 """데이터베이스 테스트."""
 
 import sqlite3
+from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -18,6 +19,39 @@ from tubearchive.infra.db.repository import (
 from tubearchive.infra.db.schema import get_connection, get_default_db_path, init_database
 
 
+@pytest.fixture(scope="session")
+def _schema_template(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[sqlite3.Connection]:
+    """스키마·마이그레이션을 한 번만 적용한 템플릿 DB (세션 공유)."""
+    conn = init_database(tmp_path_factory.mktemp("db") / "template.db")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_conn(_schema_template: sqlite3.Connection) -> Generator[sqlite3.Connection]:
+    """템플릿을 복사한 테스트별 인메모리 DB 연결 (스키마 재생성·파일 I/O 생략)."""
+    conn = sqlite3.connect(":memory:")
+    _schema_template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_path(_schema_template: sqlite3.Connection, tmp_path: Path) -> Path:
+    """템플릿을 복제한 테스트별 DB 파일 경로 (실제 파일이 필요한 테스트용)."""
+    path = tmp_path / "test.db"
+    dst = sqlite3.connect(path)
+    try:
+        _schema_template.backup(dst)
+    finally:
+        dst.close()
+    return path
+
+
 class TestSchema:
     """스키마 테스트."""
 
@@ -73,14 +107,6 @@ class TestSchema:
 class TestVideoRepository:
     """VideoRepository 테스트."""
 
-    @pytest.fixture
-    def db_conn(self, tmp_path: Path) -> sqlite3.Connection:
-        """테스트용 DB 연결."""
-        db_path = tmp_path / "test.db"
-        conn = init_database(db_path)
-        yield conn
-        conn.close()
-
     @pytest.fixture
     def repo(self, db_conn: sqlite3.Connection) -> VideoRepository:
         """VideoRepository 인스턴스."""
@@ -265,14 +291,6 @@ class TestVideoRepository:
 class TestTranscodingJobRepository:
     """TranscodingJobRepository 테스트."""
 
-    @pytest.fixture
-    def db_conn(self, tmp_path: Path) -> sqlite3.Connection:
-        """테스트용 DB 연결."""
-        db_path = tmp_path / "test.db"
-        conn = init_database(db_path)
-        yield conn
-        conn.close()
-
     @pytest.fixture
     def video_repo(self, db_conn: sqlite3.Connection) -> VideoRepository:
         """VideoRepository 인스턴스."""
@@ -328,12 +346,12 @@ class TestTranscodingJobRepository:
     def test_update_status(self, job_repo: TranscodingJobRepository, video_id: int) -> None:
         """상태 업데이트."""
         job_id = job_repo.create(video_id)
-        job_repo.update_status(job_id, JobStatus.PROCESSING)
+        job = job_repo.update_status(job_id, JobStatus.PROCESSING)
 
-        job = job_repo.get_by_id(job_id)
         assert job is not None
         assert job.status == JobStatus.PROCESSING
         assert job.started_at is not None
+        assert job_repo.get_by_id(job_id) == job
 
     def test_update_progress(self, job_repo: TranscodingJobRepository, video_id: int) -> None:
         """진행률 업데이트."""
@@ -351,9 +369,8 @@ class TestTranscodingJobRepository:
         job_id = job_repo.create(video_id)
         temp_file = tmp_path / "output.mp4"
 
-        job_repo.mark_completed(job_id, temp_file)
+        job = job_repo.mark_completed(job_id, temp_file)
 
-        job = job_repo.get_by_id(job_id)
         assert job is not None
         assert job.status == JobStatus.COMPLETED
         assert job.progress_percent == 100
@@ -365,13 +382,29 @@ class TestTranscodingJobRepository:
         job_id = job_repo.create(video_id)
         error_msg = "FFmpeg failed"
 
-        job_repo.mark_failed(job_id, error_msg)
+        job = job_repo.mark_failed(job_id, error_msg)
 
-        job = job_repo.get_by_id(job_id)
         assert job is not None
         assert job.status == JobStatus.FAILED
         assert job.error_message == error_msg
 
+    def test_update_missing_job_returns_none(self, job_repo: TranscodingJobRepository) -> None:
+        """존재하지 않는 job_id 갱신 시 None."""
+        assert job_repo.mark_failed(999, "err") is None
+
+    def test_update_without_returning_support(
+        self, job_repo: TranscodingJobRepository, video_id: int
+    ) -> None:
+        """RETURNING 미지원 SQLite에서는 갱신 후 조회로 같은 결과를 반환."""
+        job_id = job_repo.create(video_id)
+
+        with patch("tubearchive.infra.db.repository._SQLITE_HAS_RETURNING", False):
+            job = job_repo.mark_failed(job_id, "err")
+
+        assert job is not None
+        assert job.status == JobStatus.FAILED
+        assert job == job_repo.get_by_id(job_id)
+
     def test_get_incomplete_jobs(self, job_repo: TranscodingJobRepository, video_id: int) -> None:
         """미완료 작업 조회."""
         job_id = job_repo.create(video_id)
@@ -430,8 +463,9 @@ class TestTranscodingJobRepository:
 
     def test_delete_by_video_ids(self, job_repo: TranscodingJobRepository, video_id: int) -> None:
         """video_id 목록으로 트랜스코딩 작업 일괄 삭제."""
-        job_repo.create(video_id)
-        job_repo.create(video_id)
+        with job_repo.batch():
+            job_repo.create(video_id)
+            job_repo.create(video_id)
 
         deleted = job_repo.delete_by_video_ids([video_id])
 
@@ -468,14 +502,6 @@ class TestTranscodingJobRepository:
 class TestVideoRepositoryExtended:
     """VideoRepository 추가 메서드 테스트."""
 
-    @pytest.fixture
-    def db_conn(self, tmp_path: Path) -> sqlite3.Connection:
-        """테스트용 DB 연결."""
-        db_path = tmp_path / "test.db"
-        conn = init_database(db_path)
-        yield conn
-        conn.close()
-
     @pytest.fixture
     def repo(self, db_conn: sqlite3.Connection) -> VideoRepository:
         """VideoRepository 인스턴스."""
@@ -508,15 +534,17 @@ class TestVideoRepositoryExtended:
 
     def test_count_all_with_data(self, repo: VideoRepository, tmp_path: Path) -> None:
         """영상 삽입 후 count_all 정확성."""
-        self._insert_video(repo, tmp_path, "a.mp4")
-        self._insert_video(repo, tmp_path, "b.mp4")
+        with repo.batch():
+            self._insert_video(repo, tmp_path, "a.mp4")
+            self._insert_video(repo, tmp_path, "b.mp4")
 
         assert repo.count_all() == 2
 
     def test_delete_by_ids(self, repo: VideoRepository, tmp_path: Path) -> None:
         """ID 목록으로 일괄 삭제."""
-        id1 = self._insert_video(repo, tmp_path, "a.mp4")
-        id2 = self._insert_video(repo, tmp_path, "b.mp4")
+        with repo.batch():
+            id1 = self._insert_video(repo, tmp_path, "a.mp4")
+            id2 = self._insert_video(repo, tmp_path, "b.mp4")
 
         deleted = repo.delete_by_ids([id1, id2])
 
@@ -531,14 +559,6 @@ class TestVideoRepositoryExtended:
 class TestMergeJobRepository:
     """MergeJobRepository 테스트."""
 
-    @pytest.fixture
-    def db_conn(self, tmp_path: Path) -> sqlite3.Connection:
-        """테스트용 DB 연결."""
-        db_path = tmp_path / "test.db"
-        conn = init_database(db_path)
-        yield conn
-        conn.close()
-
     @pytest.fixture
     def repo(self, db_conn: sqlite3.Connection) -> MergeJobRepository:
         """MergeJobRepository 인스턴스."""
@@ -563,9 +583,10 @@ class TestMergeJobRepository:
 
     def test_get_recent(self, repo: MergeJobRepository, tmp_path: Path) -> None:
         """최근 병합 작업 조회."""
-        repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
-        repo.create(output_path=tmp_path / "b.mp4", video_ids=[2])
-        repo.create(output_path=tmp_path / "c.mp4", video_ids=[3])
+        with repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            repo.create(output_path=tmp_path / "b.mp4", video_ids=[2])
+            repo.create(output_path=tmp_path / "c.mp4", video_ids=[3])
 
         recent = repo.get_recent(limit=2)
 
@@ -575,8 +596,9 @@ class TestMergeJobRepository:
         """전체 병합 작업 수."""
         assert repo.count_all() == 0
 
-        repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
-        repo.create(output_path=tmp_path / "b.mp4", video_ids=[2])
+        with repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            repo.create(output_path=tmp_path / "b.mp4", video_ids=[2])
 
         assert repo.count_all() == 2
 
@@ -592,17 +614,129 @@ class TestMergeJobRepository:
         assert repo.count_uploaded() == 1
 
 
-class TestSplitJobRepository:
-    """SplitJobRepository 테스트."""
+class TestRepositoryBatch:
+    """리포지토리 batch() 트랜잭션 테스트."""
 
     @pytest.fixture
-    def db_conn(self, tmp_path: Path) -> sqlite3.Connection:
+    def db_conn(self, db_path: Path) -> sqlite3.Connection:
         """테스트용 DB 연결."""
-        db_path = tmp_path / "test.db"
-        conn = init_database(db_path)
+        conn = get_connection(db_path)
         yield conn
         conn.close()
 
+    @staticmethod
+    def _count_from_other_connection(db_path: Path) -> int:
+        """별도 연결에서 커밋된 merge_jobs 수 조회."""
+        conn = get_connection(db_path)
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM merge_jobs").fetchone()[0])
+        finally:
+            conn.close()
+
+    def test_commits_once_at_block_end(
+        self, db_conn: sqlite3.Connection, db_path: Path, tmp_path: Path
+    ) -> None:
+        """블록 안의 쓰기는 블록 종료 시 한 번에 커밋."""
+        repo = MergeJobRepository(db_conn)
+
+        with repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            repo.create(output_path=tmp_path / "b.mp4", video_ids=[2])
+            assert db_conn.in_transaction
+            assert self._count_from_other_connection(db_path) == 0
+
+        assert not db_conn.in_transaction
+        assert self._count_from_other_connection(db_path) == 2
+
+    def test_rolls_back_on_error(self, db_conn: sqlite3.Connection, tmp_path: Path) -> None:
+        """블록 안에서 예외 발생 시 롤백."""
+        repo = MergeJobRepository(db_conn)
+
+        with pytest.raises(RuntimeError), repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            raise RuntimeError("boom")
+
+        assert repo.count_all() == 0
+
+    def test_nested_and_shared_across_repositories(
+        self, db_conn: sqlite3.Connection, db_path: Path, tmp_path: Path
+    ) -> None:
+        """같은 연결의 다른 리포지토리·중첩 블록은 바깥 블록에서만 커밋."""
+        merge_repo = MergeJobRepository(db_conn)
+        split_repo = SplitJobRepository(db_conn)
+
+        with merge_repo.batch():
+            merge_job_id = merge_repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            with split_repo.batch():
+                split_repo.create(
+                    merge_job_id=merge_job_id,
+                    split_criterion="duration",
+                    split_value="1h",
+                    output_files=[tmp_path / "a_001.mp4"],
+                )
+            assert self._count_from_other_connection(db_path) == 0
+
+        assert self._count_from_other_connection(db_path) == 1
+        assert len(split_repo.get_by_merge_job_id(merge_job_id)) == 1
+
+    def test_nested_error_rolls_back_inner_block_only(
+        self, db_conn: sqlite3.Connection, db_path: Path, tmp_path: Path
+    ) -> None:
+        """중첩 블록에서 예외를 잡으면 안쪽 쓰기만 롤백되고 바깥 쓰기는 커밋."""
+        repo = MergeJobRepository(db_conn)
+
+        with repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            try:
+                with repo.batch():
+                    repo.create(output_path=tmp_path / "b.mp4", video_ids=[2])
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+
+        assert self._count_from_other_connection(db_path) == 1
+        assert repo.get_by_output_path(tmp_path / "a.mp4") is not None
+        assert repo.get_by_output_path(tmp_path / "b.mp4") is None
+
+    def test_error_keeps_writes_made_before_batch(
+        self, db_conn: sqlite3.Connection, tmp_path: Path
+    ) -> None:
+        """이미 열린 트랜잭션에서 시작한 batch가 실패해도 이전 쓰기는 유지."""
+        repo = MergeJobRepository(db_conn)
+        db_conn.execute(
+            "INSERT INTO merge_jobs (output_path, video_ids) VALUES (?, ?)",
+            (str(tmp_path / "before.mp4"), "[]"),
+        )
+        assert db_conn.in_transaction
+
+        with pytest.raises(RuntimeError), repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+            raise RuntimeError("boom")
+
+        assert db_conn.in_transaction
+        assert repo.get_by_output_path(tmp_path / "before.mp4") is not None
+        assert repo.get_by_output_path(tmp_path / "a.mp4") is None
+
+    def test_commits_writes_made_before_batch(
+        self, db_conn: sqlite3.Connection, db_path: Path, tmp_path: Path
+    ) -> None:
+        """이미 열린 트랜잭션에서 시작한 batch는 정상 종료 시 함께 커밋."""
+        repo = MergeJobRepository(db_conn)
+        db_conn.execute(
+            "INSERT INTO merge_jobs (output_path, video_ids) VALUES (?, ?)",
+            (str(tmp_path / "before.mp4"), "[]"),
+        )
+
+        with repo.batch():
+            repo.create(output_path=tmp_path / "a.mp4", video_ids=[1])
+
+        assert not db_conn.in_transaction
+        assert self._count_from_other_connection(db_path) == 2
+
+
+class TestSplitJobRepository:
+    """SplitJobRepository 테스트."""
+
     @pytest.fixture
     def merge_repo(self, db_conn: sqlite3.Connection) -> MergeJobRepository:
         """MergeJobRepository 인스턴스."""
@@ -664,18 +798,19 @@ class TestSplitJobRepository:
         self, repo: SplitJobRepository, merge_job_id: int, tmp_path: Path
     ) -> None:
         """merge_job_id로 분할 작업 조회."""
-        repo.create(
-            merge_job_id=merge_job_id,
-            split_criterion="duration",
-            split_value="1h",
-            output_files=[tmp_path / "a_001.mp4"],
-        )
-        repo.create(
-            merge_job_id=merge_job_id,
-            split_criterion="size",
-            split_value="10G",
-            output_files=[tmp_path / "b_001.mp4"],
-        )
+        with repo.batch():
+            repo.create(
+                merge_job_id=merge_job_id,
+                split_criterion="duration",
+                split_value="1h",
+                output_files=[tmp_path / "a_001.mp4"],
+            )
+            repo.create(
+                merge_job_id=merge_job_id,
+                split_criterion="size",
+                split_value="10G",
+                output_files=[tmp_path / "b_001.mp4"],
+            )
 
         jobs = repo.get_by_merge_job_id(merge_job_id)
 
@@ -862,6 +997,17 @@ class TestGetConnection:
         finally:
             conn.close()
 
+    def test_wal_journal_mode_enabled(self, tmp_path: Path) -> None:
+        """WAL 저널 모드·synchronous=NORMAL 설정 확인."""
+        db_path = tmp_path / "test.db"
+        conn = get_connection(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # synchronous: 1 = NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            conn.close()
+
 
 class TestMigrationIdempotent:
     """마이그레이션 멱등성 테스트."""
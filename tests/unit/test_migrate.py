@@ -386,6 +386,26 @@ def test_insert_all_returns_stats(tmp_path: Path) -> None:
     assert stats["videos"] == 2
 
 
+def test_insert_all_counts_only_inserted_rows(tmp_path: Path) -> None:
+    """overwrite=False에서 충돌로 건너뛴 행은 삽입 건수에서 제외된다."""
+    db_path = tmp_path / "test.db"
+    conn = _make_db(db_path)
+    conn.execute("INSERT INTO videos (id, original_path, creation_time) VALUES (1, '/a.mp4', 'x')")
+
+    tables = {
+        "videos": [
+            {"id": 1, "original_path": "/a.mp4", "creation_time": "2026-01-01"},
+            {"id": 2, "original_path": "/b.mp4", "creation_time": "2026-01-01"},
+            {"id": 3, "original_path": "/c.mp4", "creation_time": "2026-01-01"},
+        ]
+    }
+    stats = _insert_all(conn, tables, overwrite=False)
+    conn.commit()
+    conn.close()
+
+    assert stats["videos"] == 2
+
+
 def test_insert_all_foreign_keys_off_allows_fk_violation(tmp_path: Path) -> None:
     """_insert_all 중 FK OFF이므로 FK 위반 행도 삽입된다."""
     db_path = tmp_path / "test.db"
@@ -6,19 +6,19 @@ import subprocess
 import urllib.error
 from datetime import UTC, datetime
 from io import BytesIO
-from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from tubearchive.config import (
+    AppConfig,
     DiscordConfig,
     MacOSNotifyConfig,
     NotificationConfig,
     SlackConfig,
     TelegramConfig,
-    load_config,
+    load_config_from_string,
 )
 from tubearchive.infra.notification.events import (
     EventType,
@@ -633,9 +633,8 @@ class TestBuildProviders:
 
 
 class TestNotificationConfigParsing:
-    def test_full_notification_config(self, tmp_path: Path) -> None:
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""
+    def test_full_notification_config(self) -> None:
+        config = load_config_from_string("""
 [notification]
 enabled = true
 on_transcode_complete = true
@@ -660,7 +659,6 @@ webhook_url = "https://discord.com/api/webhooks/123"
 enabled = true
 webhook_url = "https://hooks.slack.com/services/T/B/X"
 """)
-        config = load_config(config_file)
         n = config.notification
         assert n.enabled is True
         assert n.on_merge_complete is False
@@ -671,43 +669,51 @@ webhook_url = "https://hooks.slack.com/services/T/B/X"
         assert n.discord.webhook_url == "https://discord.com/api/webhooks/123"
         assert n.slack.webhook_url == "https://hooks.slack.com/services/T/B/X"
 
-    def test_missing_notification_section(self, tmp_path: Path) -> None:
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("[general]\n")
-        config = load_config(config_file)
+    def test_missing_notification_section(self) -> None:
+        config = load_config_from_string("[general]\n")
         n = config.notification
         assert n.enabled is None
         assert n.macos.enabled is None
 
-    def test_partial_notification_config(self, tmp_path: Path) -> None:
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""
+    def test_partial_notification_config(self) -> None:
+        config = load_config_from_string("""
 [notification]
 enabled = true
 
 [notification.macos]
 sound = false
 """)
-        config = load_config(config_file)
         n = config.notification
         assert n.enabled is True
         assert n.macos.sound is False
         assert n.macos.enabled is None  # 미지정
 
-    def test_type_errors_ignored(self, tmp_path: Path) -> None:
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""
+    def test_missing_sub_configs_share_defaults(self) -> None:
+        """지정하지 않은 하위 테이블은 공유 기본 인스턴스를 사용한다."""
+        config = load_config_from_string("""
+[notification]
+enabled = true
+
+[notification.macos]
+sound = false
+""")
+        n = config.notification
+        defaults = AppConfig.empty().notification
+        assert n.telegram is defaults.telegram
+        assert n.discord is defaults.discord
+        assert n.slack is defaults.slack
+
+    def test_type_errors_ignored(self) -> None:
+        config = load_config_from_string("""
 [notification]
 enabled = "not_a_bool"
 """)
-        config = load_config(config_file)
         # 타입 오류 시 None (무시)
         assert config.notification.enabled is None
 
-    def test_malformed_sub_config_ignored(self, tmp_path: Path) -> None:
+    def test_malformed_sub_config_ignored(self) -> None:
         """서브 설정에 잘못된 타입이 있어도 다른 설정은 정상 파싱."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text("""
+        config = load_config_from_string("""
 [notification]
 enabled = true
 
@@ -719,7 +725,6 @@ enabled = true
 bot_token = "valid_token"
 chat_id = "valid_id"
 """)
-        config = load_config(config_file)
         n = config.notification
         assert n.enabled is True
         # macos.enabled는 타입 오류로 None
@@ -21,7 +21,7 @@ import logging
 import sqlite3
 import subprocess
 import sys
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
@@ -164,15 +164,19 @@ def _interactive_select(items: Sequence[object], prompt: str) -> int | None:
         return None
 
 
-def cmd_init_config() -> None:
+def cmd_init_config(config_path: Path | None = None) -> None:
     """
     --init-config 옵션 처리.
 
     기본 설정 파일(config.toml) 템플릿을 생성합니다.
+
+    Args:
+        config_path: 생성할 설정 파일 경로 (None이면 기본 경로)
     """
     from tubearchive.config import generate_default_config, get_default_config_path
 
-    config_path = get_default_config_path()
+    if config_path is None:
+        config_path = get_default_config_path()
 
     if config_path.exists():
         response = safe_input(f"이미 존재합니다: {config_path}\n덮어쓰시겠습니까? (y/N): ")
@@ -283,27 +287,42 @@ from tubearchive.app.cli.youtube import (  # noqa: E402
 from tubearchive.domain.models.clip import ClipInfo  # noqa: E402, F401
 
 
-def main() -> None:
+def main(
+    argv: Sequence[str] | None = None,
+    *,
+    pipeline: Callable[..., Path] | None = None,
+) -> None:
     """CLI 진입점.
 
     인자를 파싱하고 설정 파일을 로드한 뒤, 요청된 서브커맨드를
     적절한 핸들러 함수로 라우팅한다. 서브커맨드가 지정되지 않은
     기본 동작은 :func:`run_pipeline` (트랜스코딩 + 병합).
+
+    Args:
+        argv: 프로그램 이름을 제외한 인자 목록 (None이면 ``sys.argv[1:]``)
+        pipeline: 기본 동작에서 호출할 파이프라인 함수 (None이면 :func:`run_pipeline`)
     """
+    argv = sys.argv[1:] if argv is None else list(argv)
+
     # argparse보다 먼저 처리: nargs="*" targets와 충돌 방지
-    if len(sys.argv) > 1 and sys.argv[1] == "tui":
+    if argv and argv[0] == "tui":
         from tubearchive.app.tui import launch_tui
 
-        path_arg = sys.argv[2] if len(sys.argv) > 2 else None
-        has_config_flag = len(sys.argv) > 3 and sys.argv[3] == "--config"
-        tui_config_path = Path(sys.argv[4]) if has_config_flag else get_default_config_path()
+        path_arg = argv[1] if len(argv) > 1 else None
+        has_config_flag = len(argv) > 2 and argv[2] == "--config"
+        tui_config_path = Path(argv[3]) if has_config_flag else get_default_config_path()
         tui_config = load_config(tui_config_path)
         apply_config_to_env(tui_config)
         launch_tui(initial_path=path_arg, config=tui_config)
         return
 
+    # 단독 --init-config는 전체 파서(100여 개 옵션) 구성 없이 바로 처리
+    if argv == ["--init-config"]:
+        cmd_init_config()
+        return
+
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # --init-config 처리 (가장 먼저, 로깅/설정 로드 전)
     if args.init_config:
@@ -444,8 +463,9 @@ def main() -> None:
             return
 
         # config의 device_luts/device_wb를 validate_args에 전달하여 초기화 시 주입
-        cfg_device_luts = config.color_grading.device_luts or None
-        cfg_device_wb = config.color_grading.device_wb or None
+        # (config 매핑은 읽기 전용이므로 dict로 복사)
+        cfg_device_luts = dict(config.color_grading.device_luts) or None
+        cfg_device_wb = dict(config.color_grading.device_wb) or None
         validated_args = validate_args(
             args,
             device_luts=cfg_device_luts,
@@ -478,7 +498,7 @@ def main() -> None:
 
         pipeline_generated_thumbnail_paths: list[Path] = []
         pipeline_generated_subtitle_paths: list[Path] = []
-        output_path = run_pipeline(
+        output_path = (pipeline or run_pipeline)(
             validated_args,
             context=PipelineContext(notifier=notifier),
             generated_thumbnail_paths=pipeline_generated_thumbnail_paths,
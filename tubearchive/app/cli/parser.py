@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
+from collections.abc import Iterator, Sequence
 from datetime import datetime
+from typing import Any
 
 from tubearchive import __version__
 from tubearchive.app.queries.catalog import CATALOG_STATUS_SENTINEL
@@ -27,6 +30,28 @@ from tubearchive.infra.ffmpeg.constants import WB_PRESETS
 logger = logging.getLogger(__name__)
 
 
+class _AppendAction(argparse._AppendAction):
+    """반복 옵션(``--exclude``, ``--thumbnail-at`` 등) 누적용 append 액션.
+
+    표준 ``action="append"``는 호출될 때마다 기존 리스트 전체를 복사하므로
+    같은 옵션을 N번 반복하면 O(N²)이 된다. 기본값 객체를 건드리지 않도록
+    첫 호출에서만 새 리스트를 만들고, 이후에는 제자리에서 append 한다.
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        items = getattr(namespace, self.dest, None)
+        if items is None or items is self.default:
+            items = list(items) if items else []
+            setattr(namespace, self.dest, items)
+        items.append(values)
+
+
 def create_parser() -> argparse.ArgumentParser:
     """
     CLI 파서 생성.
@@ -46,6 +71,30 @@ def create_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
+    with _reuse_formatter(parser):
+        _add_arguments(parser)
+    return parser
+
+
+@contextlib.contextmanager
+def _reuse_formatter(parser: argparse.ArgumentParser) -> Iterator[None]:
+    """옵션 등록 동안 HelpFormatter 하나를 재사용한다.
+
+    ``add_argument``는 metavar 검증을 위해 호출마다 ``_get_formatter()``로
+    새 HelpFormatter를 만든다 (터미널 크기·색상 환경변수 조회 포함).
+    검증에는 포매터 상태가 쓰이지 않으므로 등록 중에는 하나를 공유하고,
+    끝나면 원래 메서드로 되돌려 ``--help`` 출력은 매번 새 포매터를 쓴다.
+    """
+    formatter = parser._get_formatter()
+    parser._get_formatter = lambda: formatter  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        del parser._get_formatter
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """CLI 옵션을 ``parser``에 등록한다."""
     parser.add_argument(
         "-V",
         "--version",
@@ -102,7 +151,7 @@ def create_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         "--watch",
-        action="append",
+        action=_AppendAction,
         default=None,
         metavar="PATH",
         help=(
@@ -169,7 +218,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--playlist",
         type=str,
-        action="append",
+        action=_AppendAction,
         default=None,
         metavar="ID",
         help=(f"업로드 후 플레이리스트에 추가 (환경변수: {ENV_YOUTUBE_PLAYLIST}, 쉼표로 구분)"),
@@ -462,7 +511,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--exclude",
         type=str,
-        action="append",
+        action=_AppendAction,
         default=None,
         metavar="PATTERN",
         help="제외할 파일명 패턴 (글로브, 반복 가능, 예: 'GH*' '*.mts')",
@@ -471,7 +520,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--include-only",
         type=str,
-        action="append",
+        action=_AppendAction,
         default=None,
         metavar="PATTERN",
         help="포함할 파일명 패턴만 선택 (글로브, 반복 가능, 예: '*.mp4')",
@@ -533,7 +582,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--thumbnail-at",
         type=str,
-        action="append",
+        action=_AppendAction,
         default=None,
         metavar="TIMESTAMP",
         help="특정 시점에서 썸네일 추출 (예: '00:01:30', 반복 가능)",
@@ -900,8 +949,6 @@ def create_parser() -> argparse.ArgumentParser:
         help="메타데이터 출력 형식을 CSV로 지정",
     )
 
-    return parser
-
 
 def parse_schedule_datetime(schedule_str: str) -> str:
     """ISO 8601 형식의 날짜/시간 문자열을 파싱하고 검증한다.
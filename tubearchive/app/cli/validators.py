@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import argparse
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from tubearchive.app.cli.parser import parse_schedule_datetime
 from tubearchive.config import (
+    AppConfig,
     HooksConfig,
     get_default_auto_lut,
     get_default_auto_white_balance,
@@ -207,6 +209,8 @@ def validate_args(
     device_luts: dict[str, str] | None = None,
     device_wb: dict[str, str] | None = None,
     hooks: HooksConfig | None = None,
+    *,
+    stat_fn: Callable[[Path], bool] = Path.exists,
 ) -> ValidatedArgs:
     """CLI 인자를 검증하고 :class:`ValidatedArgs` 로 변환한다.
 
@@ -216,6 +220,7 @@ def validate_args(
 
     Args:
         args: ``argparse`` 파싱 결과
+        stat_fn: 대상·출력 경로 존재 여부 확인 함수 (테스트에서 캐시된 함수 주입용)
 
     Returns:
         타입-안전하게 검증된 인자 데이터클래스
@@ -231,7 +236,7 @@ def validate_args(
     else:
         for target in args.targets:
             path = Path(target).expanduser()
-            if not path.exists():
+            if not stat_fn(path):
                 raise FileNotFoundError(f"Target not found: {target}")
             targets.append(path)
 
@@ -239,7 +244,7 @@ def validate_args(
     output: Path | None = None
     if args.output:
         output = Path(args.output).expanduser()
-        if not output.parent.exists():
+        if not stat_fn(output.parent):
             raise FileNotFoundError(f"Output directory not found: {output.parent}")
 
     # output_dir 검증 (CLI 인자 > 환경 변수 > None)
@@ -631,7 +636,7 @@ def validate_args(
         schedule = parse_schedule_datetime(schedule_arg)
         logger.info(f"Parsed schedule time: {schedule}")
 
-    hooks_config = hooks if hooks is not None else HooksConfig()
+    hooks_config = hooks if hooks is not None else AppConfig.empty().hooks
 
     return ValidatedArgs(
         targets=targets,
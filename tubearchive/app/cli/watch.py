@@ -161,8 +161,8 @@ def _run_watch_mode(
         apply_config_to_env(updated_config, overwrite=True)
         return validate_args(
             parsed_args,
-            device_luts=updated_config.color_grading.device_luts or None,
-            device_wb=updated_config.color_grading.device_wb or None,
+            device_luts=dict(updated_config.color_grading.device_luts) or None,
+            device_wb=dict(updated_config.color_grading.device_wb) or None,
             hooks=updated_config.hooks,
         )
 
@@ -233,12 +233,9 @@ def _insert_all(
             col_list = ", ".join(cols)
             sql = f"INSERT OR {conflict} INTO {table} ({col_list}) VALUES ({placeholders})"
 
-            inserted = 0
-            for row in rows:
-                values = [row[c] for c in cols]
-                cursor = conn.execute(sql, values)
-                inserted += cursor.rowcount
-            stats[table] = inserted
+            # executemany의 rowcount는 행별 변경 수의 합 (IGNORE로 건너뛴 행은 0)
+            cursor = conn.executemany(sql, ([row[c] for c in cols] for row in rows))
+            stats[table] = cursor.rowcount
     finally:
         conn.execute("PRAGMA foreign_keys = ON")
 
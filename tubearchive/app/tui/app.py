@@ -68,7 +68,7 @@ class TubeArchiveApp(App[None]):
     ) -> None:
         super().__init__()
         self.initial_path = initial_path
-        self.config = config or AppConfig()
+        self.config = config or AppConfig.empty()
         self._initial_state: TuiOptionState | None = self._make_initial_state()
         self._youtube_applied: dict[str, object] = self._make_youtube_applied()
 
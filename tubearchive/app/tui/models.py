@@ -17,8 +17,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-import tomlkit
-
 if TYPE_CHECKING:
     from tubearchive.config import AppConfig
 
@@ -591,6 +589,8 @@ def save_state_as_defaults(state: TuiOptionState, path: Path | None = None) -> P
     - [color_grading]: auto_lut
     - [youtube]: upload_privacy
     """
+    import tomlkit
+
     from tubearchive.config import generate_default_config, get_default_config_path
 
     target = path or get_default_config_path()
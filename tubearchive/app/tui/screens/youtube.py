@@ -583,7 +583,7 @@ class YouTubePane(Widget):
         playlists = self._get_selected_playlists()
         try:
             save_config(
-                AppConfig(youtube=YouTubeConfig(upload_privacy=privacy, playlist=playlists))
+                AppConfig(youtube=YouTubeConfig(upload_privacy=privacy, playlist=tuple(playlists)))
             )
             self.app.notify("config.toml에 저장됨", timeout=3)
         except Exception as exc:
@@ -15,17 +15,25 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import os
 import tempfile
-import tomllib
-from dataclasses import dataclass, field
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import Any
 
 from tubearchive.infra.ffmpeg.constants import WB_PRESETS
 
 logger = logging.getLogger(__name__)
 
+# load_config 결과 캐시: 절대 경로 → ((st_mtime_ns, st_size, st_ino), AppConfig)
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int, int], AppConfig]] = {}
+
 # 환경변수 매핑
 ENV_OUTPUT_DIR = "TUBEARCHIVE_OUTPUT_DIR"
 ENV_PARALLEL = "TUBEARCHIVE_PARALLEL"
@@ -81,8 +89,17 @@ ENV_DISCORD_WEBHOOK_URL = "TUBEARCHIVE_DISCORD_WEBHOOK_URL"
 ENV_NOTIFY_SLACK = "TUBEARCHIVE_NOTIFY_SLACK"
 ENV_SLACK_WEBHOOK_URL = "TUBEARCHIVE_SLACK_WEBHOOK_URL"
 
+# 허용값 집합 (config.toml 파싱·환경변수 기본값 검증 공용)
+_VALID_STRENGTHS = frozenset({"light", "medium", "heavy"})
+_VALID_STABILIZE_CROPS = frozenset({"crop", "expand"})
+_VALID_SUBTITLE_MODELS = frozenset({"tiny", "base", "small", "medium", "large"})
+_VALID_SUBTITLE_FORMATS = frozenset({"srt", "vtt"})
+_VALID_UPLOAD_PRIVACY = frozenset({"public", "unlisted", "private"})
+_VALID_ARCHIVE_POLICIES = frozenset({"keep", "move", "delete"})
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneralConfig:
     """``config.toml`` 의 ``[general]`` 섹션.
 
@@ -109,7 +126,7 @@ class GeneralConfig:
     subtitle_burn: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BGMConfig:
     """``config.toml`` 의 ``[bgm]`` 섹션.
 
@@ -124,7 +141,7 @@ class BGMConfig:
     """BGM 루프 재생 여부."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YouTubeConfig:
     """``config.toml`` 의 ``[youtube]`` 섹션.
 
@@ -133,12 +150,12 @@ class YouTubeConfig:
 
     client_secrets: str | None = None
     token: str | None = None
-    playlist: list[str] = field(default_factory=list)
+    playlist: tuple[str, ...] = ()
     upload_chunk_mb: int | None = None
     upload_privacy: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateConfig:
     """``[template]`` 섹션 데이터.
 
@@ -152,7 +169,7 @@ class TemplateConfig:
     """아웃트로 영상 경로 (문자열)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchiveConfig:
     """``config.toml`` 의 ``[archive]`` 섹션.
 
@@ -163,7 +180,7 @@ class ArchiveConfig:
     destination: str | None = None  # move 시 이동 경로
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackupConfig:
     """``[backup]`` 섹션 데이터.
 
@@ -174,7 +191,11 @@ class BackupConfig:
     include_originals: bool = False
 
 
-@dataclass(frozen=True)
+# 빈 매핑 기본값. 읽기 전용이라 모든 인스턴스가 공유해도 안전하다.
+_EMPTY_STR_MAPPING: Mapping[str, str] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class ColorGradingConfig:
     """``config.toml`` 의 ``[color_grading]`` 섹션.
 
@@ -187,15 +208,15 @@ class ColorGradingConfig:
 
     auto_lut: bool | None = None
     """기기 모델명 기반 자동 LUT 적용 여부."""
-    device_luts: dict[str, str] = field(default_factory=dict)
+    device_luts: Mapping[str, str] = _EMPTY_STR_MAPPING
     """기기 키워드 → LUT 파일 경로 매핑 (config.toml 전용, env var 없음)."""
     auto_white_balance: bool | None = None
     """기기 모델명 기반 자동 화이트밸런스 적용 여부."""
-    device_wb: dict[str, str] = field(default_factory=dict)
+    device_wb: Mapping[str, str] = _EMPTY_STR_MAPPING
     """기기 키워드 → WB 프리셋 이름 매핑 (WB_PRESETS 키 사용)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WatchConfig:
     """``config.toml`` 의 ``[watch]`` 섹션."""
 
@@ -209,7 +230,7 @@ class WatchConfig:
     """watch 데몬 로그 파일 경로."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MacOSNotifyConfig:
     """``[notification.macos]`` 하위 설정."""
 
@@ -217,7 +238,7 @@ class MacOSNotifyConfig:
     sound: bool | None = None  # None이면 기본 True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TelegramConfig:
     """``[notification.telegram]`` 하위 설정."""
 
@@ -226,7 +247,7 @@ class TelegramConfig:
     chat_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscordConfig:
     """``[notification.discord]`` 하위 설정."""
 
@@ -234,7 +255,7 @@ class DiscordConfig:
     webhook_url: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlackConfig:
     """``[notification.slack]`` 하위 설정."""
 
@@ -242,7 +263,7 @@ class SlackConfig:
     webhook_url: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HooksConfig:
     """``[hooks]`` 섹션 파서 결과.
 
@@ -256,7 +277,7 @@ class HooksConfig:
     timeout_sec: int = 60
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     """``config.toml`` 의 ``[notification]`` 섹션.
 
@@ -274,7 +295,7 @@ class NotificationConfig:
     slack: SlackConfig = field(default_factory=SlackConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """애플리케이션 전체 설정.
 
@@ -293,6 +314,22 @@ class AppConfig:
     hooks: HooksConfig = field(default_factory=HooksConfig)
     notification: NotificationConfig = field(default_factory=NotificationConfig)
 
+    @classmethod
+    def empty(cls) -> AppConfig:
+        """공유 빈 설정 인스턴스를 반환한다.
+
+        파일 없음·빈 파일·파싱 실패 시 :func:`load_config` 가 돌려주는 것과
+        동일한 객체이므로 ``is`` 비교로 "설정 없음"을 판별할 수 있다.
+        """
+        return _EMPTY_APP_CONFIG
+
+
+# 파일 없음·빈 파일·오류 경로와 빈 섹션에서 공유하는 기본 설정 (frozen이라 공유 안전)
+_EMPTY_APP_CONFIG = AppConfig()
+
+# AppConfig 필드명 = 인식하는 TOML 최상위 섹션명
+_APP_CONFIG_SECTIONS = tuple(f.name for f in fields(AppConfig))
+
 
 def _parse_hook_commands(data: dict[str, object], key: str, section: str) -> tuple[str, ...]:
     """훅 명령 목록을 안전하게 파싱한다.
@@ -312,21 +349,7 @@ def _parse_hook_commands(data: dict[str, object], key: str, section: str) -> tup
         _warn_type(f"{section}.{key}", "str|list[str]", raw)
         return ()
 
-    commands: list[str] = []
-    skipped = 0
-    for item in raw:
-        if isinstance(item, str):
-            commands.append(item)
-        else:
-            skipped += 1
-    if skipped > 0:
-        logger.warning(
-            "config: %s.%s 에 비문자열 항목 %d개 무시됨",
-            section,
-            key,
-            skipped,
-        )
-    return tuple(commands)
+    return tuple(_filter_str_items(raw, f"{section}.{key}"))
 
 
 def _parse_hook_timeout(data: dict[str, object]) -> int:
@@ -334,7 +357,7 @@ def _parse_hook_timeout(data: dict[str, object]) -> int:
     raw_timeout = data.get("timeout_sec")
     if raw_timeout is None:
         return 60
-    if isinstance(raw_timeout, int) and not isinstance(raw_timeout, bool):
+    if type(raw_timeout) is int:
         if raw_timeout > 0:
             return raw_timeout
         logger.warning(
@@ -359,7 +382,7 @@ def _warn_type(field_name: str, expected: str, value: object) -> None:
 def _parse_str(data: dict[str, object], key: str, section: str) -> str | None:
     """TOML dict에서 문자열 필드를 안전하게 파싱한다."""
     raw = data.get(key)
-    if isinstance(raw, str):
+    if type(raw) is str:
         return raw
     if raw is not None:
         _warn_type(f"{section}.{key}", "str", raw)
@@ -369,7 +392,7 @@ def _parse_str(data: dict[str, object], key: str, section: str) -> str | None:
 def _parse_bool(data: dict[str, object], key: str, section: str) -> bool | None:
     """TOML dict에서 bool 필드를 안전하게 파싱한다."""
     raw = data.get(key)
-    if isinstance(raw, bool):
+    if type(raw) is bool:
         return raw
     if raw is not None:
         _warn_type(f"{section}.{key}", "bool", raw)
@@ -377,20 +400,43 @@ def _parse_bool(data: dict[str, object], key: str, section: str) -> bool | None:
 
 
 def _parse_int(data: dict[str, object], key: str, section: str) -> int | None:
-    """TOML dict에서 정수 필드를 안전하게 파싱한다 (bool 제외)."""
+    """TOML dict에서 정수 필드를 안전하게 파싱한다 (bool 제외).
+
+    ``type(raw) is int`` 는 bool(int 서브클래스)을 한 번의 비교로 걸러낸다.
+    """
     raw = data.get(key)
-    if isinstance(raw, int) and not isinstance(raw, bool):
+    if type(raw) is int:
         return raw
     if raw is not None:
         _warn_type(f"{section}.{key}", "int", raw)
     return None
 
 
+def _parse_float(data: dict[str, object], key: str, section: str) -> float | None:
+    """TOML dict에서 실수 필드를 안전하게 파싱한다 (int 허용, bool 제외)."""
+    raw = data.get(key)
+    if type(raw) is float or type(raw) is int:
+        return float(raw)
+    if raw is not None:
+        _warn_type(f"{section}.{key}", "float", raw)
+    return None
+
+
+def _filter_str_items(items: list[object], field_name: str) -> list[str]:
+    """리스트에서 문자열 항목만 남긴다. 버려진 항목이 있으면 한 번만 경고."""
+    # TOML 파서는 str 서브클래스를 만들지 않으므로 isinstance 대신 정확한 타입 비교
+    strings = [item for item in items if type(item) is str]
+    skipped = len(items) - len(strings)
+    if skipped > 0:
+        logger.warning("config: %s 에 비문자열 항목 %d개 무시됨", field_name, skipped)
+    return strings
+
+
 def _parse_enum_str(
     data: dict[str, object],
     key: str,
     section: str,
-    allowed: tuple[str, ...],
+    allowed: frozenset[str],
 ) -> str | None:
     """허용된 문자열 값만 통과시키는 파서. 유효하지 않으면 경고 후 None."""
     value = _parse_str(data, key, section)
@@ -401,7 +447,16 @@ def _parse_enum_str(
 
 
 def get_default_config_path() -> Path:
-    """기본 설정 파일 경로 반환."""
+    """기본 설정 파일 경로 반환.
+
+    ``$HOME`` 값별로 계산 결과를 캐시하므로 HOME이 바뀌면 새 경로를 반환한다.
+    """
+    return _config_path_for_home(os.environ.get("HOME"))
+
+
+@functools.lru_cache(maxsize=4)
+def _config_path_for_home(home: str | None) -> Path:
+    """HOME 값에 대응하는 기본 설정 파일 경로 (``home`` 은 캐시 키 용도)."""
     return Path.home() / ".tubearchive" / "config.toml"
 
 
@@ -410,42 +465,34 @@ def _parse_general(data: dict[str, object]) -> GeneralConfig:
     section = "general"
 
     # denoise_level: 허용값 검증이 필요한 문자열
-    denoise_level = _parse_enum_str(data, "denoise_level", section, ("light", "medium", "heavy"))
+    denoise_level = _parse_enum_str(data, "denoise_level", section, _VALID_STRENGTHS)
 
     # fade_duration: 음수가 아닌 실수 (int도 허용)
-    fade_duration: float | None = None
-    raw_fade = data.get("fade_duration")
-    if isinstance(raw_fade, (int, float)) and not isinstance(raw_fade, bool):
-        if raw_fade >= 0:
-            fade_duration = float(raw_fade)
-        else:
-            logger.warning("config: general.fade_duration 값 오류: %r", raw_fade)
-    elif raw_fade is not None:
-        _warn_type(f"{section}.fade_duration", "float", raw_fade)
+    fade_duration = _parse_float(data, "fade_duration", section)
+    if fade_duration is not None and fade_duration < 0:
+        logger.warning("config: general.fade_duration 값 오류: %r", data["fade_duration"])
+        fade_duration = None
 
     # silence_min_duration: 양수 실수 (int도 허용)
-    silence_min_duration: float | None = None
-    raw_silence_dur = data.get("silence_min_duration")
-    if isinstance(raw_silence_dur, (int, float)) and not isinstance(raw_silence_dur, bool):
-        if raw_silence_dur > 0:
-            silence_min_duration = float(raw_silence_dur)
-        else:
-            logger.warning("config: general.silence_min_duration 값 오류: %r", raw_silence_dur)
-    elif raw_silence_dur is not None:
-        _warn_type(f"{section}.silence_min_duration", "float", raw_silence_dur)
+    silence_min_duration = _parse_float(data, "silence_min_duration", section)
+    if silence_min_duration is not None and silence_min_duration <= 0:
+        logger.warning(
+            "config: general.silence_min_duration 값 오류: %r", data["silence_min_duration"]
+        )
+        silence_min_duration = None
 
     # stabilize_strength / stabilize_crop: 허용값 검증
     stabilize_strength = _parse_enum_str(
         data,
         "stabilize_strength",
         section,
-        ("light", "medium", "heavy"),
+        _VALID_STRENGTHS,
     )
     stabilize_crop = _parse_enum_str(
         data,
         "stabilize_crop",
         section,
-        ("crop", "expand"),
+        _VALID_STABILIZE_CROPS,
     )
     subtitle_lang = _parse_str(data, "subtitle_lang", section)
     if subtitle_lang is not None:
@@ -454,13 +501,13 @@ def _parse_general(data: dict[str, object]) -> GeneralConfig:
         data,
         "subtitle_model",
         section,
-        ("tiny", "base", "small", "medium", "large"),
+        _VALID_SUBTITLE_MODELS,
     )
     subtitle_format = _parse_enum_str(
         data,
         "subtitle_format",
         section,
-        ("srt", "vtt"),
+        _VALID_SUBTITLE_FORMATS,
     )
 
     return GeneralConfig(
@@ -490,15 +537,10 @@ def _parse_bgm(data: dict[str, object]) -> BGMConfig:
     section = "bgm"
 
     # bgm_volume: 범위 검증 (0.0~1.0)
-    bgm_volume: float | None = None
-    raw_volume = data.get("bgm_volume")
-    if isinstance(raw_volume, (int, float)) and not isinstance(raw_volume, bool):
-        if 0.0 <= raw_volume <= 1.0:
-            bgm_volume = float(raw_volume)
-        else:
-            logger.warning("config: bgm.bgm_volume 범위 초과: %r (0.0~1.0)", raw_volume)
-    elif raw_volume is not None:
-        _warn_type(f"{section}.bgm_volume", "float", raw_volume)
+    bgm_volume = _parse_float(data, "bgm_volume", section)
+    if bgm_volume is not None and not 0.0 <= bgm_volume <= 1.0:
+        logger.warning("config: bgm.bgm_volume 범위 초과: %r (0.0~1.0)", data["bgm_volume"])
+        bgm_volume = None
 
     return BGMConfig(
         bgm_path=_parse_str(data, "bgm_path", section),
@@ -512,15 +554,12 @@ def _parse_youtube(data: dict[str, object]) -> YouTubeConfig:
     section = "youtube"
 
     # playlist: list[str] 또는 단일 str 허용
-    playlist: list[str] = []
+    playlist: tuple[str, ...] = ()
     raw_playlist = data.get("playlist")
     if isinstance(raw_playlist, list):
-        playlist = [item for item in raw_playlist if isinstance(item, str)]
-        skipped = len(raw_playlist) - len(playlist)
-        if skipped > 0:
-            logger.warning("config: youtube.playlist에 비문자열 항목 %d개 무시됨", skipped)
+        playlist = tuple(_filter_str_items(raw_playlist, f"{section}.playlist"))
     elif isinstance(raw_playlist, str):
-        playlist = [raw_playlist]
+        playlist = (raw_playlist,)
     elif raw_playlist is not None:
         _warn_type(f"{section}.playlist", "list|str", raw_playlist)
 
@@ -532,7 +571,7 @@ def _parse_youtube(data: dict[str, object]) -> YouTubeConfig:
 
     # upload_privacy: 허용값 검증
     upload_privacy = _parse_str(data, "upload_privacy", section)
-    if upload_privacy is not None and upload_privacy not in ("public", "unlisted", "private"):
+    if upload_privacy is not None and upload_privacy not in _VALID_UPLOAD_PRIVACY:
         logger.warning("config: youtube.upload_privacy 값 오류: %r", upload_privacy)
         upload_privacy = None
 
@@ -551,7 +590,7 @@ def _parse_archive(data: dict[str, object]) -> ArchiveConfig:
 
     # policy: 허용값 검증
     policy = _parse_str(data, "policy", section)
-    if policy is not None and policy not in ("keep", "move", "delete"):
+    if policy is not None and policy not in _VALID_ARCHIVE_POLICIES:
         logger.warning("config: archive.policy 값 오류: %r", policy)
         policy = None
 
@@ -588,7 +627,7 @@ def _parse_color_grading(data: dict[str, object]) -> ColorGradingConfig:
     raw_device_luts = data.get("device_luts")
     if isinstance(raw_device_luts, dict):
         for key, value in raw_device_luts.items():
-            if isinstance(value, str):
+            if type(value) is str:
                 device_luts[key] = value
             else:
                 _warn_type(f"{section}.device_luts.{key}", "str", value)
@@ -603,7 +642,7 @@ def _parse_color_grading(data: dict[str, object]) -> ColorGradingConfig:
     raw_device_wb = data.get("device_wb")
     if isinstance(raw_device_wb, dict):
         for key, value in raw_device_wb.items():
-            if not isinstance(value, str):
+            if type(value) is not str:
                 _warn_type(f"{section}.device_wb.{key}", "str", value)
             elif value not in WB_PRESETS:
                 logger.warning(
@@ -618,11 +657,12 @@ def _parse_color_grading(data: dict[str, object]) -> ColorGradingConfig:
     elif raw_device_wb is not None:
         _warn_type(f"{section}.device_wb", "table", raw_device_wb)
 
+    # 캐시된 AppConfig를 공유하므로 읽기 전용 뷰로 감싼다
     return ColorGradingConfig(
         auto_lut=auto_lut,
-        device_luts=device_luts,
+        device_luts=MappingProxyType(device_luts) if device_luts else _EMPTY_STR_MAPPING,
         auto_white_balance=auto_white_balance,
-        device_wb=device_wb,
+        device_wb=MappingProxyType(device_wb) if device_wb else _EMPTY_STR_MAPPING,
     )
 
 
@@ -634,34 +674,22 @@ def _parse_watch(data: dict[str, object]) -> WatchConfig:
     paths: list[str] = []
     if isinstance(raw_paths, list):
         for raw_path in raw_paths:
-            if isinstance(raw_path, str):
+            if type(raw_path) is str:
                 paths.append(raw_path.strip())
             else:
                 _warn_type(f"{section}.paths", "list[str]", raw_path)
     elif raw_paths is not None:
         _warn_type(f"{section}.paths", "list[str]", raw_paths)
 
-    raw_poll_interval = data.get("poll_interval")
-    poll_interval = None
-    if raw_poll_interval is not None:
-        if isinstance(raw_poll_interval, (int, float)):
-            if raw_poll_interval > 0:
-                poll_interval = float(raw_poll_interval)
-            else:
-                logger.warning("%s.%s must be > 0, using None", section, "poll_interval")
-        else:
-            _warn_type(f"{section}.poll_interval", "float", raw_poll_interval)
-
-    raw_stability_checks = data.get("stability_checks")
-    stability_checks = None
-    if raw_stability_checks is not None:
-        if isinstance(raw_stability_checks, int):
-            if raw_stability_checks > 0:
-                stability_checks = raw_stability_checks
-            else:
-                logger.warning("%s.%s must be > 0, using None", section, "stability_checks")
-        else:
-            _warn_type(f"{section}.stability_checks", "int", raw_stability_checks)
+    poll_interval = _parse_float(data, "poll_interval", section)
+    if poll_interval is not None and poll_interval <= 0:
+        logger.warning("%s.%s must be > 0, using None", section, "poll_interval")
+        poll_interval = None
+
+    stability_checks = _parse_int(data, "stability_checks", section)
+    if stability_checks is not None and stability_checks <= 0:
+        logger.warning("%s.%s must be > 0, using None", section, "stability_checks")
+        stability_checks = None
 
     log_path = _parse_str(data, "log_path", section)
 
@@ -693,45 +721,45 @@ def _parse_notification(data: dict[str, object]) -> NotificationConfig:
     on_error = _parse_bool(data, "on_error", section)
 
     # macos 하위 테이블
-    raw_macos = data.get("macos", {})
-    if isinstance(raw_macos, dict):
+    raw_macos = data.get("macos")
+    if isinstance(raw_macos, dict) and raw_macos:
         macos = MacOSNotifyConfig(
             enabled=_parse_bool(raw_macos, "enabled", f"{section}.macos"),
             sound=_parse_bool(raw_macos, "sound", f"{section}.macos"),
         )
     else:
-        macos = MacOSNotifyConfig()
+        macos = _EMPTY_APP_CONFIG.notification.macos
 
     # telegram 하위 테이블
-    raw_telegram = data.get("telegram", {})
-    if isinstance(raw_telegram, dict):
+    raw_telegram = data.get("telegram")
+    if isinstance(raw_telegram, dict) and raw_telegram:
         telegram = TelegramConfig(
             enabled=_parse_bool(raw_telegram, "enabled", f"{section}.telegram"),
             bot_token=_parse_str(raw_telegram, "bot_token", f"{section}.telegram"),
             chat_id=_parse_str(raw_telegram, "chat_id", f"{section}.telegram"),
         )
     else:
-        telegram = TelegramConfig()
+        telegram = _EMPTY_APP_CONFIG.notification.telegram
 
     # discord 하위 테이블
-    raw_discord = data.get("discord", {})
-    if isinstance(raw_discord, dict):
+    raw_discord = data.get("discord")
+    if isinstance(raw_discord, dict) and raw_discord:
         discord = DiscordConfig(
             enabled=_parse_bool(raw_discord, "enabled", f"{section}.discord"),
             webhook_url=_parse_str(raw_discord, "webhook_url", f"{section}.discord"),
         )
     else:
-        discord = DiscordConfig()
+        discord = _EMPTY_APP_CONFIG.notification.discord
 
     # slack 하위 테이블
-    raw_slack = data.get("slack", {})
-    if isinstance(raw_slack, dict):
+    raw_slack = data.get("slack")
+    if isinstance(raw_slack, dict) and raw_slack:
         slack = SlackConfig(
             enabled=_parse_bool(raw_slack, "enabled", f"{section}.slack"),
             webhook_url=_parse_str(raw_slack, "webhook_url", f"{section}.slack"),
         )
     else:
-        slack = SlackConfig()
+        slack = _EMPTY_APP_CONFIG.notification.slack
 
     return NotificationConfig(
         enabled=enabled,
@@ -761,10 +789,30 @@ def _parse_hooks(data: dict[str, object]) -> HooksConfig:
     )
 
 
+def _read_toml_bytes(path: Path) -> bytes:
+    """설정 파일 전체를 한 번에 읽는다 (작은 설정 파일에 mmap/청크 읽기는 불필요)."""
+    return path.read_bytes()
+
+
+def _is_blank_toml(text: str) -> bool:
+    """공백·주석 줄만 있는 TOML인지 확인한다 (첫 내용 줄에서 바로 중단)."""
+    return all(not line or line.startswith("#") for line in map(str.strip, text.splitlines()))
+
+
+def _get_toml_loads() -> Callable[[str], dict[str, Any]]:
+    """표준 ``tomllib.loads`` 반환. 모듈 import 시점이 아니라 첫 파싱 때 로드한다."""
+    import tomllib
+
+    return tomllib.loads
+
+
 def load_config(path: Path | None = None) -> AppConfig:
     """
     TOML 설정 파일 로드.
 
+    같은 경로의 파일이 (mtime, 크기, inode) 기준으로 바뀌지 않았으면 이전에 만든
+    :class:`AppConfig` 를 그대로 반환한다. 설정 객체는 frozen이라 공유해도 안전하다.
+
     Args:
         path: 설정 파일 경로 (None이면 기본 경로 사용)
 
@@ -773,270 +821,214 @@ def load_config(path: Path | None = None) -> AppConfig:
     """
     config_path = path or get_default_config_path()
 
-    if not config_path.is_file():
-        return AppConfig()
+    try:
+        file_stat = config_path.stat()
+    except OSError:
+        return _EMPTY_APP_CONFIG
+    if not S_ISREG(file_stat.st_mode):
+        return _EMPTY_APP_CONFIG
+
+    # 파일이 바뀌지 않았으면 (mtime, 크기, inode 동일) 이전 파싱 결과 재사용
+    cache_key = config_path.absolute()
+    signature = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     try:
-        with config_path.open("rb") as f:
-            raw = tomllib.load(f)
-    except tomllib.TOMLDecodeError as e:
-        logger.warning(f"config: TOML 문법 오류 ({config_path}): {e}")
-        return AppConfig()
+        data = _read_toml_bytes(config_path)
     except OSError as e:
         logger.warning(f"config: 파일 읽기 실패 ({config_path}): {e}")
-        return AppConfig()
-
-    general_data = raw.get("general", {})
-    bgm_data = raw.get("bgm", {})
-    youtube_data = raw.get("youtube", {})
-    archive_data = raw.get("archive", {})
-    color_grading_data = raw.get("color_grading", {})
-    template_data = raw.get("template", {})
-    notification_data = raw.get("notification", {})
-    hooks_data = raw.get("hooks", {})
-    watch_data = raw.get("watch", {})
-
-    if isinstance(general_data, dict):
-        general = _parse_general(general_data)
-    else:
-        if general_data:
-            logger.warning(
-                "config: [general] 섹션이 테이블이 아닙니다 (got %s)",
-                type(general_data).__name__,
-            )
-        general = GeneralConfig()
-
-    if isinstance(bgm_data, dict):
-        bgm = _parse_bgm(bgm_data)
-    else:
-        if bgm_data:
-            logger.warning(
-                "config: [bgm] 섹션이 테이블이 아닙니다 (got %s)",
-                type(bgm_data).__name__,
-            )
-        bgm = BGMConfig()
-
-    if isinstance(youtube_data, dict):
-        youtube = _parse_youtube(youtube_data)
-    else:
-        if youtube_data:
-            logger.warning(
-                "config: [youtube] 섹션이 테이블이 아닙니다 (got %s)",
-                type(youtube_data).__name__,
-            )
-        youtube = YouTubeConfig()
-
-    if isinstance(archive_data, dict):
-        archive = _parse_archive(archive_data)
-    else:
-        if archive_data:
-            logger.warning(
-                "config: [archive] 섹션이 테이블이 아닙니다 (got %s)",
-                type(archive_data).__name__,
-            )
-        archive = ArchiveConfig()
-
-    backup_data = raw.get("backup", {})
-    if isinstance(backup_data, dict):
-        backup = _parse_backup(backup_data)
-    else:
-        if backup_data:
-            logger.warning(
-                "config: [backup] 섹션이 테이블이 아닙니다 (got %s)",
-                type(backup_data).__name__,
-            )
-        backup = BackupConfig()
-
-    if isinstance(color_grading_data, dict):
-        color_grading = _parse_color_grading(color_grading_data)
-    else:
-        if color_grading_data:
-            logger.warning(
-                "config: [color_grading] 섹션이 테이블이 아닙니다 (got %s)",
-                type(color_grading_data).__name__,
-            )
-        color_grading = ColorGradingConfig()
-
-    if isinstance(template_data, dict):
-        template = _parse_template(template_data)
-    else:
-        if template_data:
-            logger.warning(
-                "config: [template] 섹션이 테이블이 아닙니다 (got %s)",
-                type(template_data).__name__,
-            )
-        template = TemplateConfig()
-
-    if isinstance(notification_data, dict):
-        notification = _parse_notification(notification_data)
-    else:
-        if notification_data:
-            logger.warning(
-                "config: [notification] 섹션이 테이블이 아닙니다 (got %s)",
-                type(notification_data).__name__,
-            )
-        notification = NotificationConfig()
-
-    if isinstance(hooks_data, dict):
-        hooks = _parse_hooks(hooks_data)
-    else:
-        if hooks_data:
-            logger.warning(
-                "config: [hooks] 섹션이 테이블이 아닙니다 (got %s)",
-                type(hooks_data).__name__,
-            )
-        hooks = HooksConfig()
-
-    if isinstance(watch_data, dict):
-        watch = _parse_watch(watch_data)
-    else:
-        if watch_data:
-            logger.warning(
-                "config: [watch] 섹션이 테이블이 아닙니다 (got %s)",
-                type(watch_data).__name__,
-            )
-        watch = WatchConfig()
+        return _EMPTY_APP_CONFIG
 
-    return AppConfig(
-        general=general,
-        bgm=bgm,
-        youtube=youtube,
-        archive=archive,
-        backup=backup,
-        color_grading=color_grading,
-        watch=watch,
-        template=template,
-        hooks=hooks,
-        notification=notification,
-    )
+    # UnicodeDecodeError도 ValueError — 문법 오류와 동일하게 처리
+    try:
+        text = data.decode()
+    except ValueError as e:
+        logger.warning(f"config: TOML 문법 오류 ({config_path}): {e}")
+        return _EMPTY_APP_CONFIG
 
+    config = load_config_from_string(text, source=str(config_path))
+    # 빈 파일·오류 결과는 캐시하지 않는다 (오류 경고가 매번 출력되도록)
+    if config is not _EMPTY_APP_CONFIG:
+        _CONFIG_CACHE[cache_key] = (signature, config)
+    return config
 
-def apply_config_to_env(config: AppConfig, *, overwrite: bool = False) -> None:
+
+def load_config_from_string(text: str, *, source: str = "<string>") -> AppConfig:
     """
-    설정값을 환경변수에 주입.
+    TOML 문자열에서 설정 로드 (파일 I/O 없음).
 
-    기본 동작은 기존 환경변수를 보존한다.
-    reload 모드에서 최신 config 값을 반영하려면 overwrite=True로 호출한다.
+    Args:
+        text: TOML 문서 문자열
+        source: 경고 메시지에 표시할 출처 (파일 경로 등)
+
+    Returns:
+        AppConfig (빈 문서/문법 오류 시 빈 AppConfig)
     """
-    mappings: list[tuple[str, str | None]] = [
-        (ENV_OUTPUT_DIR, config.general.output_dir),
-        (ENV_DB_PATH, config.general.db_path),
-        (ENV_YOUTUBE_CLIENT_SECRETS, config.youtube.client_secrets),
-        (ENV_YOUTUBE_TOKEN, config.youtube.token),
-    ]
-
-    # int 필드
-    if config.general.parallel is not None:
-        mappings.append((ENV_PARALLEL, str(config.general.parallel)))
-    if config.youtube.upload_chunk_mb is not None:
-        mappings.append((ENV_UPLOAD_CHUNK_MB, str(config.youtube.upload_chunk_mb)))
-
-    # bool → "true"/"false"
-    if config.general.denoise is not None:
-        mappings.append((ENV_DENOISE, str(config.general.denoise).lower()))
-    if config.general.denoise_level is not None:
-        mappings.append((ENV_DENOISE_LEVEL, config.general.denoise_level))
-    if config.general.normalize_audio is not None:
-        mappings.append((ENV_NORMALIZE_AUDIO, str(config.general.normalize_audio).lower()))
-    if config.general.group_sequences is not None:
-        mappings.append((ENV_GROUP_SEQUENCES, str(config.general.group_sequences).lower()))
-    if config.general.fade_duration is not None:
-        mappings.append((ENV_FADE_DURATION, str(config.general.fade_duration)))
-    if config.general.trim_silence is not None:
-        mappings.append((ENV_TRIM_SILENCE, str(config.general.trim_silence).lower()))
-    if config.general.silence_threshold is not None:
-        mappings.append((ENV_SILENCE_THRESHOLD, config.general.silence_threshold))
-    if config.general.silence_min_duration is not None:
-        mappings.append((ENV_SILENCE_MIN_DURATION, str(config.general.silence_min_duration)))
-
-    # BGM 설정
-    if config.bgm.bgm_path is not None:
-        mappings.append((ENV_BGM_PATH, config.bgm.bgm_path))
-    if config.bgm.bgm_volume is not None:
-        mappings.append((ENV_BGM_VOLUME, str(config.bgm.bgm_volume)))
-    if config.bgm.bgm_loop is not None:
-        mappings.append((ENV_BGM_LOOP, str(config.bgm.bgm_loop).lower()))
-
-    # playlist: list → CSV
-    if config.youtube.playlist:
-        mappings.append((ENV_YOUTUBE_PLAYLIST, ",".join(config.youtube.playlist)))
-
-    # stabilize
-    if config.general.stabilize is not None:
-        mappings.append((ENV_STABILIZE, str(config.general.stabilize).lower()))
-    if config.general.stabilize_strength is not None:
-        mappings.append((ENV_STABILIZE_STRENGTH, config.general.stabilize_strength))
-    if config.general.stabilize_crop is not None:
-        mappings.append((ENV_STABILIZE_CROP, config.general.stabilize_crop))
-    if config.general.subtitle_lang is not None:
-        mappings.append((ENV_SUBTITLE_LANG, config.general.subtitle_lang))
-    if config.general.subtitle_model is not None:
-        mappings.append((ENV_SUBTITLE_MODEL, config.general.subtitle_model))
-    if config.general.subtitle_format is not None:
-        mappings.append((ENV_SUBTITLE_FORMAT, config.general.subtitle_format))
-    if config.general.subtitle_burn is not None:
-        mappings.append((ENV_SUBTITLE_BURN, str(config.general.subtitle_burn).lower()))
+    # 빈 문서·주석만 있는 문서는 파서를 거치지 않는다
+    if _is_blank_toml(text):
+        return _EMPTY_APP_CONFIG
 
-    # watch
-    if config.watch.paths:
-        mappings.append((ENV_WATCH_PATHS, ",".join(config.watch.paths)))
-    if config.watch.poll_interval is not None:
-        mappings.append((ENV_WATCH_POLL_INTERVAL, str(config.watch.poll_interval)))
-    if config.watch.stability_checks is not None:
-        mappings.append((ENV_WATCH_STABILITY_CHECKS, str(config.watch.stability_checks)))
-    if config.watch.log_path is not None:
-        mappings.append((ENV_WATCH_LOG, config.watch.log_path))
-
-    # archive policy
-    if config.archive.policy is not None:
-        mappings.append((ENV_ARCHIVE_POLICY, config.archive.policy))
-    if config.archive.destination is not None:
-        mappings.append((ENV_ARCHIVE_DESTINATION, config.archive.destination))
-
-    if config.backup.remote is not None:
-        mappings.append((ENV_BACKUP_REMOTE, config.backup.remote))
-    mappings.append((ENV_BACKUP_INCLUDE_ORIGINALS, str(config.backup.include_originals).lower()))
+    # tomllib.TOMLDecodeError는 ValueError 하위 클래스
+    try:
+        raw = _get_toml_loads()(text)
+    except ValueError as e:
+        logger.warning(f"config: TOML 문법 오류 ({source}): {e}")
+        return _EMPTY_APP_CONFIG
 
-    # color grading
-    if config.color_grading.auto_lut is not None:
-        mappings.append((ENV_AUTO_LUT, str(config.color_grading.auto_lut).lower()))
-    if config.color_grading.auto_white_balance is not None:
-        mappings.append(
-            (ENV_AUTO_WHITE_BALANCE, str(config.color_grading.auto_white_balance).lower())
+    return _build_app_config(raw)
+
+
+def _parse_section[T](
+    raw: dict[str, object],
+    section: str,
+    parse: Callable[[dict[str, object]], T],
+    default: T,
+) -> T:
+    """섹션 하나를 파싱한다. 없거나 비어 있으면 파서를 거치지 않고 기본값을 반환.
+
+    테이블이 아닌 값이면 경고 후 기본값을 사용한다.
+    """
+    data = raw.get(section)
+    if not data:
+        return default
+    if not isinstance(data, dict):
+        logger.warning(
+            "config: [%s] 섹션이 테이블이 아닙니다 (got %s)",
+            section,
+            type(data).__name__,
         )
+        return default
+    return parse(data)
+
+
+def _build_app_config(raw: dict[str, object]) -> AppConfig:
+    """파싱된 TOML 딕셔너리에서 섹션별로 :class:`AppConfig` 를 조립한다.
+
+    인식하는 섹션이 모두 없거나 비어 있으면 조립 없이 공유 기본 설정을 반환한다.
+    """
+    if not any(raw.get(section) for section in _APP_CONFIG_SECTIONS):
+        return _EMPTY_APP_CONFIG
+    return AppConfig(
+        general=_parse_section(raw, "general", _parse_general, _EMPTY_APP_CONFIG.general),
+        bgm=_parse_section(raw, "bgm", _parse_bgm, _EMPTY_APP_CONFIG.bgm),
+        youtube=_parse_section(raw, "youtube", _parse_youtube, _EMPTY_APP_CONFIG.youtube),
+        archive=_parse_section(raw, "archive", _parse_archive, _EMPTY_APP_CONFIG.archive),
+        backup=_parse_section(raw, "backup", _parse_backup, _EMPTY_APP_CONFIG.backup),
+        color_grading=_parse_section(
+            raw, "color_grading", _parse_color_grading, _EMPTY_APP_CONFIG.color_grading
+        ),
+        watch=_parse_section(raw, "watch", _parse_watch, _EMPTY_APP_CONFIG.watch),
+        template=_parse_section(raw, "template", _parse_template, _EMPTY_APP_CONFIG.template),
+        hooks=_parse_section(raw, "hooks", _parse_hooks, _EMPTY_APP_CONFIG.hooks),
+        notification=_parse_section(
+            raw, "notification", _parse_notification, _EMPTY_APP_CONFIG.notification
+        ),
+    )
 
-    # template
-    if config.template.intro is not None:
-        mappings.append((ENV_TEMPLATE_INTRO, config.template.intro))
-    if config.template.outro is not None:
-        mappings.append((ENV_TEMPLATE_OUTRO, config.template.outro))
 
+def clear_config_cache() -> None:
+    """:func:`load_config` 파싱 캐시를 비운다 (테스트·강제 재로드용)."""
+    _CONFIG_CACHE.clear()
+
+
+def _env_str(value: object) -> str | None:
+    """문자열·숫자 설정값을 그대로 환경변수 문자열로 변환."""
+    return str(value)
+
+
+def _env_bool(value: object) -> str | None:
+    """bool 설정값을 ``"true"`` / ``"false"`` 로 변환."""
+    return "true" if value else "false"
+
+
+_CSV_JOIN = ",".join
+
+
+def _env_csv(value: Sequence[str]) -> str | None:
+    """리스트 설정값을 CSV로 변환. 빈 리스트는 주입하지 않는다."""
+    return _CSV_JOIN(value) if value else None
+
+
+# apply_config_to_env 매핑 테이블: (설정값 getter, 환경변수 키, 직렬화 함수)
+# None인 설정값은 주입하지 않는다.
+_ENV_MAP: tuple[tuple[Callable[[AppConfig], Any], str, Callable[[Any], str | None]], ...] = (
+    # general
+    (attrgetter("general.output_dir"), ENV_OUTPUT_DIR, _env_str),
+    (attrgetter("general.db_path"), ENV_DB_PATH, _env_str),
+    (attrgetter("general.parallel"), ENV_PARALLEL, _env_str),
+    (attrgetter("general.denoise"), ENV_DENOISE, _env_bool),
+    (attrgetter("general.denoise_level"), ENV_DENOISE_LEVEL, _env_str),
+    (attrgetter("general.normalize_audio"), ENV_NORMALIZE_AUDIO, _env_bool),
+    (attrgetter("general.group_sequences"), ENV_GROUP_SEQUENCES, _env_bool),
+    (attrgetter("general.fade_duration"), ENV_FADE_DURATION, _env_str),
+    (attrgetter("general.trim_silence"), ENV_TRIM_SILENCE, _env_bool),
+    (attrgetter("general.silence_threshold"), ENV_SILENCE_THRESHOLD, _env_str),
+    (attrgetter("general.silence_min_duration"), ENV_SILENCE_MIN_DURATION, _env_str),
+    (attrgetter("general.stabilize"), ENV_STABILIZE, _env_bool),
+    (attrgetter("general.stabilize_strength"), ENV_STABILIZE_STRENGTH, _env_str),
+    (attrgetter("general.stabilize_crop"), ENV_STABILIZE_CROP, _env_str),
+    (attrgetter("general.subtitle_lang"), ENV_SUBTITLE_LANG, _env_str),
+    (attrgetter("general.subtitle_model"), ENV_SUBTITLE_MODEL, _env_str),
+    (attrgetter("general.subtitle_format"), ENV_SUBTITLE_FORMAT, _env_str),
+    (attrgetter("general.subtitle_burn"), ENV_SUBTITLE_BURN, _env_bool),
+    # youtube
+    (attrgetter("youtube.client_secrets"), ENV_YOUTUBE_CLIENT_SECRETS, _env_str),
+    (attrgetter("youtube.token"), ENV_YOUTUBE_TOKEN, _env_str),
+    (attrgetter("youtube.upload_chunk_mb"), ENV_UPLOAD_CHUNK_MB, _env_str),
+    (attrgetter("youtube.playlist"), ENV_YOUTUBE_PLAYLIST, _env_csv),
+    # bgm
+    (attrgetter("bgm.bgm_path"), ENV_BGM_PATH, _env_str),
+    (attrgetter("bgm.bgm_volume"), ENV_BGM_VOLUME, _env_str),
+    (attrgetter("bgm.bgm_loop"), ENV_BGM_LOOP, _env_bool),
+    # watch
+    (attrgetter("watch.paths"), ENV_WATCH_PATHS, _env_csv),
+    (attrgetter("watch.poll_interval"), ENV_WATCH_POLL_INTERVAL, _env_str),
+    (attrgetter("watch.stability_checks"), ENV_WATCH_STABILITY_CHECKS, _env_str),
+    (attrgetter("watch.log_path"), ENV_WATCH_LOG, _env_str),
+    # archive / backup
+    (attrgetter("archive.policy"), ENV_ARCHIVE_POLICY, _env_str),
+    (attrgetter("archive.destination"), ENV_ARCHIVE_DESTINATION, _env_str),
+    (attrgetter("backup.remote"), ENV_BACKUP_REMOTE, _env_str),
+    (attrgetter("backup.include_originals"), ENV_BACKUP_INCLUDE_ORIGINALS, _env_bool),
+    # color grading
+    (attrgetter("color_grading.auto_lut"), ENV_AUTO_LUT, _env_bool),
+    (attrgetter("color_grading.auto_white_balance"), ENV_AUTO_WHITE_BALANCE, _env_bool),
+    # template
+    (attrgetter("template.intro"), ENV_TEMPLATE_INTRO, _env_str),
+    (attrgetter("template.outro"), ENV_TEMPLATE_OUTRO, _env_str),
     # notification
-    notif = config.notification
-    if notif.enabled is not None:
-        mappings.append((ENV_NOTIFY, str(notif.enabled).lower()))
-    if notif.macos.enabled is not None:
-        mappings.append((ENV_NOTIFY_MACOS, str(notif.macos.enabled).lower()))
-    if notif.macos.sound is not None:
-        mappings.append((ENV_NOTIFY_MACOS_SOUND, str(notif.macos.sound).lower()))
-    if notif.telegram.enabled is not None:
-        mappings.append((ENV_NOTIFY_TELEGRAM, str(notif.telegram.enabled).lower()))
-    if notif.telegram.bot_token is not None:
-        mappings.append((ENV_TELEGRAM_BOT_TOKEN, notif.telegram.bot_token))
-    if notif.telegram.chat_id is not None:
-        mappings.append((ENV_TELEGRAM_CHAT_ID, notif.telegram.chat_id))
-    if notif.discord.enabled is not None:
-        mappings.append((ENV_NOTIFY_DISCORD, str(notif.discord.enabled).lower()))
-    if notif.discord.webhook_url is not None:
-        mappings.append((ENV_DISCORD_WEBHOOK_URL, notif.discord.webhook_url))
-    if notif.slack.enabled is not None:
-        mappings.append((ENV_NOTIFY_SLACK, str(notif.slack.enabled).lower()))
-    if notif.slack.webhook_url is not None:
-        mappings.append((ENV_SLACK_WEBHOOK_URL, notif.slack.webhook_url))
-
-    for env_key, value in mappings:
-        if value is not None and (overwrite or env_key not in os.environ):
-            os.environ[env_key] = value
+    (attrgetter("notification.enabled"), ENV_NOTIFY, _env_bool),
+    (attrgetter("notification.macos.enabled"), ENV_NOTIFY_MACOS, _env_bool),
+    (attrgetter("notification.macos.sound"), ENV_NOTIFY_MACOS_SOUND, _env_bool),
+    (attrgetter("notification.telegram.enabled"), ENV_NOTIFY_TELEGRAM, _env_bool),
+    (attrgetter("notification.telegram.bot_token"), ENV_TELEGRAM_BOT_TOKEN, _env_str),
+    (attrgetter("notification.telegram.chat_id"), ENV_TELEGRAM_CHAT_ID, _env_str),
+    (attrgetter("notification.discord.enabled"), ENV_NOTIFY_DISCORD, _env_bool),
+    (attrgetter("notification.discord.webhook_url"), ENV_DISCORD_WEBHOOK_URL, _env_str),
+    (attrgetter("notification.slack.enabled"), ENV_NOTIFY_SLACK, _env_bool),
+    (attrgetter("notification.slack.webhook_url"), ENV_SLACK_WEBHOOK_URL, _env_str),
+)
+
+
+def apply_config_to_env(config: AppConfig, *, overwrite: bool = False) -> None:
+    """
+    설정값을 환경변수에 주입.
+
+    기본 동작은 기존 환경변수를 보존한다.
+    reload 모드에서 최신 config 값을 반영하려면 overwrite=True로 호출한다.
+    """
+    env = os.environ
+    for get_value, env_key, serialize in _ENV_MAP:
+        if not overwrite and env_key in env:
+            continue
+        value = get_value(config)
+        if value is None:
+            continue
+        env_value = serialize(value)
+        if env_value is not None:
+            env[env_key] = env_value
 
 
 def generate_default_config() -> str:
@@ -1152,7 +1144,7 @@ def parse_env_bool(value: str) -> bool:
     Returns:
         변환된 bool 값.
     """
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return value.strip().lower() in _TRUTHY_ENV_VALUES
 
 
 def get_default_output_dir() -> Path | None:
@@ -1225,7 +1217,7 @@ def get_default_denoise_level() -> str | None:
     if not env_level:
         return None
     normalized = env_level.strip().lower()
-    if normalized in {"light", "medium", "heavy"}:
+    if normalized in _VALID_STRENGTHS:
         return normalized
     logger.warning("%s=%s is not a valid level", ENV_DENOISE_LEVEL, env_level)
     return None
@@ -1287,7 +1279,7 @@ def get_default_archive_policy() -> str:
     if not env_policy:
         return "keep"
     normalized = env_policy.strip().lower()
-    if normalized in {"keep", "move", "delete"}:
+    if normalized in _VALID_ARCHIVE_POLICIES:
         return normalized
     logger.warning("%s=%s is not a valid policy", ENV_ARCHIVE_POLICY, env_policy)
     return "keep"
@@ -1390,7 +1382,7 @@ def get_default_stabilize_strength() -> str | None:
     if not env_val:
         return None
     normalized = env_val.strip().lower()
-    if normalized in {"light", "medium", "heavy"}:
+    if normalized in _VALID_STRENGTHS:
         return normalized
     logger.warning("%s=%s is not a valid strength", ENV_STABILIZE_STRENGTH, env_val)
     return None
@@ -1406,7 +1398,7 @@ def get_default_stabilize_crop() -> str | None:
     if not env_val:
         return None
     normalized = env_val.strip().lower()
-    if normalized in {"crop", "expand"}:
+    if normalized in _VALID_STABILIZE_CROPS:
         return normalized
     logger.warning("%s=%s is not a valid crop mode", ENV_STABILIZE_CROP, env_val)
     return None
@@ -1485,7 +1477,7 @@ def get_default_video_denoise_level() -> str | None:
     if not env_level:
         return None
     normalized = env_level.strip().lower()
-    if normalized in {"light", "medium", "heavy"}:
+    if normalized in _VALID_STRENGTHS:
         return normalized
     logger.warning("%s=%s is not a valid level", ENV_VIDEO_DENOISE_LEVEL, env_level)
     return None
@@ -1519,7 +1511,7 @@ def get_default_subtitle_model() -> str | None:
     if not env_model:
         return None
     normalized = env_model.strip().lower()
-    if normalized in {"tiny", "base", "small", "medium", "large"}:
+    if normalized in _VALID_SUBTITLE_MODELS:
         return normalized
     logger.warning("%s=%s is not a valid model", ENV_SUBTITLE_MODEL, env_model)
     return None
@@ -1534,7 +1526,7 @@ def get_default_subtitle_format() -> str | None:
     if not env_format:
         return None
     normalized = env_format.strip().lower()
-    if normalized in {"srt", "vtt"}:
+    if normalized in _VALID_SUBTITLE_FORMATS:
         return normalized
     logger.warning("%s=%s is not a valid format", ENV_SUBTITLE_FORMAT, env_format)
     return None
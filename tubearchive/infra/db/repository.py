@@ -13,6 +13,8 @@ SQLite DB 위의 영상·트랜스코딩·병합·분할·프로젝트 작업 
 import json
 import logging
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -30,17 +32,68 @@ from tubearchive.domain.models.video import VideoFile, VideoMetadata
 
 logger = logging.getLogger(__name__)
 
+# UPDATE ... RETURNING 지원 여부 (SQLite 3.35+)
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
-class VideoRepository:
-    """``videos`` 테이블 CRUD 저장소.
+# batch() 진행 중인 연결 → 중첩 깊이. 이 동안 개별 쓰기는 커밋을 미룬다.
+# sqlite3.Connection은 weakref를 지원하지 않아 연결 객체 자체를 키로 쓰고,
+# 가장 바깥 batch() 블록이 끝날 때 항목을 제거해 연결을 붙잡아 두지 않는다.
+_batch_depth: dict[sqlite3.Connection, int] = {}
 
-    원본 영상 파일의 경로·생성 시간·메타데이터를 저장하고 조회한다.
-    """
+
+class _Repository:
+    """리포지토리 공통 베이스: 연결 보관과 커밋·배치 트랜잭션 처리."""
 
     def __init__(self, conn: sqlite3.Connection) -> None:
         """초기화."""
         self.conn = conn
 
+    def _commit(self) -> None:
+        """쓰기 후 커밋. :meth:`batch` 안에서는 블록 종료 시까지 미룬다."""
+        if self.conn not in _batch_depth:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """여러 쓰기를 하나의 트랜잭션으로 묶는다.
+
+        가장 바깥 블록은 ``BEGIN`` 으로 트랜잭션을 열고 정상 종료 시 한 번 커밋,
+        예외 시 롤백한다. 중첩 블록과 이미 열린 트랜잭션 안에서 시작한 블록은
+        ``SAVEPOINT`` 를 쓰므로, 예외 시 해당 블록의 쓰기만 되돌리고 바깥 쓰기는
+        유지한다. 같은 연결을 쓰는 다른 리포지토리에도 적용된다.
+        """
+        conn = self.conn
+        depth = _batch_depth.get(conn, 0)
+        savepoint = f"tubearchive_batch_{depth}" if depth or conn.in_transaction else None
+        conn.execute(f"SAVEPOINT {savepoint}" if savepoint else "BEGIN")
+        _batch_depth[conn] = depth + 1
+        try:
+            yield
+        except BaseException:
+            if savepoint is None:
+                conn.rollback()
+            elif conn.in_transaction:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            if savepoint is not None:
+                conn.execute(f"RELEASE {savepoint}")
+            if depth == 0:
+                conn.commit()
+        finally:
+            if depth == 0:
+                del _batch_depth[conn]
+            else:
+                _batch_depth[conn] = depth
+
+
+class VideoRepository(_Repository):
+    """``videos`` 테이블 CRUD 저장소.
+
+    원본 영상 파일의 경로·생성 시간·메타데이터를 저장하고 조회한다.
+    """
+
     def insert(self, video: VideoFile, metadata: VideoMetadata) -> int:
         """
         영상 정보 삽입.
@@ -82,7 +135,7 @@ class VideoRepository:
                 metadata_json,
             ),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_by_id(self, video_id: int) -> sqlite3.Row | None:
@@ -177,7 +230,7 @@ class VideoRepository:
             "UPDATE videos SET device_model = ? WHERE id = ?",
             (device_model, video_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def delete_by_ids(self, video_ids: list[int]) -> int:
         """여러 영상을 ID 목록으로 일괄 삭제한다.
@@ -195,20 +248,16 @@ class VideoRepository:
             f"DELETE FROM videos WHERE id IN ({placeholders})",
             video_ids,
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount
 
 
-class TranscodingJobRepository:
+class TranscodingJobRepository(_Repository):
     """``transcoding_jobs`` 테이블 CRUD 저장소.
 
     작업 생성·상태 변경·진행률 갱신·Resume 가능 작업 조회를 제공한다.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        """초기화."""
-        self.conn = conn
-
     def create(self, video_id: int) -> int:
         """
         작업 생성.
@@ -223,7 +272,7 @@ class TranscodingJobRepository:
             "INSERT INTO transcoding_jobs (video_id) VALUES (?)",
             (video_id,),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_by_id(self, job_id: int) -> TranscodingJob | None:
@@ -265,26 +314,46 @@ class TranscodingJobRepository:
         )
         return [self._row_to_job(row) for row in cursor.fetchall()]
 
-    def update_status(self, job_id: int, status: JobStatus) -> None:
-        """상태 업데이트."""
+    def _update_returning(
+        self, job_id: int, sql: str, params: tuple[object, ...]
+    ) -> TranscodingJob | None:
+        """UPDATE 실행 후 갱신된 작업을 반환한다.
+
+        ``RETURNING`` 을 지원하면 별도 SELECT 없이 한 번의 실행으로 갱신 결과를 얻는다.
+        """
+        if not _SQLITE_HAS_RETURNING:
+            self.conn.execute(sql, params)
+            self._commit()
+            return self.get_by_id(job_id)
+        row = self.conn.execute(f"{sql} RETURNING *", params).fetchone()
+        self._commit()
+        return self._row_to_job(row) if row is not None else None
+
+    def update_status(self, job_id: int, status: JobStatus) -> TranscodingJob | None:
+        """상태 업데이트.
+
+        Returns:
+            갱신된 작업 (job_id가 없으면 None)
+        """
         now = datetime.now().isoformat()
 
         if status == JobStatus.PROCESSING:
-            self.conn.execute(
+            return self._update_returning(
+                job_id,
                 "UPDATE transcoding_jobs SET status = ?, started_at = ? WHERE id = ?",
                 (status.value, now, job_id),
             )
-        elif status == JobStatus.COMPLETED:
-            self.conn.execute(
+        if status == JobStatus.COMPLETED:
+            return self._update_returning(
+                job_id,
                 "UPDATE transcoding_jobs SET status = ?, completed_at = ? WHERE id = ?",
                 (status.value, now, job_id),
             )
-        else:
-            self.conn.execute(
-                "UPDATE transcoding_jobs SET status = ? WHERE id = ?",
-                (status.value, job_id),
-            )
-        self.conn.commit()
+        return self._update_returning(
+            job_id,
+            "UPDATE transcoding_jobs SET status = ? WHERE id = ?",
+            (status.value, job_id),
+        )
 
     def update_progress(self, job_id: int, progress: int) -> None:
         """트랜스코딩 작업 진행률을 업데이트한다.
@@ -297,12 +366,17 @@ class TranscodingJobRepository:
             "UPDATE transcoding_jobs SET progress_percent = ? WHERE id = ?",
             (progress, job_id),
         )
-        self.conn.commit()
+        self._commit()
 
-    def mark_completed(self, job_id: int, output_path: Path) -> None:
-        """완료 처리."""
+    def mark_completed(self, job_id: int, output_path: Path) -> TranscodingJob | None:
+        """완료 처리.
+
+        Returns:
+            갱신된 작업 (job_id가 없으면 None)
+        """
         now = datetime.now().isoformat()
-        self.conn.execute(
+        return self._update_returning(
+            job_id,
             """
             UPDATE transcoding_jobs
             SET status = ?, progress_percent = 100,
@@ -311,12 +385,16 @@ class TranscodingJobRepository:
             """,
             (JobStatus.COMPLETED.value, str(output_path), now, job_id),
         )
-        self.conn.commit()
 
-    def mark_failed(self, job_id: int, error_message: str) -> None:
-        """실패 처리."""
+    def mark_failed(self, job_id: int, error_message: str) -> TranscodingJob | None:
+        """실패 처리.
+
+        Returns:
+            갱신된 작업 (job_id가 없으면 None)
+        """
         now = datetime.now().isoformat()
-        self.conn.execute(
+        return self._update_returning(
+            job_id,
             """
             UPDATE transcoding_jobs
             SET status = ?, error_message = ?, completed_at = ?
@@ -324,7 +402,6 @@ class TranscodingJobRepository:
             """,
             (JobStatus.FAILED.value, error_message, now, job_id),
         )
-        self.conn.commit()
 
     def mark_merged(self, job_id: int) -> None:
         """병합 완료 후 상태 업데이트 (임시 파일 정리됨)."""
@@ -332,7 +409,7 @@ class TranscodingJobRepository:
             "UPDATE transcoding_jobs SET status = ? WHERE id = ?",
             (JobStatus.MERGED.value, job_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def delete_by_video_ids(self, video_ids: list[int]) -> int:
         """여러 영상의 트랜스코딩 작업을 video_id 목록으로 일괄 삭제한다.
@@ -350,7 +427,7 @@ class TranscodingJobRepository:
             f"DELETE FROM transcoding_jobs WHERE video_id IN ({placeholders})",
             video_ids,
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount
 
     def get_active_with_paths(self, limit: int = 10) -> list[sqlite3.Row]:
@@ -396,7 +473,7 @@ class TranscodingJobRepository:
             f"WHERE video_id IN ({placeholders}) AND status = ?",
             [JobStatus.MERGED.value, *video_ids, JobStatus.COMPLETED.value],
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount
 
     def get_stats(self, period: str | None = None) -> dict[str, object]:
@@ -475,16 +552,12 @@ class TranscodingJobRepository:
         )
 
 
-class MergeJobRepository:
+class MergeJobRepository(_Repository):
     """``merge_jobs`` 테이블 CRUD 저장소.
 
     병합 이력·YouTube 업로드 상태·요약 마크다운을 저장하고 조회한다.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        """초기화."""
-        self.conn = conn
-
     def create(
         self,
         output_path: Path,
@@ -531,7 +604,7 @@ class MergeJobRepository:
                 summary_markdown,
             ),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_by_id(self, job_id: int) -> MergeJob | None:
@@ -559,7 +632,7 @@ class MergeJobRepository:
             "UPDATE merge_jobs SET status = ? WHERE id = ?",
             (status.value, job_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_youtube_id(self, job_id: int, youtube_id: str) -> None:
         """YouTube ID 업데이트 및 상태를 completed로 변경."""
@@ -567,7 +640,7 @@ class MergeJobRepository:
             "UPDATE merge_jobs SET youtube_id = ?, status = ? WHERE id = ?",
             (youtube_id, JobStatus.COMPLETED.value, job_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def clear_youtube_id(self, job_id: int) -> None:
         """YouTube ID 초기화 (다시 업로드 가능하도록)."""
@@ -575,7 +648,7 @@ class MergeJobRepository:
             "UPDATE merge_jobs SET youtube_id = NULL WHERE id = ?",
             (job_id,),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_all(self) -> list[MergeJob]:
         """모든 병합 작업 조회."""
@@ -682,7 +755,7 @@ class MergeJobRepository:
     def delete(self, job_id: int) -> None:
         """병합 작업 삭제."""
         self.conn.execute("DELETE FROM merge_jobs WHERE id = ?", (job_id,))
-        self.conn.commit()
+        self._commit()
 
     def delete_by_output_path(self, output_path: Path) -> int:
         """출력 경로로 병합 작업 삭제. 삭제된 행 수 반환."""
@@ -690,7 +763,7 @@ class MergeJobRepository:
             "DELETE FROM merge_jobs WHERE output_path = ?",
             (str(output_path),),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount
 
     @staticmethod
@@ -712,15 +785,12 @@ class MergeJobRepository:
         )
 
 
-class SplitJobRepository:
+class SplitJobRepository(_Repository):
     """영상 분할 작업 리포지토리.
 
     ``split_jobs`` 테이블을 관리한다.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        self.conn = conn
-
     def create(
         self,
         merge_job_id: int,
@@ -741,14 +811,14 @@ class SplitJobRepository:
         Returns:
             생성된 split_job ID
         """
-        output_json = json.dumps([str(p) for p in output_files])
+        output_json = json.dumps(list(map(str, output_files)))
         cursor = self.conn.execute(
             """INSERT INTO split_jobs
                (merge_job_id, split_criterion, split_value, output_files, status)
                VALUES (?, ?, ?, ?, ?)""",
             (merge_job_id, split_criterion, split_value, output_json, status.value),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_by_id(self, job_id: int) -> SplitJob | None:
@@ -773,7 +843,7 @@ class SplitJobRepository:
             "UPDATE split_jobs SET status = ? WHERE id = ?",
             (status.value, job_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def append_youtube_id(self, job_id: int, youtube_id: str) -> None:
         """분할 작업에 YouTube 영상 ID를 추가한다.
@@ -798,17 +868,17 @@ class SplitJobRepository:
             "UPDATE split_jobs SET youtube_ids = ? WHERE id = ?",
             (json.dumps(ids), job_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def delete(self, job_id: int) -> None:
         """분할 작업 삭제."""
         self.conn.execute("DELETE FROM split_jobs WHERE id = ?", (job_id,))
-        self.conn.commit()
+        self._commit()
 
     def _row_to_job(self, row: sqlite3.Row) -> SplitJob:
         """Row를 SplitJob으로 변환."""
         try:
-            output_files = [Path(p) for p in json.loads(row["output_files"])]
+            output_files = list(map(Path, json.loads(row["output_files"])))
         except (json.JSONDecodeError, TypeError):
             logger.warning(f"Failed to parse output_files for split_job {row['id']}")
             output_files = []
@@ -829,16 +899,12 @@ class SplitJobRepository:
         )
 
 
-class ArchiveHistoryRepository:
+class ArchiveHistoryRepository(_Repository):
     """``archive_history`` 테이블 CRUD 저장소.
 
     원본 파일의 이동/삭제 이력을 조회·기록한다.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        """초기화."""
-        self.conn = conn
-
     def insert_history(
         self,
         video_id: int,
@@ -869,7 +935,7 @@ class ArchiveHistoryRepository:
                 str(destination_path) if destination_path else None,
             ),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_history_by_video(self, video_id: int) -> list[sqlite3.Row]:
@@ -960,13 +1026,9 @@ class ArchiveHistoryRepository:
         }
 
 
-class BackupHistoryRepository:
+class BackupHistoryRepository(_Repository):
     """``backup_history`` 테이블 CRUD 저장소."""
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        """초기화."""
-        self.conn = conn
-
     def insert_history(
         self,
         merge_job_id: int,
@@ -1004,7 +1066,7 @@ class BackupHistoryRepository:
                 error_message,
             ),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_by_merge_job(self, merge_job_id: int) -> list[BackupHistory]:
@@ -1050,16 +1112,12 @@ class BackupHistoryRepository:
         )
 
 
-class ProjectRepository:
+class ProjectRepository(_Repository):
     """``projects`` 및 ``project_merge_jobs`` 테이블 CRUD 저장소.
 
     프로젝트 생성·조회·수정·삭제와 프로젝트-merge_job 다대다 관계를 관리한다.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        """초기화."""
-        self.conn = conn
-
     def create(
         self,
         name: str,
@@ -1080,7 +1138,7 @@ class ProjectRepository:
                VALUES (?, ?, ?, ?)""",
             (name, description, now, now),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid or 0
 
     def get_by_id(self, project_id: int) -> Project | None:
@@ -1147,7 +1205,7 @@ class ProjectRepository:
             "UPDATE projects SET description = ?, updated_at = ? WHERE id = ?",
             (description, now, project_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_playlist_id(self, project_id: int, playlist_id: str) -> None:
         """프로젝트에 YouTube 플레이리스트 ID 저장."""
@@ -1156,12 +1214,12 @@ class ProjectRepository:
             "UPDATE projects SET playlist_id = ?, updated_at = ? WHERE id = ?",
             (playlist_id, now, project_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def delete(self, project_id: int) -> None:
         """프로젝트 삭제 (CASCADE로 project_merge_jobs도 삭제)."""
         self.conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-        self.conn.commit()
+        self._commit()
 
     def add_merge_job(self, project_id: int, merge_job_id: int) -> None:
         """프로젝트에 merge_job 연결.
@@ -1314,7 +1372,7 @@ class ProjectRepository:
                 " date_range_end = NULL, updated_at = ? WHERE id = ?",
                 (now, project_id),
             )
-        self.conn.commit()
+        self._commit()
 
     def _row_to_project(self, row: sqlite3.Row) -> Project:
         """Row를 Project로 변환."""
@@ -288,6 +288,23 @@ def _migrate_add_backup_history_table(conn: sqlite3.Connection) -> None:
     )
 
 
+# 연결별 prepared statement 캐시 크기.
+# 리포지토리의 고유 SQL 수가 기본값(128)에 근접하므로 여유 있게 잡아 재준비를 피한다.
+STATEMENT_CACHE_SIZE = 256
+
+# 연결마다 적용하는 PRAGMA.
+# WAL + synchronous=NORMAL 조합은 커밋마다 fsync하지 않고 체크포인트에서만 동기화한다.
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA foreign_keys = ON;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA mmap_size = 268435456;
+PRAGMA busy_timeout = 3000;
+"""
+
+
 def init_database(db_path: Path | None = None) -> sqlite3.Connection:
     """
     데이터베이스 초기화.
@@ -304,9 +321,9 @@ def init_database(db_path: Path | None = None) -> sqlite3.Connection:
     # 부모 디렉토리 생성 보장
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(CONNECTION_PRAGMAS)
 
     # 스키마 적용
     conn.executescript(SCHEMA)
@@ -338,8 +355,8 @@ def get_connection(db_path: Path | None = None) -> sqlite3.Connection:
     # 부모 디렉토리 생성 보장
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(CONNECTION_PRAGMAS)
 
     return conn